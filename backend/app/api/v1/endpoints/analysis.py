@@ -13,14 +13,21 @@ qualitative business assessment to produce comprehensive
 investment recommendations.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Optional
+from typing import Annotated, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response, status
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from app.core.data_loader import get_available_tickers
+from app.config import get_settings
+from app.core.data_loader import get_available_tickers_set
+from app.core.http_errors import HTTPErrorMap
+from app.core.limits import charge_rate_limit
+from app.core.metrics import CACHE_HIT, CACHE_MISS
+from app.core.response_cache import body_etag, etag_matches
+from app.core.singleflight import SingleFlight
+from app.dependencies import TickerPath
 
 from app.models.analysis import WarrenBuffettAnalysis
 from app.services.ai_analyst import (
@@ -34,10 +41,145 @@ from app.services.ai_analyst import (
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
 router = APIRouter()
 
-# Rate limiter instance for this router
-limiter = Limiter(key_func=get_remote_address)
+# Query parameters shared by all analysis endpoints
+ForceRefreshQuery = Annotated[
+    bool,
+    Query(description="Force regeneration of analysis, bypassing cache"),
+]
+
+# Service exception -> (status code, detail template)
+_ERROR_TABLE = {
+    ValuationNotFoundError: (
+        status.HTTP_404_NOT_FOUND,
+        "Valuation data not available for {ticker}: {e}",
+    ),
+    GeminiAnalysisError: (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "AI service temporarily unavailable: {e}",
+    ),
+    InvalidAnalysisError: (
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "Failed to parse analysis response: {e}",
+    ),
+    AnalysisError: (
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "Analysis generation failed: {e}",
+    ),
+}
+
+_errors = HTTPErrorMap(
+    _ERROR_TABLE,
+    unexpected=(status.HTTP_500_INTERNAL_SERVER_ERROR, "Unexpected error: {e}"),
+    context="analysis",
+    logger=logger,
+)
+
+# The refresh endpoint reports generation failures as refresh failures
+_refresh_errors = HTTPErrorMap(
+    {
+        **_ERROR_TABLE,
+        AnalysisError: (
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Analysis refresh failed: {e}",
+        ),
+    },
+    unexpected=(status.HTTP_500_INTERNAL_SERVER_ERROR, "Unexpected error: {e}"),
+    context="analysis refresh",
+    logger=logger,
+)
+
+
+# Browser caching policy for analyses served from cache
+_CACHE_CONTROL = "private, max-age=60, stale-while-revalidate=600"
+
+
+def _cached_json_response(request: Request, json_bytes: bytes) -> Response:
+    """
+    Build a conditional response for a pre-serialized cached analysis.
+
+    The ETag (body_etag) is a hash of the stored bytes, so it changes when the
+    analysis is regenerated. Clients re-polling with a matching
+    If-None-Match get an empty 304 instead of the full memo.
+
+    Args:
+        request: Incoming request (for the If-None-Match header)
+        json_bytes: Serialized analysis from the cache
+
+    Returns:
+        304 Response if the client copy is current, otherwise a JSON Response
+    """
+    etag = body_etag(json_bytes)
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Stored bytes are already validated, skip response_model
+    return Response(content=json_bytes, media_type="application/json", headers=headers)
+
+
+@functools.lru_cache(maxsize=128)
+def _exclude_none_json(json_bytes: bytes) -> bytes:
+    """
+    Re-encode a cached analysis without null fields.
+
+    Matches response_model_exclude_none for the pre-serialized body.
+    Memoized per stored body, so repeat hits of an unchanged analysis skip
+    the re-encoding.
+    """
+    analysis = WarrenBuffettAnalysis.model_validate_json(json_bytes)
+    return analysis.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+# Coalesces concurrent generation for the same (ticker, force_refresh) key
+_analysis_flight: SingleFlight[WarrenBuffettAnalysis] = SingleFlight("analysis")
+
+
+def _revalidate_in_background(ticker: str, analyst: AIAnalyst) -> None:
+    """
+    Regenerate a stale analysis without blocking the current request.
+
+    Shares the (ticker, True) single-flight key with refresh_analysis, so
+    at most one regeneration per ticker runs at a time.
+    """
+    if _analysis_flight.in_flight((ticker, True)):
+        return
+
+    task = _analysis_flight.start(
+        (ticker, True),
+        lambda: analyst.generate_analysis(ticker, force_refresh=True),
+    )
+
+    def _log_failure(done: "asyncio.Task[WarrenBuffettAnalysis]") -> None:
+        if not done.cancelled() and done.exception() is not None:
+            logger.warning(
+                "Background analysis revalidation failed for %s: %s",
+                ticker,
+                done.exception(),
+            )
+
+    task.add_done_callback(_log_failure)
+
+
+async def _get_cached_json(
+    ticker: str,
+    analyst: AIAnalyst,
+) -> Optional[Tuple[bytes, float]]:
+    """
+    Look up the cached analysis JSON for a ticker.
+
+    While a regeneration is running the valuation is recalculated first,
+    so the lookup by valuation timestamp misses until the new analysis is
+    stored. In that window the previous version is served instead.
+    """
+    cached = await analyst.get_cached_analysis_json_with_age(ticker)
+    if cached is None and _analysis_flight.in_flight((ticker, True)):
+        cached = analyst.get_latest_cached_analysis_json(ticker)
+    return cached
 
 
 @router.get(
@@ -58,12 +200,15 @@ limiter = Limiter(key_func=get_remote_address)
     **Process:**
     1. Retrieves or computes stock valuation
     2. Checks cache for existing analysis (7-day TTL)
-    3. If not cached, generates new analysis using AI
-    4. Returns the Warren Buffett-style investment memo
+    3. If the cached analysis is older than the soft TTL (5 days), returns it
+       immediately and regenerates it in the background
+    4. If not cached, generates new analysis using AI
+    5. Returns the Warren Buffett-style investment memo
 
     **Rate Limiting:**
     Analysis generation is rate-limited to prevent API abuse.
-    Cached results are returned instantly when available.
+    Cached results are returned instantly when available and do not
+    count against the limit.
 
     **Note:** First-time analysis generation may take 15-30 seconds.
     """,
@@ -72,6 +217,9 @@ limiter = Limiter(key_func=get_remote_address)
             "description": "Investment analysis generated successfully",
             "model": WarrenBuffettAnalysis,
         },
+        304: {
+            "description": "Cached analysis unchanged since the client's ETag",
+        },
         404: {
             "description": "Stock not found or valuation unavailable",
             "content": {
@@ -98,43 +246,31 @@ limiter = Limiter(key_func=get_remote_address)
         },
     },
 )
-@limiter.limit("10/minute")
 async def get_analysis(
     request: Request,
-    ticker: str = Path(
-        ...,
-        description="Stock ticker symbol (e.g., 'AAPL', 'NVDA')",
-        min_length=1,
-        max_length=10,
-        pattern=r"^[A-Za-z0-9\-\.]+$",
-        examples=["AAPL", "NVDA", "BRK-B"],
-    ),
-    force_refresh: bool = Query(
-        default=False,
-        description="Force regeneration of analysis, bypassing cache",
-    ),
+    ticker: TickerPath,
+    force_refresh: ForceRefreshQuery = False,
     analyst: AIAnalyst = Depends(get_ai_analyst),
-) -> WarrenBuffettAnalysis:
+) -> WarrenBuffettAnalysis | Response:
     """
     Get Warren Buffett-style investment analysis for a stock.
 
     Args:
+        request: Incoming request (for conditional cache headers)
         ticker: Stock ticker symbol (e.g., AAPL, MSFT)
         force_refresh: If True, regenerate analysis ignoring cache
         analyst: Injected AIAnalyst instance
 
     Returns:
-        WarrenBuffettAnalysis containing the complete investment memo
+        WarrenBuffettAnalysis containing the complete investment memo, or
+        a pre-serialized JSON Response on cache hits
 
     Raises:
         HTTPException: 404 if stock not found, 500 if generation fails,
                       503 if AI service unavailable
     """
-    ticker = ticker.upper().strip()
-
     # Validate ticker exists
-    available_tickers = get_available_tickers()
-    if ticker not in available_tickers:
+    if ticker not in get_available_tickers_set():
         logger.warning("Analysis requested for unknown ticker: %s", ticker)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -142,53 +278,40 @@ async def get_analysis(
         )
 
     try:
-        logger.info(
-            "Analysis request for %s (force_refresh=%s)",
-            ticker,
-            force_refresh,
-        )
-
-        analysis = await analyst.generate_analysis(
-            ticker,
-            force_refresh=force_refresh,
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Analysis request for %s (force_refresh=%s)",
+                ticker,
+                force_refresh,
+            )
+
+        if not force_refresh:
+            cached = await _get_cached_json(ticker, analyst)
+            if cached is not None:
+                CACHE_HIT.inc("analysis")
+                json_bytes, age = cached
+                if age >= settings.ANALYSIS_SOFT_TTL:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "Serving stale analysis for %s (age %.0fs), revalidating",
+                            ticker,
+                            age,
+                        )
+                    _revalidate_in_background(ticker, analyst)
+                return _cached_json_response(request, json_bytes)
+            CACHE_MISS.inc("analysis")
+
+        # Rate limited on generation only; cache hits cost no quota
+        await charge_rate_limit()
+        analysis = await _analysis_flight.do(
+            (ticker, force_refresh),
+            lambda: analyst.generate_analysis(ticker, force_refresh=force_refresh),
         )
 
         return analysis
 
-    except ValuationNotFoundError as e:
-        logger.error("Valuation not found for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Valuation data not available for {ticker}: {str(e)}",
-        )
-
-    except GeminiAnalysisError as e:
-        logger.error("Gemini API error for %s analysis: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"AI service temporarily unavailable: {str(e)}",
-        )
-
-    except InvalidAnalysisError as e:
-        logger.error("Invalid analysis response for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to parse analysis response: {str(e)}",
-        )
-
-    except AnalysisError as e:
-        logger.error("Analysis error for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Analysis generation failed: {str(e)}",
-        )
-
     except Exception as e:
-        logger.exception("Unexpected error generating analysis for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error: {str(e)}",
-        )
+        raise _errors.to_http(e, ticker) from e
 
 
 @router.post(
@@ -245,17 +368,8 @@ async def get_analysis(
         },
     },
 )
-@limiter.limit("3/minute")
 async def refresh_analysis(
-    request: Request,
-    ticker: str = Path(
-        ...,
-        description="Stock ticker symbol (e.g., 'AAPL', 'NVDA')",
-        min_length=1,
-        max_length=10,
-        pattern=r"^[A-Za-z0-9\-\.]+$",
-        examples=["AAPL", "NVDA", "BRK-B"],
-    ),
+    ticker: TickerPath,
     analyst: AIAnalyst = Depends(get_ai_analyst),
 ) -> WarrenBuffettAnalysis:
     """
@@ -277,11 +391,8 @@ async def refresh_analysis(
         HTTPException: 404 if stock not found, 500 if refresh fails,
                       503 if AI service unavailable
     """
-    ticker = ticker.upper().strip()
-
     # Validate ticker exists
-    available_tickers = get_available_tickers()
-    if ticker not in available_tickers:
+    if ticker not in get_available_tickers_set():
         logger.warning("Analysis refresh requested for unknown ticker: %s", ticker)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -289,63 +400,29 @@ async def refresh_analysis(
         )
 
     try:
-        logger.info("Forcing analysis refresh for %s", ticker)
-
-        # Invalidate analysis cache first
-        analyst.cache.invalidate(ticker)
-
-        # Generate with force_refresh=True to also refresh valuation
-        analysis = await analyst.generate_analysis(
-            ticker,
-            force_refresh=True,
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Forcing analysis refresh for %s", ticker)
+
+        # Generate with force_refresh=True to also refresh valuation. The
+        # previous analysis is not invalidated up front: the cache swaps to
+        # the new version once it is stored, so readers never see a gap.
+        # Concurrent refreshes of the same ticker share one generation.
+        analysis = await _analysis_flight.do(
+            (ticker, True),
+            lambda: analyst.generate_analysis(ticker, force_refresh=True),
         )
 
-        logger.info(
-            "Analysis refresh complete for %s: rating=%s",
-            ticker,
-            analysis.investment_rating.value,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Analysis refresh complete for %s: rating=%s",
+                ticker,
+                analysis.investment_rating.value,
+            )
 
         return analysis
 
-    except ValuationNotFoundError as e:
-        logger.error("Valuation not found during refresh for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Valuation data not available for {ticker}: {str(e)}",
-        )
-
-    except GeminiAnalysisError as e:
-        logger.error("Gemini API error during refresh for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"AI service temporarily unavailable: {str(e)}",
-        )
-
-    except InvalidAnalysisError as e:
-        logger.error("Invalid analysis response during refresh for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to parse analysis response: {str(e)}",
-        )
-
-    except AnalysisError as e:
-        logger.error("Analysis error during refresh for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Analysis refresh failed: {str(e)}",
-        )
-
     except Exception as e:
-        logger.exception(
-            "Unexpected error during analysis refresh for %s: %s",
-            ticker,
-            e,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error: {str(e)}",
-        )
+        raise _refresh_errors.to_http(e, ticker) from e
 
 
 @router.get(
@@ -369,6 +446,9 @@ async def refresh_analysis(
             "description": "Cached analysis found",
             "model": WarrenBuffettAnalysis,
         },
+        304: {
+            "description": "Cached analysis unchanged since the client's ETag",
+        },
         204: {
             "description": "No cached analysis available",
         },
@@ -385,49 +465,46 @@ async def refresh_analysis(
     response_model_exclude_none=True,
 )
 async def get_cached_analysis(
-    ticker: str = Path(
-        ...,
-        description="Stock ticker symbol (e.g., 'AAPL', 'NVDA')",
-        min_length=1,
-        max_length=10,
-        pattern=r"^[A-Za-z0-9\-\.]+$",
-        examples=["AAPL", "NVDA", "BRK-B"],
-    ),
+    request: Request,
+    ticker: TickerPath,
     analyst: AIAnalyst = Depends(get_ai_analyst),
 ) -> WarrenBuffettAnalysis | Response:
     """
     Get cached analysis only, without triggering generation.
 
     Args:
+        request: Incoming request (for conditional cache headers)
         ticker: Stock ticker symbol (e.g., AAPL, MSFT)
         analyst: Injected AIAnalyst instance
 
     Returns:
-        WarrenBuffettAnalysis if cached, 204 Response if not available
+        Pre-serialized JSON Response if cached, 204 Response if not available
 
     Raises:
         HTTPException: 404 if stock ticker is not recognized
     """
-    ticker = ticker.upper().strip()
+    # Probe the cache first: entries are only written for known tickers
+    # under their canonical key, so a hit needs no ticker validation
+    try:
+        cached = await _get_cached_json(ticker, analyst)
+    except Exception as e:
+        logger.warning("Error checking cached analysis for %s: %s", ticker, e)
+        cached = None
+
+    if cached is not None:
+        CACHE_HIT.inc("analysis_cached")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Returning cached analysis for %s", ticker)
+        return _cached_json_response(request, _exclude_none_json(cached[0]))
 
     # Validate ticker exists
-    available_tickers = get_available_tickers()
-    if ticker not in available_tickers:
+    if ticker not in get_available_tickers_set():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Stock not found: {ticker}",
         )
 
-    try:
-        cached = await analyst.get_cached_analysis(ticker)
-
-        if cached is not None:
-            logger.debug("Returning cached analysis for %s", ticker)
-            return cached
-
+    CACHE_MISS.inc("analysis_cached")
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug("No cached analysis for %s", ticker)
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
-
-    except Exception as e:
-        logger.warning("Error checking cached analysis for %s: %s", ticker, e)
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -7,13 +7,18 @@ from raw stock JSON data using Google Gemini AI.
 Endpoints:
     GET /{ticker}/extraction - Get standardized valuation input for a stock
     POST /{ticker}/extraction/refresh - Force refresh extraction (bypass cache)
+    POST /extraction/batch - Force refresh extraction for several stocks
 """
 
+import asyncio
 import logging
-from typing import Annotated
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, Query, status
+from pydantic import BaseModel, Field
 
+from app.core.http_errors import HTTPErrorMap
+from app.dependencies import TickerItem, TickerPath
 from app.models.valuation_input import StandardizedValuationInput
 from app.services.ai_extractor import (
     AIExtractor,
@@ -21,13 +26,97 @@ from app.services.ai_extractor import (
     ExtractionError,
     GeminiAPIError,
     InvalidResponseError,
-    get_ai_extractor,
+    get_ai_extractor_dep,
 )
+from app.services.batch_refresher import BatchRefresher, get_batch_refresher_dep
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Query parameters shared by the extraction endpoints
+RefreshQuery = Annotated[
+    bool,
+    Query(description="Force refresh extraction (bypass cache)"),
+]
+
+# Upper bound on operations accepted by a single batch request
+MAX_BATCH_OPERATIONS = 50
+
+
+class BatchExtractionOperation(BaseModel):
+    """Single ticker refresh within a batch extraction request."""
+
+    ticker: TickerItem = Field(
+        ...,
+        description="Stock ticker symbol (case-insensitive)",
+        examples=["AAPL"],
+    )
+
+
+class BatchExtractionRequest(BaseModel):
+    """Request body for batch extraction refresh."""
+
+    operations: List[BatchExtractionOperation] = Field(
+        ...,
+        description="Tickers to refresh",
+        min_length=1,
+        max_length=MAX_BATCH_OPERATIONS,
+    )
+
+
+class BatchExtractionResult(BaseModel):
+    """Per-ticker outcome of a batch extraction refresh."""
+
+    ticker: str = Field(..., description="Normalized ticker symbol")
+    status: int = Field(..., description="HTTP status code for this operation")
+    data: Optional[StandardizedValuationInput] = Field(
+        None,
+        description="Extracted data if the operation succeeded",
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Error detail if the operation failed",
+    )
+
+
+class BatchExtractionResponse(BaseModel):
+    """Response body for batch extraction refresh."""
+
+    results: List[BatchExtractionResult] = Field(
+        ...,
+        description="Results in the same order as the requested operations",
+    )
+
+
+# Service exception -> (status code, detail template)
+_errors = HTTPErrorMap(
+    {
+        DataNotFoundError: (
+            status.HTTP_404_NOT_FOUND,
+            "Stock data file not found for {ticker}",
+        ),
+        GeminiAPIError: (
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            "Gemini API unavailable. Please try again later.",
+        ),
+        InvalidResponseError: (
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Failed to process AI response. Please try again.",
+        ),
+        ExtractionError: (
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Data extraction failed. Please try again later.",
+        ),
+    },
+    unexpected=(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "An unexpected error occurred. Please try again later.",
+    ),
+    context="extraction",
+    logger=logger,
+)
+
 
 @router.get(
     "/{ticker}/extraction",
@@ -82,22 +171,10 @@ router = APIRouter()
     },
 )
 async def get_extraction(
-    ticker: Annotated[
-        str,
-        Path(
-            description="Stock ticker symbol (e.g., AAPL, MSFT, GOOGL)",
-            min_length=1,
-            max_length=10,
-            examples=["AAPL", "MSFT", "GOOGL"],
-        ),
-    ],
-    refresh: Annotated[
-        bool,
-        Query(
-            description="Force refresh extraction (bypass cache)",
-        ),
-    ] = False,
-    extractor: AIExtractor = Depends(get_ai_extractor),
+    ticker: TickerPath,
+    refresh: RefreshQuery = False,
+    extractor: AIExtractor = Depends(get_ai_extractor_dep),
+    refresher: BatchRefresher = Depends(get_batch_refresher_dep),
 ) -> StandardizedValuationInput:
     """
     Get standardized valuation input for a stock.
@@ -109,6 +186,7 @@ async def get_extraction(
         ticker: Stock ticker symbol (case-insensitive)
         refresh: If True, bypass cache and force new extraction
         extractor: AI extractor service (injected)
+        refresher: Refresh coalescing service used when refresh is set (injected)
 
     Returns:
         StandardizedValuationInput with extracted data
@@ -116,61 +194,30 @@ async def get_extraction(
     Raises:
         HTTPException: 404 if stock not found, 500/503 on extraction failure
     """
-    ticker = ticker.upper().strip()
-    logger.info(
-        "Extraction request for %s (refresh=%s)",
-        ticker,
-        refresh,
-    )
-
-    try:
-        result = await extractor.extract_valuation_input(
-            ticker=ticker,
-            force_refresh=refresh,
-        )
-
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
-            "Extraction successful for %s (confidence: %.2f)",
+            "Extraction request for %s (refresh=%s)",
             ticker,
-            result.data_confidence_score,
+            refresh,
         )
 
-        return result
+    try:
+        if refresh:
+            result = await refresher.refresh_ticker(ticker)
+        else:
+            result = await extractor.extract_valuation_input(ticker=ticker)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Extraction successful for %s (confidence: %.2f)",
+                ticker,
+                result.data_confidence_score,
+            )
 
-    except DataNotFoundError as e:
-        logger.warning("Stock data not found: %s", ticker)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Stock data file not found for {ticker}",
-        ) from e
-
-    except GeminiAPIError as e:
-        logger.error("Gemini API error for %s: %s", ticker, str(e))
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Gemini API unavailable. Please try again later.",
-        ) from e
-
-    except InvalidResponseError as e:
-        logger.error("Invalid AI response for %s: %s", ticker, str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to process AI response. Please try again.",
-        ) from e
-
-    except ExtractionError as e:
-        logger.error("Extraction error for %s: %s", ticker, str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Data extraction failed. Please try again later.",
-        ) from e
+        return result
 
     except Exception as e:
-        logger.exception("Unexpected error during extraction for %s", ticker)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred. Please try again later.",
-        ) from e
+        raise _errors.to_http(e, ticker) from e
 
 
 @router.post(
@@ -197,25 +244,18 @@ async def get_extraction(
     },
 )
 async def refresh_extraction(
-    ticker: Annotated[
-        str,
-        Path(
-            description="Stock ticker symbol",
-            min_length=1,
-            max_length=10,
-            examples=["AAPL", "MSFT", "GOOGL"],
-        ),
-    ],
-    extractor: AIExtractor = Depends(get_ai_extractor),
+    ticker: TickerPath,
+    refresher: BatchRefresher = Depends(get_batch_refresher_dep),
 ) -> StandardizedValuationInput:
     """
     Force refresh extraction for a stock.
 
     This endpoint always bypasses the cache and performs a fresh extraction.
+    Concurrent refreshes of the same ticker share one extraction.
 
     Args:
         ticker: Stock ticker symbol (case-insensitive)
-        extractor: AI extractor service (injected)
+        refresher: Refresh coalescing service (injected)
 
     Returns:
         StandardizedValuationInput with freshly extracted data
@@ -223,54 +263,83 @@ async def refresh_extraction(
     Raises:
         HTTPException: 404 if stock not found, 500/503 on extraction failure
     """
-    ticker = ticker.upper().strip()
-    logger.info("Force refresh extraction request for %s", ticker)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Force refresh extraction request for %s", ticker)
 
     try:
-        result = await extractor.extract_valuation_input(
-            ticker=ticker,
-            force_refresh=True,
-        )
+        result = await refresher.refresh_ticker(ticker)
 
-        logger.info(
-            "Refresh extraction successful for %s (confidence: %.2f)",
-            ticker,
-            result.data_confidence_score,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Refresh extraction successful for %s (confidence: %.2f)",
+                ticker,
+                result.data_confidence_score,
+            )
 
         return result
 
-    except DataNotFoundError as e:
-        logger.warning("Stock data not found: %s", ticker)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Stock data file not found for {ticker}",
-        ) from e
-
-    except GeminiAPIError as e:
-        logger.error("Gemini API error for %s: %s", ticker, str(e))
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Gemini API unavailable. Please try again later.",
-        ) from e
-
-    except InvalidResponseError as e:
-        logger.error("Invalid AI response for %s: %s", ticker, str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to process AI response. Please try again.",
-        ) from e
-
-    except ExtractionError as e:
-        logger.error("Extraction error for %s: %s", ticker, str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Data extraction failed. Please try again later.",
-        ) from e
-
     except Exception as e:
-        logger.exception("Unexpected error during extraction for %s", ticker)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred. Please try again later.",
-        ) from e
+        raise _errors.to_http(e, ticker) from e
+
+
+@router.post(
+    "/extraction/batch",
+    response_model=BatchExtractionResponse,
+    summary="Batch refresh extraction",
+    description=f"""
+    Force fresh extractions for several stocks in one request.
+
+    Operations run concurrently and duplicate tickers share one
+    extraction (each ticker is still its own AI request). Each operation gets its own status code in
+    the response; a failing ticker does not fail the whole batch.
+
+    At most {MAX_BATCH_OPERATIONS} operations are accepted per request.
+    """,
+    responses={
+        200: {
+            "description": "Batch processed (see per-operation status)",
+            "model": BatchExtractionResponse,
+        },
+        422: {"description": "Invalid request body"},
+    },
+)
+async def batch_refresh_extraction(
+    body: BatchExtractionRequest,
+    refresher: BatchRefresher = Depends(get_batch_refresher_dep),
+) -> BatchExtractionResponse:
+    """
+    Force refresh extraction for several stocks.
+
+    Args:
+        body: Batch request with the tickers to refresh
+        refresher: Refresh coalescing service (injected)
+
+    Returns:
+        BatchExtractionResponse with one result per requested operation
+    """
+    tickers = [op.ticker for op in body.operations]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Batch refresh extraction request for %d tickers", len(tickers))
+
+    outcomes = await asyncio.gather(
+        *(refresher.refresh_ticker(ticker) for ticker in tickers),
+        return_exceptions=True,
+    )
+
+    results: List[BatchExtractionResult] = []
+    for ticker, outcome in zip(tickers, outcomes):
+        if isinstance(outcome, Exception):
+            error = _errors.to_http(outcome, ticker)
+            results.append(
+                BatchExtractionResult(
+                    ticker=ticker,
+                    status=error.status_code,
+                    error=error.detail,
+                )
+            )
+        else:
+            results.append(
+                BatchExtractionResult(ticker=ticker, status=status.HTTP_200_OK, data=outcome)
+            )
+
+    return BatchExtractionResponse(results=results)
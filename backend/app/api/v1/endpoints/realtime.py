@@ -3,16 +3,25 @@ Real-time stock data API endpoints.
 
 Provides endpoints for:
 - GET /{ticker}/price - Get real-time price data
+- POST /prices/batch - Get real-time price data for several stocks
 - GET /{ticker}/history - Get historical OHLCV data
+- GET /{ticker}/history.ndjson - Stream historical OHLCV data as ND-JSON
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, Iterator, List, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, Path, Query
+import orjson
+import pyarrow as pa
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.core.response_cache import cached_response
+from app.dependencies import TickerItem, TickerPath
 from app.services.realtime_service import (
+    HISTORY_CACHE_TTLS,
     DataFetchError,
     TickerNotFoundError,
     get_historical_data,
@@ -106,6 +115,62 @@ class MarketStatusResponse(BaseModel):
     timestamp: str = Field(..., description="Check timestamp in ISO format")
 
 
+# Upper bound on tickers accepted by a single batch price request
+MAX_BATCH_PRICES = 50
+
+
+class BatchPriceRequest(BaseModel):
+    """Request body for batch price lookup."""
+
+    tickers: List[TickerItem] = Field(
+        ...,
+        description="Stock ticker symbols (case-insensitive)",
+        min_length=1,
+        max_length=MAX_BATCH_PRICES,
+        examples=[["AAPL", "MSFT", "NVDA"]],
+    )
+
+
+class BatchPriceResult(BaseModel):
+    """Per-ticker outcome of a batch price lookup."""
+
+    ticker: str = Field(..., description="Normalized ticker symbol")
+    status: int = Field(..., description="HTTP status code for this ticker")
+    data: Optional[PriceResponse] = Field(
+        None,
+        description="Price data if the lookup succeeded",
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Error detail if the lookup failed",
+    )
+
+
+class BatchPriceResponse(BaseModel):
+    """Response body for batch price lookup."""
+
+    results: List[BatchPriceResult] = Field(
+        ...,
+        description="Results in the same order as the requested tickers",
+    )
+
+
+# OHLCV bars encoded per chunk of a streamed history response
+STREAM_CHUNK_SIZE = 500
+
+# Content type that selects Arrow IPC history responses
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Arrow column types for OHLCV history
+_ARROW_HISTORY_COLUMNS = (
+    ("time", pa.int64()),
+    ("open", pa.float64()),
+    ("high", pa.float64()),
+    ("low", pa.float64()),
+    ("close", pa.float64()),
+    ("volume", pa.int64()),
+)
+
 # Type for period parameter
 PeriodType = Literal["1mo", "3mo", "6mo", "1y", "5y"]
 
@@ -155,13 +220,7 @@ PeriodType = Literal["1mo", "3mo", "6mo", "1y", "5y"]
     },
 )
 async def get_stock_price(
-    ticker: str = Path(
-        ...,
-        description="Stock ticker symbol (e.g., 'AAPL', 'NVDA')",
-        min_length=1,
-        max_length=10,
-        examples=["AAPL", "NVDA", "MSFT", "GOOGL"],
-    ),
+    ticker: TickerPath,
 ) -> PriceResponse:
     """
     Get real-time price data for a specific stock.
@@ -186,7 +245,9 @@ async def get_stock_price(
     """
     try:
         price_data = await get_realtime_price(ticker)
-        return PriceResponse(**price_data)
+        # Trust boundary: the service builds price_data with exactly the
+        # PriceResponse fields and types, so skip re-validation
+        return PriceResponse.model_construct(**price_data)
 
     except TickerNotFoundError as e:
         logger.warning("Ticker not found: %s", ticker)
@@ -204,9 +265,76 @@ async def get_stock_price(
         )
 
 
+@router.post(
+    "/prices/batch",
+    response_model=BatchPriceResponse,
+    summary="Get Real-Time Prices (Batch)",
+    description=(
+        "Retrieve real-time price data for several stocks in one request. "
+        "Each ticker gets its own status code; a failing ticker does not fail "
+        f"the whole batch. At most {MAX_BATCH_PRICES} tickers per request."
+    ),
+    responses={
+        200: {"description": "Batch processed (see per-ticker status)"},
+        422: {"description": "Invalid request body"},
+    },
+)
+async def get_stock_prices(body: BatchPriceRequest) -> BatchPriceResponse:
+    """
+    Get real-time price data for several stocks concurrently.
+
+    Duplicate tickers are fetched once, and each fetch goes through the same
+    30-second cache as GET /{ticker}/price.
+
+    Args:
+        body: Batch request with the tickers to look up.
+
+    Returns:
+        BatchPriceResponse with one result per requested ticker.
+    """
+    tickers = body.tickers
+    unique_tickers = list(dict.fromkeys(tickers))
+
+    outcomes = await asyncio.gather(
+        *(get_realtime_price(ticker) for ticker in unique_tickers),
+        return_exceptions=True,
+    )
+    by_ticker = dict(zip(unique_tickers, outcomes))
+
+    results: List[BatchPriceResult] = []
+    for ticker in tickers:
+        outcome = by_ticker[ticker]
+        if isinstance(outcome, TickerNotFoundError):
+            logger.warning("Ticker not found: %s", ticker)
+            results.append(BatchPriceResult(ticker=ticker, status=404, error=str(outcome)))
+        elif isinstance(outcome, DataFetchError):
+            logger.error("Data fetch error for %s: %s", ticker, outcome)
+            results.append(BatchPriceResult(ticker=ticker, status=500, error=str(outcome)))
+        elif isinstance(outcome, BaseException):
+            logger.error("Unexpected error fetching price for %s: %s", ticker, outcome)
+            results.append(
+                BatchPriceResult(
+                    ticker=ticker,
+                    status=500,
+                    error="An unexpected error occurred while fetching price data",
+                )
+            )
+        else:
+            results.append(
+                BatchPriceResult(
+                    ticker=ticker,
+                    status=200,
+                    data=PriceResponse.model_construct(**outcome),
+                )
+            )
+
+    return BatchPriceResponse(results=results)
+
+
 @router.get(
     "/{ticker}/history",
     response_model=List[OHLCVDataPoint],
+    response_class=ORJSONResponse,
     summary="Get Historical OHLCV Data",
     description="Retrieve historical OHLCV (Open, High, Low, Close, Volume) data for a stock.",
     responses={
@@ -232,7 +360,8 @@ async def get_stock_price(
                             "volume": 42156000,
                         },
                     ]
-                }
+                },
+                ARROW_STREAM_MEDIA_TYPE: {},
             },
         },
         400: {
@@ -264,19 +393,14 @@ async def get_stock_price(
     },
 )
 async def get_stock_history(
-    ticker: str = Path(
-        ...,
-        description="Stock ticker symbol (e.g., 'AAPL', 'NVDA')",
-        min_length=1,
-        max_length=10,
-        examples=["AAPL", "NVDA", "MSFT", "GOOGL"],
-    ),
+    request: Request,
+    ticker: TickerPath,
     period: PeriodType = Query(
         default="1y",
         description="Time period for historical data",
         examples=["1mo", "3mo", "6mo", "1y", "5y"],
     ),
-) -> List[OHLCVDataPoint]:
+) -> Response:
     """
     Get historical OHLCV data for a specific stock.
 
@@ -284,27 +408,155 @@ async def get_stock_history(
     - Daily data for periods up to 1 year
     - Weekly data for 5-year period
 
-    Data is cached with TTL based on the period:
+    Data (and the serialized response) is cached with TTL based on the period:
     - 1mo, 3mo: 30 seconds
     - 6mo, 1y: 5 minutes
     - 5y: 1 hour
 
+    Clients sending "Accept: application/vnd.apache.arrow.stream" get the
+    bars as an Arrow IPC stream (int64 time/volume, float64 prices) instead
+    of JSON.
+
     Args:
+        request: Incoming request (for Accept negotiation).
         ticker: Stock ticker symbol (case-insensitive).
         period: Time period for historical data.
             Options: "1mo", "3mo", "6mo", "1y", "5y"
 
     Returns:
-        List of OHLCVDataPoint objects with historical price data.
+        Response with the OHLCV points (OHLCVDataPoint shape) as JSON or Arrow.
 
     Raises:
         HTTPException 400: If the period is invalid.
         HTTPException 404: If the ticker is not found.
         HTTPException 500: If there's an error fetching data.
     """
+    if ARROW_STREAM_MEDIA_TYPE in request.headers.get("accept", ""):
+        response = await _history_arrow(ticker=ticker, period=period)
+    else:
+        response = await _history_json(ticker=ticker, period=period)
+
+    response.headers["Vary"] = "Accept"
+    return response
+
+
+@cached_response(
+    expire=lambda kwargs: HISTORY_CACHE_TTLS.get(kwargs["period"], 300),
+    namespace="history",
+)
+async def _history_json(ticker: str, period: PeriodType) -> List[Dict[str, Any]]:
+    """Historical data serialized as a JSON array."""
+    # The service already returns points in OHLCVDataPoint shape; they are
+    # serialized straight to bytes without building a model per bar
+    return await _fetch_history(ticker, period)
+
+
+def _encode_arrow(points: List[Dict[str, Any]]) -> bytes:
+    """
+    Encode OHLCV points as an Arrow IPC stream.
+
+    Args:
+        points: OHLCV points in OHLCVDataPoint shape.
+
+    Returns:
+        Arrow IPC stream bytes with one column per OHLCV field.
+    """
+    table = pa.table(
+        {
+            name: pa.array([point[name] for point in points], type=arrow_type)
+            for name, arrow_type in _ARROW_HISTORY_COLUMNS
+        }
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+@cached_response(
+    expire=lambda kwargs: HISTORY_CACHE_TTLS.get(kwargs["period"], 300),
+    namespace="history_arrow",
+    media_type=ARROW_STREAM_MEDIA_TYPE,
+    serialize=_encode_arrow,
+)
+async def _history_arrow(ticker: str, period: PeriodType) -> List[Dict[str, Any]]:
+    """Historical data serialized as an Arrow IPC stream."""
+    return await _fetch_history(ticker, period)
+
+
+@router.get(
+    "/{ticker}/history.ndjson",
+    response_class=StreamingResponse,
+    summary="Stream Historical OHLCV Data (ND-JSON)",
+    description=(
+        "Stream historical OHLCV data as newline-delimited JSON, one bar per "
+        "line, for chart clients that consume rows incrementally."
+    ),
+    responses={
+        200: {
+            "description": "Historical data stream",
+            "content": {"application/x-ndjson": {}},
+        },
+        400: {"description": "Invalid period parameter"},
+        404: {"description": "Ticker not found"},
+        500: {"description": "Internal server error"},
+    },
+)
+async def stream_stock_history(
+    ticker: TickerPath,
+    period: PeriodType = Query(
+        default="1y",
+        description="Time period for historical data",
+        examples=["1mo", "3mo", "6mo", "1y", "5y"],
+    ),
+) -> StreamingResponse:
+    """
+    Stream historical OHLCV data for a specific stock as ND-JSON.
+
+    Uses the same data and cache as GET /{ticker}/history, but encodes and
+    sends the bars in chunks, so the first rows reach the client before the
+    whole series is serialized.
+
+    Args:
+        ticker: Stock ticker symbol (case-insensitive).
+        period: Time period for historical data.
+
+    Returns:
+        StreamingResponse with one OHLCV JSON object per line.
+
+    Raises:
+        HTTPException 400: If the period is invalid.
+        HTTPException 404: If the ticker is not found.
+        HTTPException 500: If there's an error fetching data.
+    """
+    # Fetch before streaming so errors still map to HTTP status codes
+    points = await _fetch_history(ticker, period)
+
+    def encode_chunks() -> Iterator[bytes]:
+        for start in range(0, len(points), STREAM_CHUNK_SIZE):
+            chunk = points[start:start + STREAM_CHUNK_SIZE]
+            yield b"".join(orjson.dumps(point) + b"\n" for point in chunk)
+
+    return StreamingResponse(encode_chunks(), media_type="application/x-ndjson")
+
+
+async def _fetch_history(ticker: str, period: PeriodType) -> List[Dict[str, Any]]:
+    """
+    Fetch historical data, mapping service errors to HTTP errors.
+
+    Args:
+        ticker: Stock ticker symbol (case-insensitive).
+        period: Time period for historical data.
+
+    Returns:
+        List of OHLCV points.
+
+    Raises:
+        HTTPException: 400 for an invalid period, 404 for an unknown ticker,
+            500 on fetch errors.
+    """
     try:
-        historical_data = await get_historical_data(ticker, period)
-        return [OHLCVDataPoint(**point) for point in historical_data]
+        return await get_historical_data(ticker, period)
 
     except ValueError as e:
         logger.warning("Invalid period for %s: %s", ticker, period)
@@ -346,10 +598,13 @@ async def get_stock_history(
         },
     },
 )
+@cached_response(expire=30, namespace="market_status")
 async def get_market_status() -> MarketStatusResponse:
     """
     Check the current US stock market status.
 
+    Responses are cached for 30 seconds.
+
     Returns the current market state:
     - PRE: Pre-market trading (4:00 AM - 9:30 AM ET)
     - REGULAR: Regular trading hours (9:30 AM - 4:00 PM ET)
@@ -360,4 +615,5 @@ async def get_market_status() -> MarketStatusResponse:
         MarketStatusResponse with current market state.
     """
     status = await is_market_open()
-    return MarketStatusResponse(**status)
+    # Trust boundary: is_market_open() returns the MarketStatusResponse fields
+    return MarketStatusResponse.model_construct(**status)
@@ -6,22 +6,29 @@ Provides endpoints for:
 - GET /stocks/metadata - Get available columns, sectors, industries
 """
 
+import asyncio
 import logging
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
+import numpy as np
+import pandas as pd
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter, ValidationError
 
 logger = logging.getLogger(__name__)
 
 from app.core.data_loader import (
     DataLoadError,
     get_column_names,
+    get_summary_df,
     get_unique_industries,
     get_unique_sectors,
-    load_summary_csv,
     get_available_tickers,
+    summary_csv_version,
 )
+from app.core.response_cache import cached_response
 from app.models.stock import (
     StockListResponse,
     StockMetadataResponse,
@@ -30,6 +37,181 @@ from app.models.stock import (
 
 router = APIRouter()
 
+# Validates all CSV rows in one call into pydantic-core
+_STOCK_LIST_ADAPTER = TypeAdapter(List[StockSummary])
+
+# Pydantic field name -> CSV column name (aliases such as 52_week_high)
+_FIELD_COLUMNS: Dict[str, str] = {
+    name: field.alias or name for name, field in StockSummary.model_fields.items()
+}
+
+
+class _SummaryTable(NamedTuple):
+    """
+    Validated screener rows for one version of summary.csv.
+
+    Row i of df corresponds to stocks[i]; rows that failed validation are
+    dropped from both. The lower-cased ticker/name columns back the
+    case-insensitive search, sector and industry are pre-factorized into
+    integer codes of their lower-cased values, and sort_orders memoizes
+    the row order for each (column, ascending) pair requested so far.
+    """
+
+    df: pd.DataFrame
+    stocks: List[StockSummary]
+    columns: List[str]
+    ticker_lower: pd.Series
+    company_name_lower: pd.Series
+    sector_codes: np.ndarray
+    sector_index: Dict[str, int]
+    industry_codes: np.ndarray
+    industry_index: Dict[str, int]
+    sort_orders: Dict[Tuple[str, bool], np.ndarray]
+
+
+# (source DataFrame, table built from it); rebuilt when the CSV changes
+_summary_table: Optional[Tuple[pd.DataFrame, _SummaryTable]] = None
+
+
+def _csv_version_key(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Key a response on the endpoint arguments and the summary.csv version.
+
+    A rewritten CSV changes the key, so cached bodies never outlive the
+    data they were built from. A missing CSV keys on None; the handler
+    then reports the load error.
+    """
+    try:
+        version: Optional[Tuple[int, int]] = summary_csv_version()
+    except DataLoadError:
+        version = None
+    return {**kwargs, "csv_version": version}
+
+
+# Bound on cached stock list responses: the key includes the free-text
+# search, so distinct queries are capped here rather than crowding out
+# other endpoints' entries
+_STOCKS_CACHE_ENTRIES = 64
+
+
+def _lower(df: pd.DataFrame, column: str) -> pd.Series:
+    """Stripped, lower-cased string column (NaN for missing values)."""
+    if column not in df.columns:
+        return pd.Series(np.nan, index=df.index, dtype=object)
+    return df[column].astype(object).where(df[column].notna()).str.strip().str.lower()
+
+
+def _lower_codes(df: pd.DataFrame, column: str) -> Tuple[np.ndarray, Dict[str, int]]:
+    """
+    Factorize a lower-cased string column for equality filtering.
+
+    Returns:
+        Tuple of (integer code per row, -1 for missing; lower-cased value -> code).
+    """
+    codes, uniques = pd.factorize(_lower(df, column))
+    return codes, {value: code for code, value in enumerate(uniques)}
+
+
+def _validate_rows(records: List[Dict[str, Any]]) -> Tuple[List[StockSummary], List[int]]:
+    """
+    Validate CSV rows into StockSummary models in one pass.
+
+    All rows go through a single list validator. If some rows are invalid,
+    they are identified from the error locations, logged and skipped, and
+    the remaining rows are validated again.
+
+    Args:
+        records: Raw CSV rows
+
+    Returns:
+        Tuple of (valid models, positions of those rows in records).
+    """
+    try:
+        return _STOCK_LIST_ADAPTER.validate_python(records), list(range(len(records)))
+    except ValidationError as e:
+        errors: Dict[int, str] = {}
+        for error in e.errors(include_url=False):
+            errors.setdefault(error["loc"][0], error["msg"])
+
+    for position, message in errors.items():
+        # Log validation errors for debugging
+        ticker = records[position].get("ticker") or "unknown"
+        logger.warning("Skipping invalid stock row (ticker=%s): %s", ticker, message[:100])
+
+    positions = [i for i in range(len(records)) if i not in errors]
+    stocks = _STOCK_LIST_ADAPTER.validate_python([records[i] for i in positions])
+    return stocks, positions
+
+
+def _get_summary_table() -> _SummaryTable:
+    """
+    Get screener rows validated once per summary.csv version.
+
+    Returns:
+        _SummaryTable for the current CSV contents.
+
+    Raises:
+        DataLoadError: If the CSV file cannot be loaded.
+    """
+    global _summary_table
+
+    source = get_summary_df()
+    if _summary_table is not None and _summary_table[0] is source:
+        return _summary_table[1]
+
+    records = source.astype(object).where(source.notna(), None).to_dict(orient="records")
+
+    stocks, positions = _validate_rows(records)
+
+    skipped_count = len(records) - len(stocks)
+    if skipped_count > 0:
+        logger.info("Loaded %d stocks, skipped %d invalid rows", len(stocks), skipped_count)
+
+    df = source.iloc[positions].reset_index(drop=True)
+    sector_codes, sector_index = _lower_codes(df, "sector")
+    industry_codes, industry_index = _lower_codes(df, "industry")
+    table = _SummaryTable(
+        df=df,
+        stocks=stocks,
+        columns=source.columns.tolist(),
+        ticker_lower=_lower(df, "ticker"),
+        company_name_lower=_lower(df, "company_name"),
+        sector_codes=sector_codes,
+        sector_index=sector_index,
+        industry_codes=industry_codes,
+        industry_index=industry_index,
+        sort_orders={},
+    )
+    _summary_table = (source, table)
+    return table
+
+
+def _sort_order(table: _SummaryTable, column: str, ascending: bool) -> np.ndarray:
+    """
+    Get the row positions of table.df sorted by a column (missing values last).
+
+    The order is computed on first use and reused until the CSV changes, so
+    a sorted request only has to drop filtered-out rows from it.
+
+    Args:
+        table: Screener table to sort
+        column: CSV column name present in table.df
+        ascending: Sort direction
+
+    Returns:
+        Array of row positions in sorted order.
+    """
+    key = (column, ascending)
+    order = table.sort_orders.get(key)
+    if order is None:
+        order = (
+            table.df[column]
+            .sort_values(ascending=ascending, na_position="last", kind="stable")
+            .index.to_numpy()
+        )
+        table.sort_orders[key] = order
+    return order
+
 
 class SortOrder(str, Enum):
     """Sort order enumeration."""
@@ -38,11 +220,119 @@ class SortOrder(str, Enum):
     desc = "desc"
 
 
+def _compute_stocks(
+    sort_by: Optional[str],
+    sort_order: SortOrder,
+    sector: Optional[str],
+    industry: Optional[str],
+    search: Optional[str],
+    min_market_cap: Optional[float],
+    max_market_cap: Optional[float],
+    min_pe: Optional[float],
+    max_pe: Optional[float],
+) -> StockListResponse:
+    """
+    Load, filter and sort the screener rows (blocking; run in a worker thread).
+
+    Args:
+        sort_by: Column name to sort by.
+        sort_order: Sort direction ('asc' or 'desc').
+        sector: Filter by sector.
+        industry: Filter by industry.
+        search: Search term for ticker or company name.
+        min_market_cap: Minimum market cap filter.
+        max_market_cap: Maximum market cap filter.
+        min_pe: Minimum P/E ratio filter.
+        max_pe: Maximum P/E ratio filter.
+
+    Returns:
+        StockListResponse with filtered/sorted stocks.
+
+    Raises:
+        HTTPException: If data cannot be loaded or invalid sort column.
+    """
+    try:
+        table = _get_summary_table()
+    except DataLoadError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    df = table.df
+    mask = np.ones(len(df), dtype=bool)
+
+    # Sector filter (unknown values match no row)
+    if sector:
+        mask &= table.sector_codes == table.sector_index.get(sector.lower(), -2)
+
+    # Industry filter
+    if industry:
+        mask &= table.industry_codes == table.industry_index.get(industry.lower(), -2)
+
+    # Search filter (ticker or company name)
+    if search:
+        search_lower = search.lower()
+        mask &= (
+            table.ticker_lower.str.contains(search_lower, regex=False).fillna(False)
+            | table.company_name_lower.str.contains(search_lower, regex=False).fillna(False)
+        ).to_numpy(dtype=bool)
+
+    # Market cap and P/E range filters (NaN never matches, like None)
+    for column, bound, compare in (
+        ("market_cap", min_market_cap, np.greater_equal),
+        ("market_cap", max_market_cap, np.less_equal),
+        ("pe_trailing", min_pe, np.greater_equal),
+        ("pe_trailing", max_pe, np.less_equal),
+    ):
+        if bound is None:
+            continue
+        if column not in df.columns:
+            mask[:] = False
+            break
+        values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+        mask &= compare(values, bound)
+
+    rows = np.flatnonzero(mask)
+
+    # Apply sorting
+    if sort_by:
+        # Validate sort column exists (CSV column or Pydantic field name)
+        valid_columns = list(table.columns)
+        if sort_by not in valid_columns and sort_by not in _FIELD_COLUMNS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid sort column: {sort_by}. Valid columns: {valid_columns[:10]}...",
+            )
+
+        # Map Pydantic field names to CSV column names (e.g. 52_week_high)
+        sort_column = _FIELD_COLUMNS.get(sort_by, sort_by)
+        if sort_column in df.columns:
+            order = _sort_order(table, sort_column, sort_order == SortOrder.asc)
+            rows = order[mask[order]]
+
+    stocks = [table.stocks[i] for i in rows]
+
+    return StockListResponse(
+        stocks=stocks,
+        total=len(stocks),
+        columns=list(table.columns),
+    )
+
+
 @router.get(
     "",
     response_model=StockListResponse,
+    response_class=ORJSONResponse,
     summary="List All Stocks",
-    description="Retrieve all stocks with optional filtering and sorting.",
+    description=(
+        "Retrieve all stocks with optional filtering and sorting. "
+        "Stocks missing the sort column's value are listed last in both "
+        "sort orders."
+    ),
+)
+@cached_response(
+    expire=3600,
+    namespace="stocks",
+    key_args=_csv_version_key,
+    max_entries=_STOCKS_CACHE_ENTRIES,
 )
 async def get_stocks(
     sort_by: Optional[str] = Query(
@@ -51,7 +341,7 @@ async def get_stocks(
     ),
     sort_order: SortOrder = Query(
         SortOrder.desc,
-        description="Sort order: 'asc' or 'desc'",
+        description="Sort order: 'asc' or 'desc' (missing values always sort last)",
     ),
     sector: Optional[str] = Query(
         None,
@@ -87,9 +377,16 @@ async def get_stocks(
     """
     List all stocks with optional filtering and sorting.
 
+    Responses are cached per combination of query parameters and
+    summary.csv version, so a body is serialized (and compressed) once
+    per CSV update rather than once a minute.
+    The CSV loading, filtering and sorting run in a worker thread so the
+    event loop stays free for other requests.
+
     Args:
         sort_by: Column name to sort by.
-        sort_order: Sort direction ('asc' or 'desc').
+        sort_order: Sort direction ('asc' or 'desc'); stocks without a
+            value for sort_by come last either way.
         sector: Filter by sector.
         industry: Filter by industry.
         search: Search term for ticker or company name.
@@ -104,124 +401,31 @@ async def get_stocks(
     Raises:
         HTTPException: If data cannot be loaded or invalid sort column.
     """
-    try:
-        raw_stocks = load_summary_csv()
-    except DataLoadError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-    # Convert to StockSummary models for validation
-    stocks: List[StockSummary] = []
-    skipped_count = 0
-    for raw in raw_stocks:
-        try:
-            stock = StockSummary.model_validate(raw)
-            stocks.append(stock)
-        except Exception as e:
-            # Log validation errors for debugging
-            ticker = raw.get("ticker", "unknown") if isinstance(raw, dict) else "unknown"
-            logger.warning("Skipping invalid stock row (ticker=%s): %s", ticker, str(e)[:100])
-            skipped_count += 1
-            continue
-
-    if skipped_count > 0:
-        logger.info("Loaded %d stocks, skipped %d invalid rows", len(stocks), skipped_count)
-
-    # Apply filters
-    filtered_stocks = stocks
-
-    # Sector filter
-    if sector:
-        filtered_stocks = [
-            s for s in filtered_stocks
-            if s.sector and s.sector.lower() == sector.lower()
-        ]
+    return await asyncio.to_thread(
+        _compute_stocks,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        sector=sector,
+        industry=industry,
+        search=search,
+        min_market_cap=min_market_cap,
+        max_market_cap=max_market_cap,
+        min_pe=min_pe,
+        max_pe=max_pe,
+    )
 
-    # Industry filter
-    if industry:
-        filtered_stocks = [
-            s for s in filtered_stocks
-            if s.industry and s.industry.lower() == industry.lower()
-        ]
 
-    # Search filter (ticker or company name)
-    if search:
-        search_lower = search.lower()
-        filtered_stocks = [
-            s for s in filtered_stocks
-            if (
-                search_lower in s.ticker.lower()
-                or (s.company_name and search_lower in s.company_name.lower())
-            )
-        ]
-
-    # Market cap range filter
-    if min_market_cap is not None:
-        filtered_stocks = [
-            s for s in filtered_stocks
-            if s.market_cap is not None and s.market_cap >= min_market_cap
-        ]
-
-    if max_market_cap is not None:
-        filtered_stocks = [
-            s for s in filtered_stocks
-            if s.market_cap is not None and s.market_cap <= max_market_cap
-        ]
-
-    # P/E ratio range filter
-    if min_pe is not None:
-        filtered_stocks = [
-            s for s in filtered_stocks
-            if s.pe_trailing is not None and s.pe_trailing >= min_pe
-        ]
-
-    if max_pe is not None:
-        filtered_stocks = [
-            s for s in filtered_stocks
-            if s.pe_trailing is not None and s.pe_trailing <= max_pe
-        ]
+def _load_csv_metadata() -> Tuple[List[str], List[str], List[str]]:
+    """
+    Load column names, sectors and industries from summary.csv.
 
-    # Apply sorting
-    if sort_by:
-        # Validate sort column exists
-        valid_columns = get_column_names()
-        # Map aliased field names to actual CSV column names
-        column_mapping = {
-            "fifty_two_week_high": "52_week_high",
-            "fifty_two_week_low": "52_week_low",
-        }
-        actual_sort_by = column_mapping.get(sort_by, sort_by)
-
-        if actual_sort_by not in valid_columns and sort_by not in valid_columns:
-            # Also allow Pydantic field names
-            field_names = [f for f in StockSummary.model_fields.keys()]
-            if sort_by not in field_names:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid sort column: {sort_by}. Valid columns: {valid_columns[:10]}...",
-                )
-
-        # Sort using the field name (not alias)
-        def get_sort_key(stock: StockSummary):
-            value = getattr(stock, sort_by, None)
-            if value is None:
-                # Put None values at the end for desc, beginning for asc
-                return (1, 0) if sort_order == SortOrder.desc else (0, 0)
-            return (0, value)
-
-        reverse = sort_order == SortOrder.desc
-        filtered_stocks = sorted(filtered_stocks, key=get_sort_key, reverse=reverse)
-
-    # Get column names for response
-    try:
-        columns = get_column_names()
-    except DataLoadError:
-        columns = list(StockSummary.model_fields.keys())
+    Returns:
+        Tuple of (columns, sectors, industries).
 
-    return StockListResponse(
-        stocks=filtered_stocks,
-        total=len(filtered_stocks),
-        columns=columns,
-    )
+    Raises:
+        DataLoadError: If the CSV file cannot be loaded.
+    """
+    return get_column_names(), get_unique_sectors(), get_unique_industries()
 
 
 @router.get(
@@ -230,21 +434,29 @@ async def get_stocks(
     summary="Get Stock Metadata",
     description="Get available columns, sectors, and industries for filter dropdowns.",
 )
+@cached_response(
+    expire=3600, namespace="stocks_metadata", key_args=_csv_version_key, max_entries=2
+)
 async def get_stock_metadata() -> StockMetadataResponse:
     """
     Get metadata for building filter dropdowns and column selectors.
 
+    Responses are cached for an hour per summary.csv version, so a
+    rewritten CSV is picked up by the next request.
+
     Returns:
         StockMetadataResponse with columns, sectors, industries, and tickers.
 
     Raises:
         HTTPException: If data cannot be loaded.
     """
+    # The CSV-derived values share one parse, so they are loaded in one
+    # thread while the JSON directory scan runs in another
     try:
-        columns = get_column_names()
-        sectors = get_unique_sectors()
-        industries = get_unique_industries()
-        tickers = get_available_tickers()
+        (columns, sectors, industries), tickers = await asyncio.gather(
+            asyncio.to_thread(_load_csv_metadata),
+            asyncio.to_thread(get_available_tickers),
+        )
     except DataLoadError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -3,22 +3,71 @@ Stock detail API endpoint for retrieving full stock financial data.
 
 Provides endpoint for:
 - GET /stocks/{ticker} - Get complete stock JSON data
+- HEAD /stocks/{ticker} - Check that a ticker exists without loading data
+
+GET responses carry an ETag derived from the stock file's mtime; requests
+with a matching If-None-Match get an empty 304 without the data being read.
 """
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional, TypeVar
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from app.core.data_loader import (
     DataLoadError,
-    get_available_tickers,
-    load_stock_json,
+    get_available_tickers_set,
+    load_stock_json_bytes,
+    load_stock_summary_bytes,
+    stock_json_etag,
 )
+from app.core.response_cache import etag_matches
 from app.dependencies import TickerPath
 from app.models.stock import StockDetailResponse
 
 router = APIRouter()
 
+T = TypeVar("T")
+
+
+def _load_stock_or_404(loader: Callable[[str], T], ticker: str) -> T:
+    """
+    Load a stock's data, mapping load errors to HTTP errors.
+
+    Args:
+        loader: Data loader called with the ticker (e.g. load_stock_json_bytes).
+        ticker: Upper-case stock ticker symbol.
+
+    Returns:
+        Whatever the loader returns.
+
+    Raises:
+        HTTPException 404: If the stock's JSON file does not exist.
+        HTTPException 500: If the data cannot be loaded.
+    """
+    try:
+        return loader(ticker)
+    except DataLoadError as e:
+        if "not found" in str(e).lower():
+            raise HTTPException(status_code=404, detail=f"Stock not found: {ticker}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Build a 304 response if the client's cached copy is current.
+
+    Args:
+        request: Incoming request (its If-None-Match header is checked).
+        etag: Current entity tag of the resource.
+
+    Returns:
+        Empty 304 Response, or None if the full body must be sent.
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
 
 @router.get(
     "/{ticker}",
@@ -40,6 +89,7 @@ router = APIRouter()
                 }
             },
         },
+        304: {"description": "Stock data unchanged since the If-None-Match ETag"},
         404: {
             "description": "Stock not found",
             "content": {
@@ -51,45 +101,81 @@ router = APIRouter()
     },
 )
 async def get_stock_detail(
+    request: Request,
     ticker: TickerPath,
-) -> StockDetailResponse:
+) -> Response:
     """
     Get complete financial data for a specific stock.
 
+    The response body is assembled from the stock's cached, pre-serialized
+    JSON instead of being validated and encoded on every request.
+
     Args:
+        request: Incoming request (for If-None-Match).
         ticker: Stock ticker symbol (case-insensitive).
 
     Returns:
-        StockDetailResponse containing full stock JSON data.
+        JSON Response shaped like StockDetailResponse (full stock JSON data),
+        or an empty 304 if the client's ETag is current.
 
     Raises:
         HTTPException 404: If the stock ticker is not found.
         HTTPException 500: If data cannot be loaded.
     """
-    ticker_upper = ticker.upper()
+    # A missing file is reported as 404 here, so no separate existence check
+    # is needed; an unchanged file is answered without reading it
+    etag = _load_stock_or_404(stock_json_etag, ticker)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    # Load stock JSON data (serialized once per ticker and cached)
+    data_body = _load_stock_or_404(load_stock_json_bytes, ticker)
+
+    # Same shape as StockDetailResponse, without re-validating the data dict
+    body = b'{"ticker":' + orjson.dumps(ticker) + b',"data":' + data_body + b"}"
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
-    # Verify ticker exists
-    try:
-        available_tickers = get_available_tickers()
-    except DataLoadError as e:
-        raise HTTPException(status_code=500, detail=str(e))
 
-    if ticker_upper not in available_tickers:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Stock not found: {ticker_upper}",
-        )
+@router.head(
+    "/{ticker}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Check Stock Exists",
+    description=(
+        "Check whether a ticker is available without loading its data. "
+        "Lets frontends pre-validate input before calling the expensive "
+        "valuation and analysis endpoints."
+    ),
+    responses={
+        204: {"description": "Stock exists"},
+        404: {"description": "Stock not found"},
+    },
+)
+async def head_stock(
+    ticker: TickerPath,
+) -> Response:
+    """
+    Check whether a stock ticker is available.
+
+    Args:
+        ticker: Stock ticker symbol (case-insensitive).
 
-    # Load stock JSON data
+    Returns:
+        Empty 204 Response if the ticker exists.
+
+    Raises:
+        HTTPException 404: If the stock ticker is not found.
+        HTTPException 500: If the ticker list cannot be loaded.
+    """
     try:
-        stock_data = load_stock_json(ticker_upper)
+        available_tickers = get_available_tickers_set()
     except DataLoadError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    return StockDetailResponse(
-        ticker=ticker_upper,
-        data=stock_data,
-    )
+    if ticker not in available_tickers:
+        raise HTTPException(status_code=404)
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get(
@@ -99,57 +185,31 @@ async def get_stock_detail(
     description="Get a summarized view of key stock metrics.",
 )
 async def get_stock_summary(
+    request: Request,
     ticker: TickerPath,
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get summarized key metrics for a stock.
 
     Extracts the most important fields from the full stock data
-    for a quick overview.
+    for a quick overview (see summarize_stock_json).
 
     Args:
+        request: Incoming request (for If-None-Match).
         ticker: Stock ticker symbol (case-insensitive).
 
     Returns:
-        Dictionary with key stock metrics.
+        JSON Response with key stock metrics, or an empty 304 if the
+        client's ETag is current.
 
     Raises:
         HTTPException 404: If the stock ticker is not found.
     """
-    ticker_upper = ticker.upper()
-
-    try:
-        stock_data = load_stock_json(ticker_upper)
-    except DataLoadError as e:
-        if "not found" in str(e).lower():
-            raise HTTPException(status_code=404, detail=f"Stock not found: {ticker_upper}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-    # Extract key metrics for summary
-    company_info = stock_data.get("company_info", {})
-    market_data = stock_data.get("market_data", {})
-    valuation = stock_data.get("valuation", {})
-    calculated_metrics = stock_data.get("calculated_metrics", {})
-
-    summary = {
-        "ticker": ticker_upper,
-        "company_name": company_info.get("name"),
-        "sector": company_info.get("sector"),
-        "industry": company_info.get("industry"),
-        "current_price": market_data.get("current_price"),
-        "market_cap": market_data.get("market_cap"),
-        "pe_ratio": valuation.get("pe_trailing"),
-        "forward_pe": valuation.get("pe_forward"),
-        "eps": valuation.get("eps_trailing"),
-        "dividend_yield": valuation.get("dividend_yield"),
-        "beta": market_data.get("beta"),
-        "fifty_two_week_high": market_data.get("52_week_high"),
-        "fifty_two_week_low": market_data.get("52_week_low"),
-        "enterprise_value": calculated_metrics.get("calc_ev"),
-        "ev_to_ebitda": calculated_metrics.get("calc_ev_to_ebitda"),
-        "free_cash_flow": calculated_metrics.get("calc_fcf"),
-        "roic": calculated_metrics.get("calc_roic"),
-        "collected_at": stock_data.get("collected_at"),
-    }
-
-    return summary
+    etag = _load_stock_or_404(stock_json_etag, ticker)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    # Summary is extracted and serialized once per JSON file version
+    body = _load_stock_or_404(load_stock_summary_bytes, ticker)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -3,7 +3,11 @@ Valuation API endpoints for stock intrinsic value calculations.
 
 This module provides endpoints for:
 - GET /{ticker}/valuation - Get complete valuation (cached)
-- POST /{ticker}/valuation/refresh - Force refresh valuation
+- GET /{ticker}/valuation/stream - Same valuation as Server-Sent Events,
+  with progress events while the AI extraction runs
+- POST /{ticker}/valuation/refresh - Force refresh valuation (or queue it
+  in the background with mode=background)
+- POST /valuation/bulk-refresh - Queue background refreshes for many tickers
 
 The valuation combines:
 - DCF (Discounted Cash Flow) with 3 scenarios
@@ -14,19 +18,25 @@ The valuation combines:
 Architecture Notes:
 - AI layer (Gemini) handles data extraction only
 - All calculations are performed in Python (ValuationEngine)
-- Results are cached for 24 hours (VALUATION_CACHE_TTL)
+- Results are cached for 24 hours (VALUATION_CACHE_TTL); GET responses are
+  also kept serialized in each worker's memory for VALUATION_RESPONSE_TTL,
+  so warm hits skip the engine entirely
 """
 
+import asyncio
 import logging
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-
-# Rate limiter for valuation endpoints (expensive AI operations)
-limiter = Limiter(key_func=get_remote_address)
-
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Literal
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+from app.core.data_loader import get_available_tickers_set
+from app.core.http_errors import HTTPErrorMap
+from app.core.response_cache import cached_response, encode_json
+from app.core.singleflight import SingleFlight
+from app.dependencies import TickerItem, TickerPath
 from app.models.valuation_output import ValuationResult
 from app.models.flexible_input import FlexibleValuationInput
 from app.services.ai_extractor import (
@@ -35,30 +45,134 @@ from app.services.ai_extractor import (
     DataNotFoundError,
     ExtractionError,
     GeminiAPIError,
-    get_ai_extractor,
+    get_ai_extractor_dep,
 )
 from app.services.valuation_engine import (
+    VALUATION_RESPONSE_NAMESPACE,
     ValuationEngine,
     ValuationError,
-    get_valuation_engine,
+    get_valuation_engine_dep,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Coalesces concurrent valuations of the same (ticker, force_refresh), so a
+# cold ticker requested by many clients triggers one AI extraction
+_valuation_flight: SingleFlight[ValuationResult] = SingleFlight("valuation")
+
+# Service exception -> (status code, detail template)
+_errors = HTTPErrorMap(
+    {
+        APIKeyNotConfiguredError: (
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            "{e}",
+        ),
+        DataNotFoundError: (
+            status.HTTP_404_NOT_FOUND,
+            "Stock data not found for ticker: {ticker}",
+        ),
+        GeminiAPIError: (
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            "AI extraction service is temporarily unavailable. Please try again later.",
+        ),
+        ExtractionError: (
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Failed to extract financial data for {ticker}: {e}",
+        ),
+        ValuationError: (
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Failed to calculate valuation for {ticker}: {e}",
+        ),
+    },
+    unexpected=(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "An unexpected error occurred: {e}",
+    ),
+    context="valuation",
+    logger=logger,
+)
+
+# Upper bound on tickers accepted by one bulk refresh request
+MAX_BULK_REFRESH = 100
+
+# Seconds a serialized GET response is kept in this worker. Forced
+# recalculations drop it here, but other workers only notice once it
+# expires, so this bounds how stale they (and the engine cache) can get.
+VALUATION_RESPONSE_TTL = 60
+
+
+# How POST /refresh runs: wait for the result, or queue it and return 202
+RefreshMode = Literal["standard", "background"]
+
+
+class ValuationRefreshAccepted(BaseModel):
+    """Response for a refresh queued with mode=background."""
+
+    ticker: str = Field(..., description="Stock ticker symbol")
+    requested_at: datetime = Field(
+        ...,
+        description=(
+            "When the refresh was queued; poll the Location URL until the "
+            "valuation's calculation_timestamp is later than this"
+        ),
+    )
+
+
+class ValuationBulkRefreshRequest(BaseModel):
+    """Request body for POST /valuation/bulk-refresh."""
 
-# Type alias for path parameter
-TickerPath = Annotated[
-    str,
-    Path(
+    tickers: List[TickerItem] = Field(
         ...,
-        description="Stock ticker symbol (e.g., AAPL, MSFT)",
+        description="Stock ticker symbols (case-insensitive)",
         min_length=1,
-        max_length=10,
-        examples=["AAPL", "MSFT", "GOOGL"],
-    ),
-]
+        max_length=MAX_BULK_REFRESH,
+        examples=[["AAPL", "MSFT", "NVDA"]],
+    )
+
+
+class ValuationBulkRefreshAccepted(BaseModel):
+    """Response for a queued bulk refresh."""
+
+    tickers: List[str] = Field(..., description="Tickers queued for refresh (deduplicated)")
+    not_found: List[str] = Field(
+        default_factory=list,
+        description="Requested tickers with no stock data, which were skipped",
+    )
+    requested_at: datetime = Field(
+        ...,
+        description=(
+            "When the refreshes were queued; each valuation is ready once its "
+            "calculation_timestamp is later than this"
+        ),
+    )
+
+
+def _refresh_in_background(engine: ValuationEngine, ticker: str) -> None:
+    """
+    Start a forced valuation refresh without waiting for it.
+
+    Shares the (ticker, True) single-flight key with blocking refreshes,
+    so at most one refresh per ticker runs at a time.
+    """
+    if _valuation_flight.in_flight((ticker, True)):
+        return
+
+    task = _valuation_flight.start(
+        (ticker, True),
+        lambda: engine.calculate_valuation(ticker, force_refresh=True),
+    )
+
+    def _log_failure(done: "asyncio.Task[ValuationResult]") -> None:
+        if not done.cancelled() and done.exception() is not None:
+            logger.warning(
+                "Background valuation refresh failed for %s: %s",
+                ticker,
+                done.exception(),
+            )
+
+    task.add_done_callback(_log_failure)
 
 
 @router.get(
@@ -75,7 +189,11 @@ TickerPath = Annotated[
     - **Composite Value**: Weighted average (60% DCF + 40% Graham)
     - **Investment Verdict**: Based on upside/downside potential
 
-    Results are cached for 24 hours. Use the POST endpoint to force a refresh.
+    Results are cached for 24 hours. Use the POST endpoint to force a refresh;
+    with several workers, others may serve the previous valuation for up to
+    a minute afterwards.
+    Responses carry an `ETag`; send it back in `If-None-Match` to get an
+    empty 304 while the valuation is unchanged.
 
     **Note**: First request for a stock may take 10-30 seconds as AI extracts and normalizes financial data.
     """,
@@ -110,18 +228,27 @@ TickerPath = Annotated[
         },
     },
 )
-@limiter.limit("10/minute")
+@cached_response(
+    expire=VALUATION_RESPONSE_TTL,
+    namespace=VALUATION_RESPONSE_NAMESPACE,
+    key_args=lambda kwargs: {"ticker": kwargs["ticker"]},
+    # Revalidate every poll: a refresh can replace the valuation at any
+    # time, and an unchanged one costs only an empty 304
+    cache_control="no-cache",
+)
 async def get_valuation(
-    request: Request,
     ticker: TickerPath,
-    engine: ValuationEngine = Depends(get_valuation_engine),
+    engine: ValuationEngine = Depends(get_valuation_engine_dep),
 ) -> ValuationResult:
     """
     Get complete valuation for a stock ticker.
 
     This endpoint returns a comprehensive valuation analysis including
     DCF calculations, Graham Number, and defensive screen criteria.
-    Results are cached for 24 hours.
+    Results are cached for 24 hours; the serialized response is kept for
+    VALUATION_RESPONSE_TTL and served without reaching the engine.
+    Concurrent requests for the same uncached ticker share one calculation.
+    Rate limited per client by RateLimitMiddleware.
 
     Args:
         ticker: Stock ticker symbol (case-insensitive)
@@ -133,60 +260,137 @@ async def get_valuation(
     Raises:
         HTTPException: 404 if stock not found, 500 on calculation error, 503 on AI service error
     """
-    ticker = ticker.upper().strip()
-    logger.info("GET valuation request for %s", ticker)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("GET valuation request for %s", ticker)
 
     try:
-        result = await engine.calculate_valuation(ticker, force_refresh=False)
-        logger.info(
-            "Valuation returned for %s: $%.2f composite IV, %s verdict",
-            ticker,
-            result.composite_intrinsic_value,
-            result.verdict.value,
+        result = await _valuation_flight.do(
+            (ticker, False),
+            lambda: engine.calculate_valuation(ticker, force_refresh=False),
         )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Valuation returned for %s: $%.2f composite IV, %s verdict",
+                ticker,
+                result.composite_intrinsic_value,
+                result.verdict.value,
+            )
         return result
 
-    except APIKeyNotConfiguredError as e:
-        logger.warning("API key not configured for valuation: %s", ticker)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e),
-        )
+    except Exception as e:
+        raise _errors.to_http(e, ticker) from e
 
-    except DataNotFoundError as e:
-        logger.warning("Stock not found: %s - %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Stock data not found for ticker: {ticker}",
-        )
 
-    except GeminiAPIError as e:
-        logger.error("AI service error for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="AI extraction service is temporarily unavailable. Please try again later.",
-        )
+def _sse_event(event: str, data: bytes) -> bytes:
+    """Frame one Server-Sent Event with a JSON data line."""
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
 
-    except ExtractionError as e:
-        logger.error("Extraction error for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to extract financial data for {ticker}: {str(e)}",
-        )
 
-    except ValuationError as e:
-        logger.error("Valuation error for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to calculate valuation for {ticker}: {str(e)}",
-        )
+async def _valuation_events(engine: ValuationEngine, ticker: str) -> AsyncIterator[bytes]:
+    """
+    Run a valuation and yield its progress and result as SSE frames.
+
+    Joins an in-flight GET valuation of the same ticker if there is one;
+    a joined stream only receives the final result, since progress events
+    go to the caller that started the work.
+
+    Args:
+        engine: Valuation engine
+        ticker: Canonical ticker symbol
 
+    Yields:
+        "progress" events ({"stage": ...}), then one "result" event with
+        the ValuationResult, or one "error" event with the mapped status
+        code and detail
+    """
+    progress: "asyncio.Queue[Dict[str, str]]" = asyncio.Queue()
+    task = _valuation_flight.start(
+        (ticker, False),
+        lambda: engine.calculate_valuation(ticker, force_refresh=False, progress=progress),
+    )
+
+    getter = None
+    try:
+        while True:
+            getter = asyncio.ensure_future(progress.get())
+            await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                break
+            yield _sse_event("progress", encode_json(getter.result()))
+    finally:
+        # Never cancels the valuation itself; other callers may share it
+        if getter is not None:
+            getter.cancel()
+
+    while not progress.empty():
+        yield _sse_event("progress", encode_json(progress.get_nowait()))
+
+    try:
+        result = task.result()
     except Exception as e:
-        logger.exception("Unexpected error in valuation for %s", ticker)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"An unexpected error occurred: {str(e)}",
+        error = _errors.to_http(e, ticker)
+        yield _sse_event(
+            "error",
+            encode_json({"status_code": error.status_code, "detail": error.detail}),
         )
+        return
+
+    yield _sse_event("result", encode_json(result))
+
+
+@router.get(
+    "/{ticker}/valuation/stream",
+    response_class=StreamingResponse,
+    summary="Stream stock valuation (Server-Sent Events)",
+    description="""
+    Same valuation as GET /{ticker}/valuation, delivered as a
+    `text/event-stream` so clients can show progress during a cold AI
+    extraction instead of blocking on a silent 10-30 second request.
+
+    Events:
+    - `progress`: `{"stage": "extraction_started" | "extraction_done", "ticker": ...}`
+    - `result`: the complete ValuationResult (last event)
+    - `error`: `{"status_code": ..., "detail": ...}` if the valuation failed (last event)
+    """,
+    responses={
+        200: {
+            "description": "Valuation event stream",
+            "content": {"text/event-stream": {}},
+        },
+    },
+)
+async def stream_valuation(
+    ticker: TickerPath,
+    engine: ValuationEngine = Depends(get_valuation_engine_dep),
+) -> StreamingResponse:
+    """
+    Stream the valuation of a stock ticker as Server-Sent Events.
+
+    Shares the engine cache and single-flight key with GET valuation.
+    Errors are sent as an "error" event, since the 200 status line has
+    already gone out by the time the valuation fails.
+
+    Args:
+        ticker: Stock ticker symbol (case-insensitive)
+        engine: Valuation engine dependency
+
+    Returns:
+        StreamingResponse of progress events followed by the result
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("GET valuation stream request for %s", ticker)
+
+    return StreamingResponse(
+        _valuation_events(engine, ticker),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # GZipMiddleware skips responses that already declare an
+            # encoding; compressing would hold events in the gzip buffer
+            "Content-Encoding": "identity",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 @router.post(
@@ -203,12 +407,20 @@ async def get_valuation(
 
     **Warning**: This triggers a new AI extraction which may take 10-30 seconds
     and consumes API quota.
+
+    With `mode=background` the refresh is queued and the endpoint returns
+    202 immediately; the `Location` header points at the GET valuation URL
+    that serves the result once it is ready.
     """,
     responses={
         200: {
             "description": "Valuation refreshed successfully",
             "model": ValuationResult,
         },
+        202: {
+            "description": "Refresh queued (mode=background)",
+            "model": ValuationRefreshAccepted,
+        },
         404: {
             "description": "Stock not found",
             "content": {
@@ -235,82 +447,68 @@ async def get_valuation(
         },
     },
 )
-@limiter.limit("5/minute")
 async def refresh_valuation(
     request: Request,
     ticker: TickerPath,
-    engine: ValuationEngine = Depends(get_valuation_engine),
-) -> ValuationResult:
+    mode: RefreshMode = Query(
+        "standard",
+        description="standard waits for the result; background queues it and returns 202",
+    ),
+    engine: ValuationEngine = Depends(get_valuation_engine_dep),
+) -> Response:
     """
     Force refresh valuation for a stock ticker.
 
     Bypasses cache and triggers a new AI extraction and valuation calculation.
-    Use sparingly as this consumes AI API quota.
+    Use sparingly as this consumes AI API quota. Concurrent refreshes of
+    the same ticker share one calculation, and the engine drops this worker's
+    cached GET response for the ticker on success.
 
     Args:
+        request: Incoming request (used for the Location URL)
         ticker: Stock ticker symbol (case-insensitive)
+        mode: "standard" to wait for the result, "background" to queue it
         engine: Valuation engine dependency
 
     Returns:
-        ValuationResult with fresh analysis
+        JSON Response with the fresh ValuationResult, or a 202
+        ValuationRefreshAccepted response when queued in the background
 
     Raises:
         HTTPException: 404 if stock not found, 500 on calculation error, 503 on AI service error
     """
-    ticker = ticker.upper().strip()
-    logger.info("POST valuation refresh request for %s", ticker)
-
-    try:
-        result = await engine.calculate_valuation(ticker, force_refresh=True)
-        logger.info(
-            "Valuation refreshed for %s: $%.2f composite IV, %s verdict",
-            ticker,
-            result.composite_intrinsic_value,
-            result.verdict.value,
-        )
-        return result
-
-    except APIKeyNotConfiguredError as e:
-        logger.warning("API key not configured for valuation refresh: %s", ticker)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e),
-        )
-
-    except DataNotFoundError as e:
-        logger.warning("Stock not found: %s - %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Stock data not found for ticker: {ticker}",
-        )
-
-    except GeminiAPIError as e:
-        logger.error("AI service error for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="AI extraction service is temporarily unavailable. Please try again later.",
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("POST valuation refresh request for %s (mode=%s)", ticker, mode)
+
+    if mode == "background":
+        _refresh_in_background(engine, ticker)
+        accepted = ValuationRefreshAccepted(
+            ticker=ticker,
+            requested_at=datetime.now(timezone.utc),
         )
-
-    except ExtractionError as e:
-        logger.error("Extraction error for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to extract financial data for {ticker}: {str(e)}",
+        return ORJSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=accepted.model_dump(mode="json"),
+            headers={"Location": str(request.url_for("get_valuation", ticker=ticker))},
         )
 
-    except ValuationError as e:
-        logger.error("Valuation error for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to calculate valuation for {ticker}: {str(e)}",
+    try:
+        result = await _valuation_flight.do(
+            (ticker, True),
+            lambda: engine.calculate_valuation(ticker, force_refresh=True),
         )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Valuation refreshed for %s: $%.2f composite IV, %s verdict",
+                ticker,
+                result.composite_intrinsic_value,
+                result.verdict.value,
+            )
+        # Encoded in one pass; the engine already returns a validated model
+        return Response(content=encode_json(result), media_type="application/json")
 
     except Exception as e:
-        logger.exception("Unexpected error in valuation refresh for %s", ticker)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"An unexpected error occurred: {str(e)}",
-        )
+        raise _errors.to_http(e, ticker) from e
 
 
 @router.get(
@@ -328,57 +526,81 @@ async def refresh_valuation(
 )
 async def get_flexible_extraction(
     ticker: TickerPath,
-    extractor: AIExtractor = Depends(get_ai_extractor),
-) -> FlexibleValuationInput:
+    extractor: AIExtractor = Depends(get_ai_extractor_dep),
+) -> Response:
     """
     Get flexible extraction for a stock ticker.
 
     This lets the AI extract ALL available financial data without
     forcing a rigid schema. The AI decides what to extract.
     """
-    ticker = ticker.upper().strip()
-    logger.info("GET flexible extraction request for %s", ticker)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("GET flexible extraction request for %s", ticker)
 
     try:
         result = await extractor.extract_flexible(ticker, force_refresh=True)
-        logger.info(
-            "Flexible extraction returned for %s: confidence=%.2f",
-            ticker,
-            result.data_confidence_score,
-        )
-        return result
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Flexible extraction returned for %s: confidence=%.2f",
+                ticker,
+                result.data_confidence_score,
+            )
+        return Response(content=encode_json(result), media_type="application/json")
 
-    except APIKeyNotConfiguredError as e:
-        logger.warning("API key not configured: %s", ticker)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e),
-        )
+    except Exception as e:
+        raise _errors.to_http(e, ticker) from e
 
-    except DataNotFoundError as e:
-        logger.warning("Stock not found: %s - %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Stock data not found for ticker: {ticker}",
-        )
 
-    except GeminiAPIError as e:
-        logger.error("AI service error for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="AI extraction service is temporarily unavailable.",
-        )
+@router.post(
+    "/valuation/bulk-refresh",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=ValuationBulkRefreshAccepted,
+    summary="Queue valuation refreshes for many tickers",
+    description=f"""
+    Queue forced valuation refreshes for up to {MAX_BULK_REFRESH} tickers and
+    return 202 immediately. Each ticker is refreshed as with
+    `POST /{{ticker}}/valuation/refresh?mode=background`: duplicates and
+    tickers already being refreshed are skipped, and the AI extractions run
+    through the extractor's shared Gemini rate limiter.
+
+    Poll `GET /{{ticker}}/valuation` for the results.
+    """,
+    responses={
+        422: {"description": "Invalid request body"},
+    },
+)
+async def bulk_refresh_valuations(
+    body: ValuationBulkRefreshRequest,
+    engine: ValuationEngine = Depends(get_valuation_engine_dep),
+) -> ValuationBulkRefreshAccepted:
+    """
+    Queue background valuation refreshes for several tickers.
 
-    except ExtractionError as e:
-        logger.error("Extraction error for %s: %s", ticker, e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to extract data for {ticker}: {str(e)}",
-        )
+    Args:
+        body: Tickers to refresh
+        engine: Valuation engine dependency
 
-    except Exception as e:
-        logger.exception("Unexpected error in flexible extraction for %s", ticker)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"An unexpected error occurred: {str(e)}",
+    Returns:
+        ValuationBulkRefreshAccepted listing the queued and unknown tickers
+    """
+    available = get_available_tickers_set()
+    tickers: List[str] = []
+    not_found: List[str] = []
+    for ticker in dict.fromkeys(body.tickers):
+        (tickers if ticker in available else not_found).append(ticker)
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "POST valuation bulk refresh for %d tickers (%d not found)",
+            len(tickers),
+            len(not_found),
         )
+
+    for ticker in tickers:
+        _refresh_in_background(engine, ticker)
+
+    return ValuationBulkRefreshAccepted(
+        tickers=tickers,
+        not_found=not_found,
+        requested_at=datetime.now(timezone.utc),
+    )
@@ -5,50 +5,36 @@ Combines all endpoint routers into a single API router
 with appropriate prefixes and tags.
 """
 
+from typing import Tuple
+
 from fastapi import APIRouter
 
 from app.api.v1.endpoints import analysis, extraction, realtime, screener, stock, valuation
 
 api_router = APIRouter()
 
-# Include screener endpoints (GET /stocks, GET /stocks/metadata)
-api_router.include_router(
-    screener.router,
-    prefix="/stocks",
-    tags=["Screener"],
-)
-
-# Include stock detail endpoints (GET /stocks/{ticker})
-api_router.include_router(
-    stock.router,
-    prefix="/stocks",
-    tags=["Stock Details"],
-)
-
-# Include real-time data endpoints (GET /stocks/{ticker}/price, GET /stocks/{ticker}/history)
-api_router.include_router(
-    realtime.router,
-    prefix="/stocks",
-    tags=["Real-Time Data"],
+# All endpoint routers are served under /stocks
+STOCKS_PREFIX = "/stocks"
+
+# (router, tag) in registration order; order matters for matching, so the
+# static screener paths come before the /{ticker} routes
+_STOCK_ROUTERS: Tuple[Tuple[APIRouter, str], ...] = (
+    # GET /stocks, GET /stocks/metadata
+    (screener.router, "Screener"),
+    # GET /stocks/{ticker}
+    (stock.router, "Stock Details"),
+    # GET /stocks/{ticker}/price, POST /stocks/prices/batch, GET /stocks/{ticker}/history
+    (realtime.router, "Real-Time Data"),
+    # GET /stocks/{ticker}/extraction
+    (extraction.router, "AI Extraction"),
+    # GET /stocks/{ticker}/valuation(/stream), POST /stocks/{ticker}/valuation/refresh,
+    # POST /stocks/valuation/bulk-refresh
+    (valuation.router, "Valuation"),
+    # GET /stocks/{ticker}/analysis, POST /stocks/{ticker}/analysis/refresh
+    (analysis.router, "AI Analysis"),
 )
 
-# Include AI extraction endpoints (GET /stocks/{ticker}/extraction)
-api_router.include_router(
-    extraction.router,
-    prefix="/stocks",
-    tags=["AI Extraction"],
-)
-
-# Include valuation endpoints (GET /stocks/{ticker}/valuation, POST /stocks/{ticker}/valuation/refresh)
-api_router.include_router(
-    valuation.router,
-    prefix="/stocks",
-    tags=["Valuation"],
-)
-
-# Include AI analysis endpoints (GET /stocks/{ticker}/analysis, POST /stocks/{ticker}/analysis/refresh)
-api_router.include_router(
-    analysis.router,
-    prefix="/stocks",
-    tags=["AI Analysis"],
-)
+# Included directly (not via a nested /stocks router) so each route is
+# copied into api_router once
+for _router, _tag in _STOCK_ROUTERS:
+    api_router.include_router(_router, prefix=STOCKS_PREFIX, tags=[_tag])
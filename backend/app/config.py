@@ -5,15 +5,23 @@ Loads environment variables from .env file and provides typed configuration
 for the Intelligent Investor Pro backend application.
 """
 
-import json
 import logging
 import warnings
-from functools import lru_cache
+from functools import cached_property
 from pathlib import Path
-from typing import List
+from typing import Annotated, Any, FrozenSet, List
 
+import orjson
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+# Path properties resolved eagerly when Settings is built
+_RESOLVED_PATHS = (
+    "csv_path_resolved",
+    "json_dir_resolved",
+    "data_dir_resolved",
+    "cache_dir_resolved",
+)
 
 
 class Settings(BaseSettings):
@@ -27,8 +35,9 @@ class Settings(BaseSettings):
         DATA_DIR: Root directory for data files
         CSV_PATH: Path to summary.csv file
         JSON_DIR: Directory containing per-stock JSON files
-        CORS_ORIGINS: List of allowed CORS origins
+        CORS_ORIGINS: Set of allowed CORS origins
         GOOGLE_API_KEY: Google AI (Gemini) API key for AI features
+        REDIS_URL: Redis URL for rate limit buckets shared across workers
     """
 
     model_config = SettingsConfigDict(
@@ -66,17 +75,18 @@ class Settings(BaseSettings):
         description="Directory containing stock JSON files"
     )
 
-    # CORS Settings - include common Next.js dev ports
-    CORS_ORIGINS: List[str] = Field(
-        default=[
+    # CORS Settings - include common Next.js dev ports. NoDecode hands the
+    # raw env string to parse_cors_origins, so comma-separated values work
+    CORS_ORIGINS: Annotated[FrozenSet[str], NoDecode] = Field(
+        default=frozenset({
             "http://localhost:3000",
             "http://localhost:3001",
             "http://localhost:3002",
             "http://127.0.0.1:3000",
             "http://127.0.0.1:3001",
             "http://127.0.0.1:3002",
-        ],
-        description="Allowed CORS origins"
+        }),
+        description="Allowed CORS origins (a set, so origin checks are O(1))"
     )
 
     # AI Integration
@@ -110,17 +120,41 @@ class Settings(BaseSettings):
         default=604800,
         description="AI analysis cache TTL in seconds (7 days)"
     )
+    ANALYSIS_SOFT_TTL: int = Field(
+        default=432000,
+        description=(
+            "Age in seconds after which a cached analysis is served stale "
+            "while it is regenerated in the background (5 days)"
+        )
+    )
+    USE_RUST_CACHE: bool = Field(
+        default=False,
+        description=(
+            "Store AI extraction results in diskcache_rs (Rust backend) "
+            "instead of diskcache"
+        )
+    )
+
+    # Rate Limiting
+    REDIS_URL: str = Field(
+        default="",
+        description=(
+            "Redis URL for rate limit buckets shared by all workers "
+            "(e.g. redis://localhost:6379/0); empty keeps them in process memory"
+        )
+    )
 
     @field_validator("CORS_ORIGINS", mode="before")
     @classmethod
     def parse_cors_origins(cls, v: str | List[str]) -> List[str]:
-        """Parse CORS origins from comma-separated string or list."""
+        """Parse CORS origins from comma-separated string or list (stored as a frozenset)."""
         if isinstance(v, str):
+            v = v.strip()
             # Handle JSON-like string format: ["http://localhost:3000"]
-            if v.startswith("[") and v.endswith("]"):
+            if v[:1] == "[" and v[-1:] == "]":
                 try:
-                    return json.loads(v)
-                except json.JSONDecodeError:
+                    return list(orjson.loads(v))
+                except orjson.JSONDecodeError:
                     pass
             # Handle comma-separated format
             return [origin.strip() for origin in v.split(",") if origin.strip()]
@@ -138,45 +172,55 @@ class Settings(BaseSettings):
             )
         return v
 
-    @property
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve the data paths once, so no request pays for realpath()."""
+        for name in _RESOLVED_PATHS:
+            getattr(self, name)
+
+    @cached_property
     def project_root(self) -> Path:
         """Get the project root directory (parent of backend)."""
         return Path(__file__).parent.parent.parent
 
-    @property
+    @cached_property
     def csv_path_resolved(self) -> Path:
         """Get the resolved absolute path to summary.csv."""
         backend_dir = Path(__file__).parent.parent
         return (backend_dir / self.CSV_PATH).resolve()
 
-    @property
+    @cached_property
     def json_dir_resolved(self) -> Path:
         """Get the resolved absolute path to JSON directory."""
         backend_dir = Path(__file__).parent.parent
         return (backend_dir / self.JSON_DIR).resolve()
 
-    @property
+    @cached_property
     def data_dir_resolved(self) -> Path:
         """Get the resolved absolute path to data directory."""
         backend_dir = Path(__file__).parent.parent
         return (backend_dir / self.DATA_DIR).resolve()
 
-    @property
+    @cached_property
     def cache_dir_resolved(self) -> Path:
         """Get the resolved absolute path to cache directory."""
         backend_dir = Path(__file__).parent.parent
         return (backend_dir / self.CACHE_DIR).resolve()
 
 
-@lru_cache
+# Loaded once at import; every module reads settings at import time anyway
+SETTINGS: Settings = Settings()
+
+
 def get_settings() -> Settings:
     """
-    Get cached application settings instance.
+    Get the application settings instance.
 
     Returns:
         Settings: Application settings singleton.
 
     Note:
-        Uses lru_cache to ensure settings are loaded only once.
+        Settings are loaded once at import (SETTINGS), so this is a plain
+        attribute return with no cache lookup. The resolved paths are
+        cached_property values, resolved when SETTINGS is built.
     """
-    return Settings()
+    return SETTINGS
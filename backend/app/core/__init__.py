@@ -6,7 +6,10 @@ Core module containing data loading utilities and shared functionality.
 from app.core.cache_manager import ExtractionCache, get_extraction_cache
 from app.core.data_loader import (
     DataLoadError,
+    canonical_ticker,
     get_available_tickers,
+    get_available_tickers_set,
+    get_summary_df,
     load_stock_json,
     load_summary_csv,
 )
@@ -15,7 +18,10 @@ __all__ = [
     "ExtractionCache",
     "get_extraction_cache",
     "DataLoadError",
+    "canonical_ticker",
     "load_summary_csv",
+    "get_summary_df",
     "load_stock_json",
     "get_available_tickers",
+    "get_available_tickers_set",
 ]
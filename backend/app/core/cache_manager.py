@@ -8,16 +8,19 @@ response times for frequently accessed stocks.
 Cache Strategy:
 - Key: {ticker}_{collected_at_hash} - ensures cache invalidation on data refresh
 - TTL: 7 days (configurable via EXTRACTION_CACHE_TTL)
-- Storage: Local disk using diskcache.Cache
+- Storage: Local disk using diskcache.Cache, or the API-compatible
+  Rust backend diskcache_rs when USE_RUST_CACHE is set
 """
 
 import hashlib
+import inspect
 import logging
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
 from diskcache import Cache
 
 from app.config import get_settings
@@ -25,6 +28,100 @@ from app.models.valuation_input import StandardizedValuationInput
 
 logger = logging.getLogger(__name__)
 
+# Bound at import to skip the module attribute lookup on every key
+_blake2b = hashlib.blake2b
+
+# Reserved key prefix for the per-ticker index of cache keys
+_INDEX_PREFIX = "__index__:"
+
+# Reserved key prefix marking a ticker's legacy (MD5) keys as invalidated.
+# Legacy keys cannot be derived without their collected_at, so they are not
+# in the index; invalidate_all sets this marker for one TTL instead.
+_LEGACY_INVALIDATED_PREFIX = "__legacy_invalidated__:"
+
+# Fingerprint of the StandardizedValuationInput schema. Entries are stored as
+# pickled (tag, model) pairs and returned without re-validation only while
+# the tag matches; any model change makes older entries misses.
+_SCHEMA_TAG = _blake2b(
+    orjson.dumps(StandardizedValuationInput.model_json_schema(), option=orjson.OPT_SORT_KEYS),
+    digest_size=8,
+).hexdigest()
+
+
+# diskcache.Cache API used by ExtractionCache; a diskcache_rs release missing
+# any of it is not used
+_REQUIRED_CACHE_API = (
+    "get", "set", "delete", "pop", "transact", "volume", "clear", "close",
+    "directory", "__iter__", "__len__",
+)
+
+
+def _supports_cache_api(cache: Any) -> bool:
+    """Check that a cache backend provides the diskcache API used here."""
+    missing = [name for name in _REQUIRED_CACHE_API if not hasattr(cache, name)]
+    try:
+        if "set" not in missing and "expire" not in inspect.signature(cache.set).parameters:
+            missing.append("set(expire=)")
+    except (TypeError, ValueError):
+        pass  # no introspectable signature (builtin); assume diskcache's
+
+    if missing:
+        logger.warning(
+            "diskcache_rs Cache lacks %s; using diskcache", ", ".join(missing)
+        )
+    return not missing
+
+
+def _open_cache(cache_dir: Path, use_rust: bool) -> Any:
+    """
+    Open the disk cache backend for a directory.
+
+    diskcache_rs stores entries in its own format, so it gets a sibling
+    directory ("<name>-rs") rather than sharing diskcache's SQLite files.
+    Falls back to diskcache if diskcache_rs is not installed or its Cache
+    lacks part of the diskcache API this module uses.
+
+    Args:
+        cache_dir: Cache directory for diskcache
+        use_rust: Use the diskcache_rs backend
+
+    Returns:
+        A diskcache-compatible Cache instance.
+    """
+    if use_rust:
+        try:
+            from diskcache_rs import Cache as RustCache
+        except ImportError:
+            logger.warning("USE_RUST_CACHE is set but diskcache_rs is not installed; using diskcache")
+        else:
+            rust_dir = cache_dir.with_name(f"{cache_dir.name}-rs")
+            rust_dir.mkdir(parents=True, exist_ok=True)
+            rust_cache = RustCache(str(rust_dir))
+            if _supports_cache_api(rust_cache):
+                return rust_cache
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return Cache(str(cache_dir))
+
+
+@lru_cache(maxsize=4096)
+def _compute_key(ticker: str, collected_at: Optional[str]) -> str:
+    """
+    Build the cache key for a (ticker, collected_at) pair.
+
+    Memoized: the same pairs are looked up repeatedly (get, then set, then
+    the next request), and the key is a pure function of its arguments.
+    """
+    ticker = ticker.upper().strip()
+
+    if collected_at:
+        # Short hash of the collection timestamp; a 4-byte BLAKE2b digest
+        # is the 8 hex chars directly, with no oversized digest to slice
+        hash_str = _blake2b(collected_at.encode(), digest_size=4).hexdigest()
+        return f"{ticker}_{hash_str}"
+
+    return ticker
+
 
 class ExtractionCache:
     """
@@ -60,14 +157,12 @@ class ExtractionCache:
         if cache_dir is None:
             cache_dir = settings.cache_dir_resolved / "extractions"
 
-        # Ensure cache directory exists
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        self.cache = Cache(str(cache_dir))
+        self.cache = _open_cache(cache_dir, settings.USE_RUST_CACHE)
         logger.info(
-            "ExtractionCache initialized at %s with TTL=%d seconds",
-            cache_dir,
+            "ExtractionCache initialized at %s with TTL=%d seconds (%s)",
+            self.cache.directory,
             self.ttl,
+            type(self.cache).__module__.split(".")[0],
         )
 
     def get_cache_key(self, ticker: str, collected_at: Optional[str] = None) -> str:
@@ -89,14 +184,18 @@ class ExtractionCache:
             >>> cache.get_cache_key("AAPL", "2026-01-07T10:30:00")
             "AAPL_a1b2c3d4"
         """
-        ticker = ticker.upper().strip()
+        return _compute_key(ticker, collected_at)
 
-        if collected_at:
-            # Create a short hash of the collection timestamp
-            hash_str = hashlib.md5(collected_at.encode()).hexdigest()[:8]
-            return f"{ticker}_{hash_str}"
+    def _legacy_cache_key(self, ticker: str, collected_at: str) -> str:
+        """
+        Cache key in the previous MD5-based format.
 
-        return ticker
+        Entries written before the switch to BLAKE2b keys are still read
+        (and invalidated) through this key. They expire within one
+        EXTRACTION_CACHE_TTL, after which this fallback can be removed.
+        """
+        hash_str = hashlib.md5(collected_at.encode()).hexdigest()[:8]
+        return f"{ticker.upper().strip()}_{hash_str}"
 
     def get(
         self,
@@ -121,27 +220,37 @@ class ExtractionCache:
         try:
             cached_data = self.cache.get(cache_key)
 
+            if cached_data is None and collected_at and not self._legacy_invalidated(ticker):
+                cached_data = self.cache.get(self._legacy_cache_key(ticker, collected_at))
+
             if cached_data is None:
                 logger.debug("Cache miss for %s (key: %s)", ticker, cache_key)
                 return None
 
-            # Validate and deserialize the cached data
-            if isinstance(cached_data, dict):
+            # Pickled models from this schema version were validated when
+            # they were stored; dicts from older releases are re-validated
+            if isinstance(cached_data, tuple) and len(cached_data) == 2:
+                schema_tag, result = cached_data
+                if schema_tag != _SCHEMA_TAG or not isinstance(result, StandardizedValuationInput):
+                    logger.debug("Outdated cache entry for %s (key: %s)", ticker, cache_key)
+                    return None
+            elif isinstance(cached_data, dict):
                 result = StandardizedValuationInput.model_validate(cached_data)
-                logger.debug(
-                    "Cache hit for %s (key: %s, timestamp: %s)",
+            else:
+                logger.warning(
+                    "Invalid cached data type for %s: %s",
                     ticker,
-                    cache_key,
-                    result.extraction_timestamp,
+                    type(cached_data),
                 )
-                return result
+                return None
 
-            logger.warning(
-                "Invalid cached data type for %s: %s",
+            logger.debug(
+                "Cache hit for %s (key: %s, timestamp: %s)",
                 ticker,
-                type(cached_data),
+                cache_key,
+                result.extraction_timestamp,
             )
-            return None
+            return result
 
         except Exception as e:
             logger.warning(
@@ -166,15 +275,16 @@ class ExtractionCache:
             collected_at: Optional collection timestamp for cache key generation
 
         Note:
-            Data is serialized to dict for storage.
-            TTL is automatically applied from settings.
+            The model is pickled together with the schema tag, so hits
+            skip validation. TTL is automatically applied from settings.
         """
         cache_key = self.get_cache_key(ticker, collected_at)
 
         try:
-            # Serialize to dict for storage
-            cache_data = data.model_dump(mode="json")
-            self.cache.set(cache_key, cache_data, expire=self.ttl)
+            cache_data = (_SCHEMA_TAG, data)
+            with self.cache.transact():
+                self.cache.set(cache_key, cache_data, expire=self.ttl)
+                self._index_add(ticker, cache_key)
 
             logger.info(
                 "Cached extraction for %s (key: %s, TTL: %d seconds)",
@@ -205,6 +315,9 @@ class ExtractionCache:
 
         try:
             deleted = self.cache.delete(cache_key)
+            if collected_at:
+                deleted = self.cache.delete(self._legacy_cache_key(ticker, collected_at)) or deleted
+            self._index_discard(ticker, cache_key)
 
             if deleted:
                 logger.info("Invalidated cache for %s (key: %s)", ticker, cache_key)
@@ -239,16 +352,27 @@ class ExtractionCache:
         deleted_count = 0
 
         try:
-            # Iterate through all keys and delete those matching the ticker
-            for key in list(self.cache):
-                if isinstance(key, str) and key.startswith(f"{ticker}_"):
+            index = self.cache.pop(_INDEX_PREFIX + ticker)
+            if index is not None:
+                # Only this ticker's keys, no scan over the whole cache
+                for key in index:
                     if self.cache.delete(key):
                         deleted_count += 1
+            else:
+                # No index yet (entries written before it existed): scan
+                for key in list(self.cache):
+                    if isinstance(key, str) and key.startswith(f"{ticker}_"):
+                        if self.cache.delete(key):
+                            deleted_count += 1
 
             # Also delete the base key without timestamp
             if self.cache.delete(ticker):
                 deleted_count += 1
 
+            # Legacy keys are not indexed: turn off their read fallback for
+            # one TTL, by which time every entry written under them expired
+            self.cache.set(_LEGACY_INVALIDATED_PREFIX + ticker, True, expire=self.ttl)
+
             logger.info(
                 "Invalidated %d cache entries for %s",
                 deleted_count,
@@ -265,6 +389,30 @@ class ExtractionCache:
             )
             return deleted_count
 
+    def _legacy_invalidated(self, ticker: str) -> bool:
+        """Check whether invalidate_all disabled a ticker's legacy keys."""
+        return self.cache.get(_LEGACY_INVALIDATED_PREFIX + ticker.upper().strip()) is not None
+
+    def _index_add(self, ticker: str, cache_key: str) -> None:
+        """
+        Record a cache key in the ticker's index.
+
+        The index is stored in the cache itself, so every worker sharing the
+        cache directory sees it. It expires with the newest entry it lists.
+        Call inside a cache transaction.
+        """
+        index_key = _INDEX_PREFIX + ticker.upper().strip()
+        keys = self.cache.get(index_key) or frozenset()
+        self.cache.set(index_key, keys | {cache_key}, expire=self.ttl)
+
+    def _index_discard(self, ticker: str, cache_key: str) -> None:
+        """Remove a cache key from the ticker's index."""
+        index_key = _INDEX_PREFIX + ticker.upper().strip()
+        with self.cache.transact():
+            keys = self.cache.get(index_key)
+            if keys and cache_key in keys:
+                self.cache.set(index_key, keys - {cache_key}, expire=self.ttl)
+
     def get_stats(self) -> dict:
         """
         Get cache statistics.
@@ -8,10 +8,12 @@ This module provides functions to load and parse stock data from:
 
 import json
 import logging
+import sys
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
+import orjson
 import pandas as pd
 
 from app.config import get_settings
@@ -21,6 +23,9 @@ logger = logging.getLogger(__name__)
 # Maximum file size for JSON files (10MB) to prevent memory exhaustion
 MAX_JSON_FILE_SIZE = 10 * 1024 * 1024
 
+# Number of parsed stock JSON files kept in memory
+STOCK_JSON_CACHE_SIZE = 64
+
 settings = get_settings()
 
 
@@ -35,7 +40,9 @@ def load_summary_csv() -> List[Dict[str, Any]]:
     Load summary.csv as a list of dictionaries.
 
     Each row becomes a dictionary with column names as keys.
-    Handles NaN values by converting them to None.
+    Handles NaN values by converting them to None. The records are built
+    once per file version (keyed on the CSV's modification time and size)
+    and shared between callers, so they must not be modified in place.
 
     Returns:
         List of dictionaries, one per stock row.
@@ -48,52 +55,145 @@ def load_summary_csv() -> List[Dict[str, Any]]:
         >>> stocks[0]['ticker']
         'NVDA'
     """
+    return list(_load_summary_records(*_summary_csv_key()))
+
+
+def summary_csv_version() -> Tuple[int, int]:
+    """
+    Get the (mtime_ns, size) pair identifying the current summary.csv.
+
+    A single stat(), so callers can key their own caches on the file
+    version without loading it.
+
+    Returns:
+        Tuple of (mtime_ns, size) of summary.csv.
+
+    Raises:
+        DataLoadError: If the CSV file does not exist.
+    """
+    _, mtime_ns, size = _summary_csv_key()
+    return mtime_ns, size
+
+
+def _summary_csv_key() -> Tuple[str, int, int]:
+    """
+    Get the (path, mtime_ns, size) cache key for the current summary.csv.
+
+    One stat() call per request. The size guards against a rewrite that
+    lands within the filesystem's mtime granularity.
+
+    Raises:
+        DataLoadError: If the CSV file does not exist.
+    """
     csv_path = settings.csv_path_resolved
 
-    if not csv_path.exists():
+    try:
+        stat = csv_path.stat()
+    except FileNotFoundError:
         raise DataLoadError(f"Summary CSV not found at: {csv_path}")
 
-    try:
-        df = pd.read_csv(csv_path)
-
-        # Replace NaN/inf values with None for JSON serialization
-        import numpy as np
-        df = df.replace([np.nan, np.inf, -np.inf], None)
-
-        # Convert to list of dictionaries
-        records = df.to_dict(orient="records")
-
-        # Double-check for any remaining float NaN values and convert to None
-        # Also normalize debt_to_equity from percentage to ratio (yfinance returns %)
-        def sanitize_record(record: Dict[str, Any]) -> Dict[str, Any]:
-            sanitized = {}
-            for key, value in record.items():
-                if isinstance(value, float) and (pd.isna(value) or np.isinf(value)):
-                    sanitized[key] = None
-                # debt_to_equity from yfinance is in percentage (75.73 = 75.73%)
-                # Convert to ratio (0.7573) for consistency
-                elif key == "debt_to_equity" and value is not None:
-                    sanitized[key] = value / 100.0
-                else:
-                    sanitized[key] = value
-            return sanitized
-
-        records = [sanitize_record(r) for r in records]
-
-        return records
+    return str(csv_path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=1)
+def _load_summary_records(csv_path: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], ...]:
+    """Convert the parsed summary DataFrame to JSON-safe records."""
+    df = _read_summary_df(csv_path, mtime_ns, size)
+
+    # Replace NaN values with None for JSON serialization
+    records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+    return tuple(records)
+
+
+@lru_cache(maxsize=1)
+def _ticker_index(csv_path: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, Any]]:
+    """Map upper-case tickers to their summary records."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for record in _load_summary_records(csv_path, mtime_ns, size):
+        ticker = record.get("ticker")
+        if ticker:
+            # setdefault keeps the first row, as the linear scan did
+            index.setdefault(sys.intern(ticker.upper()), record)
+    return index
+
+
+@lru_cache(maxsize=4)
+def _unique_column_values(csv_path: str, mtime_ns: int, size: int, column: str) -> Tuple[str, ...]:
+    """Sorted distinct non-empty values of a summary.csv column."""
+    df = _read_summary_df(csv_path, mtime_ns, size)
+    if column not in df.columns:
+        return ()
+    values = df[column]
+    # Category columns already hold their distinct values, so skip the scan
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        distinct = values.cat.categories
+    else:
+        distinct = values.dropna().unique()
+    return tuple(sorted(value for value in distinct if value))
+
+
+def get_summary_df() -> pd.DataFrame:
+    """
+    Load summary.csv as a DataFrame, cached per file version.
+
+    The CSV is parsed once and reused until its modification time or size
+    changes. The returned DataFrame is shared between callers and must not
+    be modified in place. Sector and industry use the category dtype, inf
+    values are replaced with NaN and debt_to_equity is normalized from a
+    percentage to a ratio, matching load_summary_csv().
+
+    Returns:
+        DataFrame with one row per stock.
+
+    Raises:
+        DataLoadError: If the CSV file cannot be loaded.
+
+    Example:
+        >>> df = get_summary_df()
+        >>> df.loc[df["ticker"] == "AAPL", "market_cap"]
+    """
+    return _read_summary_df(*_summary_csv_key())
+
+
+@lru_cache(maxsize=1)
+def _read_summary_df(csv_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse summary.csv; mtime_ns and size are only part of the cache key."""
+    import numpy as np
+
+    if size == 0:
+        raise DataLoadError(f"Summary CSV is empty: {csv_path}")
 
+    try:
+        # pyarrow's multithreaded parser is faster than the C engine and
+        # parses floats exactly (the C engine can be off by one ulp)
+        df = pd.read_csv(
+            csv_path,
+            engine="pyarrow",
+            dtype={"ticker": str, "sector": "category", "industry": "category"},
+        )
     except pd.errors.EmptyDataError:
         raise DataLoadError(f"Summary CSV is empty: {csv_path}")
     except Exception as e:
         raise DataLoadError(f"Failed to load summary CSV: {e}") from e
 
+    df = df.replace([np.inf, -np.inf], np.nan)
+
+    # debt_to_equity from yfinance is in percentage (75.73 = 75.73%)
+    if "debt_to_equity" in df.columns:
+        df["debt_to_equity"] = pd.to_numeric(df["debt_to_equity"], errors="coerce") / 100.0
+
+    logger.info("Loaded summary CSV with %d rows", len(df))
+    return df
+
 
-@lru_cache(maxsize=32)
 def load_stock_json(ticker: str) -> Dict[str, Any]:
     """
     Load individual stock JSON file by ticker symbol.
 
-    Uses LRU cache to avoid repeated file reads for frequently accessed stocks.
+    Parsed files are kept in an LRU cache keyed on the file's modification
+    time and size, so frequently accessed stocks skip file reads and
+    updated files are picked up automatically. The returned dict is shared
+    between callers and must not be modified in place.
 
     Args:
         ticker: Stock ticker symbol (e.g., 'AAPL', 'NVDA').
@@ -109,31 +209,158 @@ def load_stock_json(ticker: str) -> Dict[str, Any]:
         >>> data['company_info']['name']
         'Apple Inc.'
     """
-    json_dir = settings.json_dir_resolved
-    json_path = json_dir / f"{ticker.upper()}.json"
+    return _read_stock_json(*_stock_json_key(ticker))
+
+
+def load_stock_json_bytes(ticker: str) -> bytes:
+    """
+    Load a stock's JSON data pre-serialized for HTTP responses.
+
+    The normalized data from load_stock_json() is encoded once per file
+    version with orjson and cached, so repeat requests skip re-serializing
+    the whole document. NaN and infinite values are encoded as null.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., 'AAPL', 'NVDA').
+
+    Returns:
+        UTF-8 encoded JSON object for the stock.
+
+    Raises:
+        DataLoadError: If the JSON file cannot be loaded or parsed.
+    """
+    return _encode_stock_json(*_stock_json_key(ticker))
+
+
+def load_stock_summary_bytes(ticker: str) -> bytes:
+    """
+    Load a stock's key-metrics summary pre-serialized for HTTP responses.
+
+    The summary (see summarize_stock_json) is built and encoded once per
+    file version, so repeat requests skip the nested lookups and encoding.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., 'AAPL', 'NVDA').
+
+    Returns:
+        UTF-8 encoded JSON object with the summary fields.
+
+    Raises:
+        DataLoadError: If the JSON file cannot be loaded or parsed.
+    """
+    return _encode_stock_summary(*_stock_json_key(ticker))
+
+
+def stock_json_etag(ticker: str) -> str:
+    """
+    Get a weak ETag identifying the current version of a stock's JSON file.
+
+    Derived from the file's mtime and size (a single stat), so conditional
+    requests can be answered without reading or encoding the data.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., 'AAPL', 'NVDA').
+
+    Returns:
+        Weak entity tag, e.g. 'W/"17a3f0c2b4e5d600-1f40"'.
+
+    Raises:
+        DataLoadError: If the JSON file does not exist or exceeds the size limit.
+    """
+    _, mtime_ns, size = _stock_json_key(ticker)
+    return f'W/"{mtime_ns:x}-{size:x}"'
+
 
-    if not json_path.exists():
+def summarize_stock_json(ticker: str, stock_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the key metrics of a stock's JSON data into a flat dictionary.
+
+    Args:
+        ticker: Upper-case stock ticker symbol.
+        stock_data: Parsed stock JSON data (see load_stock_json).
+
+    Returns:
+        Dictionary with key stock metrics.
+    """
+    company_info = stock_data.get("company_info", {})
+    market_data = stock_data.get("market_data", {})
+    valuation = stock_data.get("valuation", {})
+    calculated_metrics = stock_data.get("calculated_metrics", {})
+
+    return {
+        "ticker": ticker,
+        "company_name": company_info.get("name"),
+        "sector": company_info.get("sector"),
+        "industry": company_info.get("industry"),
+        "current_price": market_data.get("current_price"),
+        "market_cap": market_data.get("market_cap"),
+        "pe_ratio": valuation.get("pe_trailing"),
+        "forward_pe": valuation.get("pe_forward"),
+        "eps": valuation.get("eps_trailing"),
+        "dividend_yield": valuation.get("dividend_yield"),
+        "beta": market_data.get("beta"),
+        "fifty_two_week_high": market_data.get("52_week_high"),
+        "fifty_two_week_low": market_data.get("52_week_low"),
+        "enterprise_value": calculated_metrics.get("calc_ev"),
+        "ev_to_ebitda": calculated_metrics.get("calc_ev_to_ebitda"),
+        "free_cash_flow": calculated_metrics.get("calc_fcf"),
+        "roic": calculated_metrics.get("calc_roic"),
+        "collected_at": stock_data.get("collected_at"),
+    }
+
+
+def _stock_json_key(ticker: str) -> Tuple[str, int, int]:
+    """
+    Get the (path, mtime_ns, size) cache key for a stock's JSON file.
+
+    The size guards against a rewrite within the mtime granularity, as for
+    summary.csv.
+
+    Raises:
+        DataLoadError: If the file does not exist or exceeds the size limit.
+    """
+    json_path = settings.json_dir_resolved / f"{ticker.upper()}.json"
+
+    try:
+        stat = json_path.stat()
+    except FileNotFoundError:
         raise DataLoadError(f"Stock JSON not found for ticker: {ticker}")
 
     # Check file size to prevent memory exhaustion from malformed/large files
-    file_size = json_path.stat().st_size
-    if file_size > MAX_JSON_FILE_SIZE:
+    if stat.st_size > MAX_JSON_FILE_SIZE:
         logger.warning(
             "JSON file for %s exceeds size limit: %d bytes (max: %d)",
-            ticker, file_size, MAX_JSON_FILE_SIZE
+            ticker, stat.st_size, MAX_JSON_FILE_SIZE
         )
         raise DataLoadError(
-            f"JSON file for ticker {ticker} exceeds maximum size limit ({file_size} > {MAX_JSON_FILE_SIZE} bytes)"
+            f"JSON file for ticker {ticker} exceeds maximum size limit ({stat.st_size} > {MAX_JSON_FILE_SIZE} bytes)"
         )
 
+    return str(json_path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=STOCK_JSON_CACHE_SIZE)
+def _read_stock_json(json_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a stock JSON file; mtime_ns and size are only part of the cache key."""
+    ticker = Path(json_path).stem
+
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = Path(json_path).read_bytes()
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dump writes by
+            # default; the stdlib parser still reads such files
+            data = json.loads(raw)
 
         # Normalize debt_to_equity from percentage to ratio (yfinance returns %)
-        # Check in valuation section where yfinance data is stored
-        if "valuation" in data and data["valuation"].get("debt_to_equity") is not None:
-            data["valuation"]["debt_to_equity"] = data["valuation"]["debt_to_equity"] / 100.0
+        # Check in valuation section where yfinance data is stored. Division
+        # rather than * 0.01 keeps the value identical to the CSV's.
+        valuation = data.get("valuation")
+        if valuation is not None:
+            debt_to_equity = valuation.get("debt_to_equity")
+            if debt_to_equity is not None:
+                valuation["debt_to_equity"] = debt_to_equity / 100.0
 
         return data
 
@@ -143,12 +370,34 @@ def load_stock_json(ticker: str) -> Dict[str, Any]:
         raise DataLoadError(f"Failed to load JSON for ticker {ticker}: {e}") from e
 
 
+# Encoded bodies are much smaller than parsed dicts, so more of them are kept
+@lru_cache(maxsize=128)
+def _encode_stock_json(json_path: str, mtime_ns: int, size: int) -> bytes:
+    """Serialize a parsed stock JSON file for responses."""
+    data = _read_stock_json(json_path, mtime_ns, size)
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError as e:
+        raise DataLoadError(
+            f"Failed to serialize JSON for ticker {Path(json_path).stem}: {e}"
+        ) from e
+
+
+# Summaries are a few hundred bytes each, so every ticker fits
+@lru_cache(maxsize=1024)
+def _encode_stock_summary(json_path: str, mtime_ns: int, size: int) -> bytes:
+    """Build and serialize the key-metrics summary of a stock JSON file."""
+    data = _read_stock_json(json_path, mtime_ns, size)
+    return orjson.dumps(summarize_stock_json(Path(json_path).stem, data))
+
+
 def get_available_tickers() -> List[str]:
     """
     List all available stock tickers from JSON directory.
 
     Scans the JSON directory for .json files and extracts ticker symbols
-    from filenames.
+    from filenames. The scan is cached until the directory's modification
+    time changes (i.e. files are added, removed or renamed).
 
     Returns:
         Sorted list of available ticker symbols.
@@ -161,24 +410,103 @@ def get_available_tickers() -> List[str]:
         >>> tickers
         ['AAPL', 'AMZN', 'AVGO', 'BRK-B', 'GOOGL', 'LLY', 'META', 'MSFT', 'NVDA', 'TSLA']
     """
+    return list(_scan_tickers(*_json_dir_key()))
+
+
+def _json_dir_key() -> Tuple[str, int]:
+    """
+    Get the (path, mtime_ns) cache key for the JSON directory.
+
+    A single stat() per call; the directory's mtime changes whenever files
+    are added, removed or renamed.
+
+    Raises:
+        DataLoadError: If the JSON directory doesn't exist.
+    """
     json_dir = settings.json_dir_resolved
 
-    if not json_dir.exists():
+    try:
+        stat = json_dir.stat()
+    except FileNotFoundError:
         raise DataLoadError(f"JSON directory not found: {json_dir}")
 
+    return str(json_dir), stat.st_mtime_ns
+
+
+@lru_cache(maxsize=1)
+def _scan_tickers(json_dir: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Glob the JSON directory; mtime_ns is only part of the cache key."""
     tickers = []
-    for json_file in json_dir.glob("*.json"):
+    for json_file in Path(json_dir).glob("*.json"):
         # Extract ticker from filename (e.g., "AAPL.json" -> "AAPL")
         ticker = json_file.stem
         tickers.append(ticker)
 
-    return sorted(tickers)
+    return tuple(sorted(tickers))
+
+
+def get_available_tickers_set() -> FrozenSet[str]:
+    """
+    Get available tickers as a cached frozenset for O(1) membership checks.
+
+    The set is rebuilt only when the JSON directory's modification time
+    changes (files added, removed or renamed), so repeat requests reuse it.
+
+    Returns:
+        Frozenset of available ticker symbols.
+
+    Raises:
+        DataLoadError: If the JSON directory doesn't exist.
+
+    Example:
+        >>> "AAPL" in get_available_tickers_set()
+        True
+    """
+    return _ticker_set(*_json_dir_key())
+
+
+@lru_cache(maxsize=1)
+def _ticker_set(json_dir: str, mtime_ns: int) -> FrozenSet[str]:
+    """Interned frozenset of the tickers found by _scan_tickers()."""
+    return frozenset(sys.intern(ticker) for ticker in _scan_tickers(json_dir, mtime_ns))
+
+
+def canonical_ticker(ticker: str) -> str:
+    """
+    Normalize a ticker to its upper-case, trimmed, interned form.
+
+    Tickers from the frontend are almost always canonical already, so the
+    upper()/strip() copies are skipped when they would be no-ops. Interning
+    lets popular symbols share one string object with the entries of
+    get_available_tickers_set(), so membership checks hit the identity
+    fast path.
+
+    Args:
+        ticker: Raw ticker symbol from a request.
+
+    Returns:
+        Canonical ticker symbol.
+
+    Example:
+        >>> canonical_ticker(" brk-b ")
+        'BRK-B'
+    """
+    if (
+        not ticker.isupper()
+        or ticker[:1].isspace()
+        or ticker[-1:].isspace()
+    ):
+        ticker = ticker.upper().strip()
+    return sys.intern(ticker)
 
 
 def get_stock_by_ticker(ticker: str, stocks: Optional[List[Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
     """
     Find a stock in the summary data by ticker symbol.
 
+    Without a pre-loaded list the lookup uses a ticker index built once per
+    summary.csv version, so it is a single dict lookup.
+
     Args:
         ticker: Stock ticker symbol to search for.
         stocks: Optional pre-loaded list of stocks. If None, loads from CSV.
@@ -192,7 +520,7 @@ def get_stock_by_ticker(ticker: str, stocks: Optional[List[Dict[str, Any]]] = No
         'Apple Inc.'
     """
     if stocks is None:
-        stocks = load_summary_csv()
+        return _ticker_index(*_summary_csv_key()).get(ticker.upper())
 
     ticker_upper = ticker.upper()
     for stock in stocks:
@@ -207,7 +535,8 @@ def get_unique_sectors(stocks: Optional[List[Dict[str, Any]]] = None) -> List[st
     Get list of unique sectors from stock data.
 
     Args:
-        stocks: Optional pre-loaded list of stocks. If None, loads from CSV.
+        stocks: Optional pre-loaded list of stocks. If None, uses the
+            cached summary CSV.
 
     Returns:
         Sorted list of unique sector names.
@@ -218,7 +547,7 @@ def get_unique_sectors(stocks: Optional[List[Dict[str, Any]]] = None) -> List[st
         True
     """
     if stocks is None:
-        stocks = load_summary_csv()
+        return list(_unique_column_values(*_summary_csv_key(), "sector"))
 
     sectors = set()
     for stock in stocks:
@@ -234,7 +563,8 @@ def get_unique_industries(stocks: Optional[List[Dict[str, Any]]] = None) -> List
     Get list of unique industries from stock data.
 
     Args:
-        stocks: Optional pre-loaded list of stocks. If None, loads from CSV.
+        stocks: Optional pre-loaded list of stocks. If None, uses the
+            cached summary CSV.
 
     Returns:
         Sorted list of unique industry names.
@@ -245,7 +575,7 @@ def get_unique_industries(stocks: Optional[List[Dict[str, Any]]] = None) -> List
         True
     """
     if stocks is None:
-        stocks = load_summary_csv()
+        return list(_unique_column_values(*_summary_csv_key(), "industry"))
 
     industries = set()
     for stock in stocks:
@@ -268,19 +598,57 @@ def get_column_names() -> List[str]:
         >>> 'ticker' in columns
         True
     """
-    csv_path = settings.csv_path_resolved
+    return get_summary_df().columns.tolist()
 
-    if not csv_path.exists():
-        raise DataLoadError(f"Summary CSV not found at: {csv_path}")
 
-    df = pd.read_csv(csv_path, nrows=0)
-    return df.columns.tolist()
+def warm_caches() -> int:
+    """
+    Load summary.csv, the ticker set and the stock JSON files into their caches.
+
+    Meant for application startup, so the first requests do not pay for the
+    CSV parse, the directory scan or the JSON reads. At most
+    STOCK_JSON_CACHE_SIZE stock files are loaded; files that fail to load
+    are skipped and left for requests to report.
+
+    Returns:
+        Number of stock JSON files loaded.
+
+    Raises:
+        DataLoadError: If summary.csv or the JSON directory cannot be loaded.
+    """
+    load_summary_csv()
+    _ticker_index(*_summary_csv_key())
+    get_available_tickers_set()
+
+    loaded = 0
+    for ticker in get_available_tickers()[:STOCK_JSON_CACHE_SIZE]:
+        try:
+            load_stock_json(ticker)
+        except DataLoadError as e:
+            logger.warning("Skipping %s while warming caches: %s", ticker, e)
+            continue
+        loaded += 1
+    return loaded
 
 
 def clear_json_cache() -> None:
     """
-    Clear the LRU cache for stock JSON files.
+    Clear the LRU caches for stock JSON files.
+
+    Updated files are picked up automatically through their modification
+    time and size; call this to free the cached data or force a reload.
+    """
+    _read_stock_json.cache_clear()
+    _encode_stock_json.cache_clear()
+    _encode_stock_summary.cache_clear()
+
+
+def clear_ticker_cache() -> None:
+    """
+    Clear the cached ticker list and set.
 
-    Call this if JSON files are updated and need to be reloaded.
+    Changes to the JSON directory are picked up automatically through its
+    modification time; call this to force a rescan regardless.
     """
-    load_stock_json.cache_clear()
+    _scan_tickers.cache_clear()
+    _ticker_set.cache_clear()
@@ -0,0 +1,48 @@
+"""
+Shared Google Gemini SDK configuration.
+
+genai.configure() rebuilds the SDK's client manager, dropping any cached
+clients and their connections. Both AI services call configure_gemini()
+instead, so the SDK is configured once per process and every model shares
+the same long-lived gRPC (HTTP/2) channel instead of setting up new
+connections.
+
+Also holds helpers shared by both services for parsing Gemini responses.
+"""
+
+import logging
+from functools import lru_cache
+
+import google.generativeai as genai
+from pydantic import ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def configure_gemini(api_key: str) -> None:
+    """
+    Configure the Gemini SDK once for the given API key.
+
+    Args:
+        api_key: Google AI (Gemini) API key
+    """
+    genai.configure(api_key=api_key, transport="grpc")
+    logger.info("Gemini SDK configured (transport=grpc)")
+
+
+def is_json_syntax_error(exc: ValidationError) -> bool:
+    """
+    Check whether a model_validate_json() error is malformed JSON.
+
+    pydantic-core reports JSON syntax errors as a json_invalid validation
+    error, so they can be told apart from schema errors and retried after
+    the response text is repaired.
+
+    Args:
+        exc: ValidationError raised by model_validate_json()
+
+    Returns:
+        True if the input was not valid JSON.
+    """
+    return any(error["type"] == "json_invalid" for error in exc.errors(include_url=False))
@@ -0,0 +1,100 @@
+"""
+Translation of service exceptions into HTTP errors for the API routers.
+
+Each router keeps its own table of exception type -> (status code, detail
+template) and wraps it in an HTTPErrorMap. The table is looked up along
+the exception's MRO so the most specific subclass wins, and the result is
+memoized per exception type; anything unmapped becomes the fallback 500.
+
+Usage:
+    _errors = HTTPErrorMap(
+        {DataNotFoundError: (404, "Stock data not found for ticker: {ticker}")},
+        unexpected=(500, "An unexpected error occurred: {e}"),
+        context="valuation",
+        logger=logger,
+    )
+
+    raise _errors.to_http(e, ticker) from e
+"""
+
+import functools
+import logging
+from typing import Mapping, Optional, Tuple, Type
+
+from fastapi import HTTPException, status
+
+# (status code, detail template); templates may use {ticker} and {e}
+ErrorSpec = Tuple[int, str]
+
+
+class HTTPErrorMap:
+    """
+    Maps service exceptions to HTTPExceptions for one router.
+
+    Attributes:
+        context: What the router was doing, used in log messages
+    """
+
+    def __init__(
+        self,
+        table: Mapping[Type[BaseException], ErrorSpec],
+        unexpected: ErrorSpec,
+        context: str,
+        logger: logging.Logger,
+    ) -> None:
+        """
+        Initialize the map.
+
+        Args:
+            table: Exception type -> (status code, detail template)
+            unexpected: Fallback for exceptions not in the table
+            context: What the router was doing, used in log messages
+            logger: Router logger the translated errors are logged to
+        """
+        self.context = context
+        self._table = dict(table)
+        self._unexpected = unexpected
+        self._logger = logger
+        # Resolve each exception type against the table only once
+        self._resolve = functools.lru_cache(maxsize=64)(self._lookup)
+
+    def _lookup(self, exc_type: Type[BaseException]) -> Optional[ErrorSpec]:
+        """Find the table entry of the closest mapped class in exc_type's MRO."""
+        return next(
+            (self._table[cls] for cls in exc_type.__mro__ if cls in self._table),
+            None,
+        )
+
+    def to_http(self, e: Exception, ticker: str) -> HTTPException:
+        """
+        Translate an exception into an HTTPException and log it.
+
+        Args:
+            e: Exception raised while handling the request
+            ticker: Ticker symbol the request was for
+
+        Returns:
+            HTTPException with the mapped status code and detail message;
+            HTTPExceptions are returned unchanged.
+        """
+        if isinstance(e, HTTPException):
+            return e
+
+        mapped = self._resolve(type(e))
+
+        if mapped is None:
+            # exc_info=e: also called outside except blocks (e.g. gathered outcomes)
+            self._logger.error(
+                "Unexpected error in %s for %s", self.context, ticker, exc_info=e
+            )
+            mapped = self._unexpected
+        elif mapped[0] == status.HTTP_404_NOT_FOUND:
+            self._logger.warning("%s in %s for %s: %s", type(e).__name__, self.context, ticker, e)
+        else:
+            self._logger.error("%s in %s for %s: %s", type(e).__name__, self.context, ticker, e)
+
+        status_code, template = mapped
+        return HTTPException(
+            status_code=status_code,
+            detail=template.format(ticker=ticker, e=e),
+        )
@@ -0,0 +1,357 @@
+"""
+Rate limiting for API endpoints.
+
+This module provides a single app-wide TokenBucketLimiter and the
+RateLimitMiddleware that enforces it. Each limited route is one
+RateLimitRule with its own replenish rate and bucket capacity, while all
+buckets live in the shared limiter keyed by "{scope}:{client_ip}".
+
+When REDIS_URL is set the buckets live in Redis instead
+(RedisTokenBucketLimiter), so the limits hold across all workers. Each
+check there is one EVALSHA of a Lua script that refills and takes a
+token atomically, i.e. a single round trip with no read-then-write race.
+
+Rules with charge_on_miss=True do not take a token up front. The
+middleware only records the pending charge, and the endpoint's cache
+layer takes it with charge_rate_limit() once the request misses the
+cache, so cached hits and 304 revalidations cost no quota.
+
+Usage:
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules=[
+            RateLimitRule("GET", re.compile(r"^/api/v1/stocks/[^/]+/analysis$"),
+                          "analysis", replenish_rate=10 / 60, bucket_capacity=10),
+        ],
+    )
+"""
+
+import logging
+import math
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, NamedTuple, Optional, Pattern, Sequence, Tuple, Union
+
+from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class TokenBucketLimiter:
+    """
+    In-memory token bucket store shared by all rate-limited endpoints.
+
+    Buckets are stored as {key: (tokens, last_refill)} and refilled lazily
+    on access, so a check is a single dict lookup plus a few float ops.
+    acquire() never suspends, which makes it atomic on the event loop and
+    removes the need for a lock.
+
+    Attributes:
+        max_keys: Bucket count above which idle buckets are pruned
+        idle_seconds: Time without requests after which a bucket is idle
+    """
+
+    def __init__(self, max_keys: int = 10_000, idle_seconds: float = 3600.0) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            max_keys: Number of tracked buckets above which idle buckets
+                     are pruned to bound memory usage.
+            idle_seconds: Time without requests after which a bucket is
+                         considered refilled and can be dropped.
+        """
+        self.max_keys = max_keys
+        self.idle_seconds = idle_seconds
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    async def acquire(
+        self,
+        key: str,
+        replenish_rate: float,
+        bucket_capacity: int,
+    ) -> Optional[float]:
+        """
+        Try to take one token from the bucket for a key.
+
+        Args:
+            key: Bucket key (scope and client identifier)
+            replenish_rate: Tokens added per second
+            bucket_capacity: Maximum tokens the bucket can hold
+
+        Returns:
+            None if the request is allowed, otherwise the number of
+            seconds until a token becomes available.
+        """
+        now = time.monotonic()
+        tokens, last_refill = self._buckets.get(key, (float(bucket_capacity), now))
+
+        tokens = min(bucket_capacity, tokens + (now - last_refill) * replenish_rate)
+
+        if tokens < 1.0:
+            self._buckets[key] = (tokens, now)
+            return (1.0 - tokens) / replenish_rate
+
+        self._buckets[key] = (tokens - 1.0, now)
+
+        if len(self._buckets) > self.max_keys:
+            self._prune(now)
+
+        return None
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets of clients that have been idle for idle_seconds."""
+        stale = [
+            key for key, (_, last_refill) in self._buckets.items()
+            if now - last_refill >= self.idle_seconds
+        ]
+        for key in stale:
+            del self._buckets[key]
+
+        logger.debug("Pruned %d idle rate limit buckets", len(stale))
+
+    def reset(self) -> None:
+        """Clear all buckets."""
+        self._buckets.clear()
+
+
+# Refills and takes one token from the {tokens, ts} hash at KEYS[1].
+# ARGV: replenish rate (tokens/second), bucket capacity. Uses the server
+# clock so all workers agree on time. Returns the retry-after seconds as a
+# string (Lua numbers are truncated to integers in replies); "0" = allowed.
+_TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local retry_after = 0
+if tokens < 1 then
+    retry_after = (1 - tokens) / rate
+else
+    tokens = tokens - 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return tostring(retry_after)
+"""
+
+
+class RedisTokenBucketLimiter:
+    """
+    Token bucket store in Redis, shared by all workers.
+
+    Same bucket semantics as TokenBucketLimiter. Keys expire once a bucket
+    would be full again, so idle clients need no pruning. If Redis is
+    unreachable the request is allowed (fail open) and a warning logged,
+    so an outage of the limiter store never takes the API down with it.
+
+    Attributes:
+        key_prefix: Prefix for all bucket keys in Redis
+    """
+
+    def __init__(self, redis_url: str, key_prefix: str = "ratelimit:") -> None:
+        """
+        Initialize the limiter and register the Lua script.
+
+        The script is registered once; redis-py sends it by SHA (EVALSHA)
+        and only falls back to the full text if the server lost it.
+
+        Args:
+            redis_url: Redis connection URL
+            key_prefix: Prefix for all bucket keys in Redis
+        """
+        import redis.asyncio as redis
+
+        self.key_prefix = key_prefix
+        self._redis = redis.from_url(redis_url)
+        self._script = self._redis.register_script(_TOKEN_BUCKET_LUA)
+
+    async def acquire(
+        self,
+        key: str,
+        replenish_rate: float,
+        bucket_capacity: int,
+    ) -> Optional[float]:
+        """
+        Try to take one token from the bucket for a key.
+
+        Args:
+            key: Bucket key (scope and client identifier)
+            replenish_rate: Tokens added per second
+            bucket_capacity: Maximum tokens the bucket can hold
+
+        Returns:
+            None if the request is allowed, otherwise the number of
+            seconds until a token becomes available.
+        """
+        try:
+            reply: Any = await self._script(
+                keys=[self.key_prefix + key],
+                args=[replenish_rate, bucket_capacity],
+            )
+        except Exception as e:
+            logger.warning("Rate limit check failed for %s, allowing: %s", key, e)
+            return None
+
+        retry_after = float(reply)
+        return retry_after if retry_after > 0 else None
+
+
+def create_limiter() -> Union[TokenBucketLimiter, RedisTokenBucketLimiter]:
+    """
+    Create the bucket store configured from settings.
+
+    Returns:
+        RedisTokenBucketLimiter when REDIS_URL is set, so every worker
+        shares one bucket per client and scope; otherwise an in-process
+        TokenBucketLimiter (development, single worker).
+    """
+    if settings.REDIS_URL:
+        logger.info("Rate limiter storage: redis")
+        return RedisTokenBucketLimiter(settings.REDIS_URL)
+
+    logger.info("Rate limiter storage: memory")
+    return TokenBucketLimiter()
+
+
+# Shared limiter instance for all routers
+limiter = create_limiter()
+
+
+class RateLimitRule(NamedTuple):
+    """
+    Token bucket limit for the requests matching one route pattern.
+
+    Attributes:
+        method: HTTP method the rule applies to
+        pattern: Compiled regex matched against the full request path
+        scope: Name of the limited endpoint group (part of the bucket key)
+        replenish_rate: Tokens added per second (e.g. 10 / 60 for 10/minute)
+        bucket_capacity: Maximum burst size
+        charge_on_miss: Only take a token when the endpoint calls
+            charge_rate_limit(), i.e. on a cache miss. Set this only for
+            endpoints that call it, or their requests are never limited.
+    """
+
+    method: str
+    pattern: Pattern[str]
+    scope: str
+    replenish_rate: float
+    bucket_capacity: int
+    charge_on_miss: bool = False
+
+
+# (bucket key, rule) of the current request's deferred token, if any
+_pending_charge: ContextVar[Optional[Tuple[str, RateLimitRule]]] = ContextVar(
+    "rate_limit_pending_charge", default=None
+)
+
+
+def _limit_exceeded_detail(rule: RateLimitRule) -> str:
+    """Error message for requests over a rule's limit."""
+    return (
+        f"Rate limit exceeded: {rule.bucket_capacity} per "
+        f"{round(rule.bucket_capacity / rule.replenish_rate)} seconds"
+    )
+
+
+async def charge_rate_limit() -> None:
+    """
+    Take the deferred token of the current request.
+
+    Called by cache layers once a request misses the cache. A no-op for
+    requests without a pending charge (no charge_on_miss rule matched, or
+    the token was already taken), so it may be called unconditionally.
+
+    Raises:
+        HTTPException: 429 with a Retry-After header if over the limit
+    """
+    pending = _pending_charge.get()
+    if pending is None:
+        return
+    _pending_charge.set(None)
+
+    key, rule = pending
+    retry_after = await limiter.acquire(key, rule.replenish_rate, rule.bucket_capacity)
+    if retry_after is None:
+        return
+
+    logger.warning("Rate limit exceeded for %s", key)
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=_limit_exceeded_detail(rule),
+        headers={"Retry-After": str(math.ceil(retry_after))},
+    )
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware enforcing per-client token bucket limits.
+
+    Matches each HTTP request against the rule table once, before routing,
+    and answers over-limit requests with 429 without reaching the app.
+    For charge_on_miss rules the token is left to charge_rate_limit().
+    Requests matching no rule pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp, rules: Sequence[RateLimitRule]) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            rules: Limits to enforce; the first rule matching a request applies
+        """
+        self.app = app
+        self.rules = tuple(rules)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Take a token for matching requests or reply with 429."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        rule = next(
+            (r for r in self.rules if r.method == method and r.pattern.match(path)),
+            None,
+        )
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope["client"][0] if scope.get("client") else "127.0.0.1"
+        key = f"{rule.scope}:{client}"
+
+        if rule.charge_on_miss:
+            token = _pending_charge.set((key, rule))
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                _pending_charge.reset(token)
+            return
+
+        retry_after = await limiter.acquire(key, rule.replenish_rate, rule.bucket_capacity)
+
+        if retry_after is None:
+            await self.app(scope, receive, send)
+            return
+
+        logger.warning("Rate limit exceeded for %s on %s", client, rule.scope)
+        response = ORJSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": _limit_exceeded_detail(rule)},
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,84 @@
+"""
+Non-blocking logging setup for the application.
+
+Log records emitted on the event loop are pushed onto an in-process queue
+by a QueueHandler, and a QueueListener thread does the formatting (including
+exception tracebacks) and writing. A logger.exception() call in a request
+handler then costs a queue put instead of synchronous traceback formatting
+and a blocking write to stderr.
+
+Usage:
+    setup_logging()     # on application startup
+    shutdown_logging()  # on application shutdown, flushes pending records
+"""
+
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from app.config import get_settings
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves exception formatting to the listener thread.
+
+    The stock prepare() formats the whole record (traceback included) in the
+    calling thread so it can be pickled. Records here never leave the
+    process, so only the message is resolved eagerly (to snapshot mutable
+    args) and exc_info is passed through untouched.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message and hand the record over as-is."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logging() -> None:
+    """
+    Route root logger output through a background QueueListener.
+
+    Uses DEBUG level when settings.DEBUG is enabled, INFO otherwise. Safe to
+    call more than once; later calls are no-ops while a listener is running.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    settings = get_settings()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+    root = logging.getLogger()
+    root.handlers = [_DeferredQueueHandler(log_queue)]
+    root.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the listener thread after it has written all queued records.
+
+    The listener's handlers are attached to the root logger directly, so
+    anything logged after shutdown is still written (synchronously).
+    """
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    logging.getLogger().handlers = list(_listener.handlers)
+    _listener = None
@@ -0,0 +1,84 @@
+"""
+Lightweight in-process metrics counters.
+
+Counters are incremented from both the event loop and threadpool
+workers, so each counter guards its values with a lock; `+=` on a shared
+int is a read-modify-write and would drop increments under contention.
+The critical section is a single dict update, so contention stays cheap.
+
+Usage:
+    CACHE_HIT.inc("analysis")
+    text = render_prometheus()  # served at GET /metrics
+"""
+
+import threading
+from typing import Dict, List
+
+
+class Counter:
+    """
+    Monotonic counter with one value per label (e.g. endpoint name).
+
+    Attributes:
+        name: Metric name in the Prometheus exposition
+        description: Help text for the metric
+    """
+
+    def __init__(self, name: str, description: str) -> None:
+        """
+        Initialize the counter.
+
+        Args:
+            name: Metric name in the Prometheus exposition
+            description: Help text for the metric
+        """
+        self.name = name
+        self.description = description
+        self._values: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, label: str) -> None:
+        """
+        Increment the counter for a label by one.
+
+        Args:
+            label: Label value (e.g. the endpoint being counted)
+        """
+        with self._lock:
+            self._values[label] = self._values.get(label, 0) + 1
+
+    def values(self) -> Dict[str, int]:
+        """Snapshot the value of every label."""
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self) -> None:
+        """Clear all values."""
+        with self._lock:
+            self._values.clear()
+
+
+CACHE_HIT = Counter("cache_hit_total", "Requests answered from cache")
+CACHE_MISS = Counter("cache_miss_total", "Requests that missed the cache")
+SINGLE_FLIGHT_COALESCE = Counter(
+    "single_flight_coalesce_total",
+    "Calls that joined an in-flight computation instead of starting one",
+)
+
+_COUNTERS = (CACHE_HIT, CACHE_MISS, SINGLE_FLIGHT_COALESCE)
+
+
+def render_prometheus() -> str:
+    """
+    Render all counters in the Prometheus text exposition format.
+
+    Returns:
+        Exposition text with one sample per counter label.
+    """
+    lines: List[str] = []
+    for counter in _COUNTERS:
+        lines.append(f"# HELP {counter.name} {counter.description}")
+        lines.append(f"# TYPE {counter.name} counter")
+        for label, value in sorted(counter.values().items()):
+            lines.append(f'{counter.name}{{endpoint="{label}"}} {value}')
+    return "\n".join(lines) + "\n"
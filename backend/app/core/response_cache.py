@@ -0,0 +1,438 @@
+"""
+In-process response caching for slow-changing public endpoints.
+
+The cached_response decorator stores the serialized body (JSON by default)
+of an endpoint's return value, keyed on the endpoint and its arguments. While an
+entry is fresh, requests are answered with the stored bytes without running
+the handler or re-validating and re-serializing the response model.
+
+Cached bodies are also kept compressed (computed on first use, per
+encoding), so repeat hits skip per-request compression in GZipMiddleware.
+Brotli is preferred when the client accepts it and the optional brotli
+package is installed; otherwise gzip is used.
+
+Each cached body carries an ETag (a hash of the body). Requests whose
+If-None-Match header matches it get an empty 304 Not Modified, so polling
+clients with unchanged data receive no body at all.
+
+Rate limit rules with charge_on_miss=True are charged here on a miss only,
+so cached hits and 304s do not count against the client's quota.
+
+Only public, unauthenticated routes should be cached: the key is built from
+the endpoint arguments alone (or the subset selected with key_args).
+
+The cache lives in each worker process and is not shared. invalidate_response
+only drops the entry of the calling worker, so other workers keep serving
+their copy until it expires: choose an expire that is an acceptable
+staleness bound when running several workers (see VALUATION_RESPONSE_TTL).
+
+Usage:
+    @router.get("/market/status", response_model=MarketStatusResponse)
+    @cached_response(expire=30, namespace="market_status")
+    async def get_market_status() -> MarketStatusResponse:
+        ...
+"""
+
+import functools
+import gzip
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, TypeVar, Union
+
+import pydantic_core
+from fastapi import Response
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
+
+from app.core.limits import charge_rate_limit
+from app.core.metrics import CACHE_HIT, CACHE_MISS
+
+try:
+    import brotli
+except ImportError:  # optional; cached bodies are then sent as gzip only
+    brotli = None
+
+# Default maximum number of cached responses kept per namespace
+MAX_ENTRIES = 256
+
+# Bodies smaller than this are sent uncompressed (matches GZipMiddleware)
+GZIP_MINIMUM_SIZE = 500
+
+# gzip level for cached bodies; compressed once per entry, so favor ratio
+GZIP_COMPRESS_LEVEL = 9
+
+# Brotli quality for cached bodies; 9 is well ahead of gzip -9 on JSON while
+# 10-11 cost an order of magnitude more CPU for a few percent
+BROTLI_QUALITY = 9
+
+T = TypeVar("T")
+Expire = Union[int, Callable[[Dict[str, Any]], int]]
+KeyArgs = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+# Browsers send a handful of distinct Accept-Encoding values, so parse each once
+@functools.lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> FrozenSet[str]:
+    """Content codings listed in an Accept-Encoding header (q=0 excluded)."""
+    codings = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                pass
+        codings.add(coding.strip().lower())
+    return frozenset(codings)
+
+
+def body_etag(body: bytes) -> str:
+    """
+    Compute the weak entity tag of a serialized body.
+
+    Args:
+        body: Serialized response body
+
+    Returns:
+        A W/"..." ETag that changes whenever the body does.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an entity tag.
+
+    Uses the weak comparison required for If-None-Match, so W/ prefixes are
+    ignored on both sides.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current entity tag of the resource
+
+    Returns:
+        True if the client's cached copy is still current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+class CachedBody:
+    """
+    A cached response body with its lazily computed compressed encodings.
+
+    Attributes:
+        body: Serialized body
+        expires_at: time.monotonic() deadline after which the entry is stale
+        etag: Weak entity tag derived from the body
+    """
+
+    __slots__ = ("body", "expires_at", "etag", "_gzipped", "_brotli")
+
+    def __init__(self, body: bytes, expires_at: float) -> None:
+        """
+        Initialize the entry.
+
+        Args:
+            body: Serialized body
+            expires_at: time.monotonic() deadline for the entry
+        """
+        self.body = body
+        self.expires_at = expires_at
+        self.etag = body_etag(body)
+        self._gzipped: Optional[bytes] = None
+        self._brotli: Optional[bytes] = None
+
+    def gzipped(self) -> bytes:
+        """Get the gzip-compressed body, compressing it on first use."""
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=GZIP_COMPRESS_LEVEL)
+        return self._gzipped
+
+    def brotli_compressed(self) -> bytes:
+        """Get the Brotli-compressed body, compressing it on first use."""
+        if self._brotli is None:
+            self._brotli = brotli.compress(
+                self.body, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY
+            )
+        return self._brotli
+
+
+class CachedBodyResponse(Response):
+    """
+    Response for a cached body that sends the pre-compressed encoding.
+
+    The encoding is chosen when the response is sent, from the request's
+    Accept-Encoding header: br if accepted and available, else gzip.
+    Setting Content-Encoding makes GZipMiddleware pass the body through
+    untouched. A matching If-None-Match header turns the response into an
+    empty 304.
+    """
+
+    def __init__(
+        self,
+        entry: CachedBody,
+        media_type: str,
+        cache_control: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the response.
+
+        Args:
+            entry: Cached body to send
+            media_type: Content type of the body
+            cache_control: Cache-Control header value, sent on 200 and 304
+        """
+        super().__init__(content=entry.body, media_type=media_type)
+        self._entry = entry
+        if cache_control is not None:
+            self.headers["Cache-Control"] = cache_control
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send a 304, or the best pre-compressed encoding the client accepts."""
+        request_headers = Headers(scope=scope)
+        headers = self.headers
+        headers["ETag"] = self._entry.etag
+        if len(self._entry.body) >= GZIP_MINIMUM_SIZE:
+            headers.add_vary_header("Accept-Encoding")
+
+        if etag_matches(request_headers.get("if-none-match"), self._entry.etag):
+            self.status_code = 304
+            self.body = b""
+            del headers["Content-Length"]
+            del headers["Content-Type"]
+        elif len(self._entry.body) >= GZIP_MINIMUM_SIZE:
+            accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+            if brotli is not None and "br" in accepted:
+                self.body = self._entry.brotli_compressed()
+                headers["Content-Encoding"] = "br"
+                headers["Content-Length"] = str(len(self.body))
+            elif "gzip" in accepted:
+                self.body = self._entry.gzipped()
+                headers["Content-Encoding"] = "gzip"
+                headers["Content-Length"] = str(len(self.body))
+        await super().__call__(scope, receive, send)
+
+
+class ResponseCache:
+    """
+    Bounded in-memory store of serialized responses with per-entry TTL.
+
+    Keys are "{namespace}:{digest}" (see _build_key), and each namespace is
+    its own LRU with its own entry bound. A namespace with free-form keys,
+    such as the screener's search queries, can then only evict its own
+    entries and never the hot bodies of other endpoints.
+
+    One instance per worker process; entries are not shared across workers.
+    Access only happens on the event loop, so no locking is needed.
+
+    Attributes:
+        max_entries: Default maximum number of responses kept per namespace
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Default maximum number of responses kept per namespace
+        """
+        self.max_entries = max_entries
+        self._namespaces: Dict[str, "OrderedDict[str, CachedBody]"] = {}
+
+    def get(self, key: str) -> Optional[CachedBody]:
+        """
+        Get a fresh cached body.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CachedBody, or None if missing or expired.
+        """
+        entries = self._namespaces.get(key.partition(":")[0])
+        entry = entries.get(key) if entries is not None else None
+        if entry is None:
+            return None
+
+        if time.monotonic() >= entry.expires_at:
+            del entries[key]
+            return None
+
+        entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        key: str,
+        body: bytes,
+        expire: int,
+        max_entries: Optional[int] = None,
+    ) -> CachedBody:
+        """
+        Store a serialized body.
+
+        Args:
+            key: Cache key
+            body: Serialized body
+            expire: Time-to-live in seconds
+            max_entries: Bound of the key's namespace (default: max_entries)
+
+        Returns:
+            The stored CachedBody.
+        """
+        entries = self._namespaces.setdefault(key.partition(":")[0], OrderedDict())
+        entry = CachedBody(body, time.monotonic() + expire)
+        entries[key] = entry
+        entries.move_to_end(key)
+
+        limit = self.max_entries if max_entries is None else max_entries
+        while len(entries) > limit:
+            entries.popitem(last=False)
+        return entry
+
+    def delete(self, key: str) -> bool:
+        """
+        Drop a cached body.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed.
+        """
+        entries = self._namespaces.get(key.partition(":")[0])
+        return entries is not None and entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._namespaces.clear()
+
+
+_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get the shared response cache.
+
+    Returns:
+        ResponseCache: The process-wide cache instance.
+    """
+    return _cache
+
+
+def _build_key(namespace: str, kwargs: Dict[str, Any]) -> str:
+    """Hash the endpoint arguments into a cache key."""
+    args = "&".join(f"{name}={value!r}" for name, value in sorted(kwargs.items()))
+    digest = hashlib.blake2b(args.encode(), digest_size=16).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+def invalidate_response(namespace: str, **key_args: Any) -> bool:
+    """
+    Drop the cached response for one set of endpoint arguments.
+
+    Only affects this worker's cache; other workers keep their entry until
+    it expires.
+
+    Args:
+        namespace: Namespace passed to cached_response
+        **key_args: Arguments the key is built from (after key_args selection)
+
+    Returns:
+        True if a cached response was removed.
+    """
+    return _cache.delete(_build_key(namespace, key_args))
+
+
+def encode_json(result: Any) -> bytes:
+    """
+    Serialize an endpoint result the way FastAPI would (by alias, NaN as null).
+
+    Uses pydantic's Rust serializer directly, so models are encoded in one
+    pass instead of being dumped to dicts and re-encoded.
+
+    Args:
+        result: Pydantic model, or any value pydantic can serialize
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    return pydantic_core.to_json(result, by_alias=True, inf_nan_mode="null")
+
+
+def cached_response(
+    expire: Expire,
+    namespace: str,
+    media_type: str = "application/json",
+    serialize: Callable[[Any], bytes] = encode_json,
+    key_args: Optional[KeyArgs] = None,
+    cache_control: Optional[str] = None,
+    max_entries: int = MAX_ENTRIES,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[Union[T, Response]]]]:
+    """
+    Cache an endpoint's serialized response body in memory.
+
+    Place the decorator below the router decorator so FastAPI registers the
+    wrapped function. The wrapper keeps the endpoint's signature, so
+    parameters and the OpenAPI schema are unchanged. Exceptions (including
+    HTTPException) are never cached.
+
+    Args:
+        expire: TTL in seconds, or a callable that receives the endpoint's
+            keyword arguments and returns the TTL
+        namespace: Key prefix and metrics label for the endpoint
+        media_type: Content type of the serialized body
+        serialize: Encodes the endpoint's return value to the body bytes
+            (JSON by default)
+        key_args: Callable that receives the endpoint's keyword arguments
+            and returns the (normalized) subset the key is built from;
+            needed when the endpoint takes a Request or dependencies.
+            Defaults to all arguments.
+        cache_control: Cache-Control header for responses served from the
+            cache (e.g. "no-cache" to make clients revalidate with
+            If-None-Match on every poll). Omitted by default.
+        max_entries: Maximum number of responses kept for this namespace;
+            keep it small for endpoints keyed on free-form input
+
+    Returns:
+        Decorator wrapping an async endpoint.
+    """
+
+    def decorator(
+        fn: Callable[..., Awaitable[T]],
+    ) -> Callable[..., Awaitable[Union[T, Response]]]:
+        @functools.wraps(fn)
+        async def wrapper(**kwargs: Any) -> Union[T, Response]:
+            key = _build_key(namespace, key_args(kwargs) if key_args else kwargs)
+
+            entry = _cache.get(key)
+            if entry is not None:
+                CACHE_HIT.inc(namespace)
+                return CachedBodyResponse(entry, media_type, cache_control)
+
+            CACHE_MISS.inc(namespace)
+            # Only misses cost rate limit quota (charge_on_miss rules)
+            await charge_rate_limit()
+            result = await fn(**kwargs)
+            if isinstance(result, Response):
+                return result
+
+            ttl = expire(kwargs) if callable(expire) else expire
+            entry = _cache.set(key, serialize(result), ttl, max_entries)
+            return CachedBodyResponse(entry, media_type, cache_control)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,94 @@
+"""
+Request coalescing (single-flight) for expensive async operations.
+
+When several requests ask for the same expensive result at the same time
+(e.g. a cold-cache AI analysis), only the first one starts the work and
+the others await the same task. This keeps Gemini calls at one per key
+under a thundering herd.
+
+Usage:
+    _flight: SingleFlight[WarrenBuffettAnalysis] = SingleFlight("analysis")
+
+    analysis = await _flight.do(
+        (ticker, False),
+        lambda: analyst.generate_analysis(ticker),
+    )
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+from app.core.metrics import SINGLE_FLIGHT_COALESCE
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Per-key coalescing of concurrent async calls.
+
+    The in-flight map is only touched from the event loop and never across
+    an await, so check-and-insert is atomic without a lock. The work runs in
+    its own task and callers await it through asyncio.shield, so a caller
+    disconnecting does not cancel the work for the other waiters.
+    """
+
+    def __init__(self, name: str = "default") -> None:
+        """
+        Initialize an empty in-flight map.
+
+        Args:
+            name: Label for coalescing metrics (e.g. "analysis")
+        """
+        self.name = name
+        self._inflight: Dict[Hashable, "asyncio.Task[T]"] = {}
+
+    def start(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> "asyncio.Task[T]":
+        """
+        Get the in-flight task for a key, starting it if none is running.
+
+        Args:
+            key: Identifies identical calls (e.g. (ticker, force_refresh))
+            fn: Zero-argument coroutine factory performing the work
+
+        Returns:
+            The task computing the result for this key.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            logger.debug("Coalescing concurrent call for %s", key)
+            SINGLE_FLIGHT_COALESCE.inc(self.name)
+            return task
+
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+
+        def _forget(done: "asyncio.Task[T]") -> None:
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+
+        task.add_done_callback(_forget)
+        return task
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once per key among concurrent callers and share the result.
+
+        Args:
+            key: Identifies identical calls (e.g. (ticker, force_refresh))
+            fn: Zero-argument coroutine factory performing the work
+
+        Returns:
+            The result of fn, shared by all concurrent callers.
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every caller.
+        """
+        return await asyncio.shield(self.start(key, fn))
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Check whether work for a key is currently running."""
+        return key in self._inflight
@@ -9,17 +9,21 @@ import re
 from typing import Annotated, Any, Dict, List
 
 from fastapi import Depends, HTTPException, Path, status
+from pydantic import AfterValidator, StringConstraints
 
 from app.config import Settings, get_settings
 from app.core.data_loader import (
+    canonical_ticker,
     get_available_tickers,
+    get_available_tickers_set,
     load_summary_csv,
     load_stock_json,
 )
 
 
-# Regex pattern for valid ticker symbols (1-10 chars, may include dots or hyphens for class shares)
-TICKER_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9.\-]{0,9}$")
+# Regex pattern for valid ticker symbols (1-10 chars, may include dots or hyphens for class shares).
+# May start with a digit, as exchange codes do (e.g. 7203.T, 0700.HK)
+TICKER_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9.\-]{0,9}$")
 
 
 def validate_ticker_format(ticker: str) -> str:
@@ -43,13 +47,16 @@ def validate_ticker_format(ticker: str) -> str:
     if not TICKER_PATTERN.match(ticker_stripped):
         raise ValueError(
             f"Invalid ticker format: '{ticker}'. "
-            "Ticker must start with a letter and contain only letters, numbers, dots, or hyphens (max 10 chars)"
+            "Ticker must start with a letter or number and contain only letters, numbers, "
+            "dots, or hyphens (max 10 chars)"
         )
 
     return ticker_stripped.upper()
 
 
-# Path parameter with validation for use in endpoints
+# Path parameter with validation shared by all endpoints; invalid tickers
+# are rejected with 422 before any disk or upstream I/O, and valid ones
+# reach handlers already upper-cased and interned (see canonical_ticker)
 TickerPath = Annotated[
     str,
     Path(
@@ -57,9 +64,18 @@ TickerPath = Annotated[
         description="Stock ticker symbol (e.g., 'AAPL', 'NVDA', 'BRK-B')",
         min_length=1,
         max_length=10,
-        pattern=r"^[A-Za-z][A-Za-z0-9.\-]{0,9}$",
+        pattern=TICKER_PATTERN.pattern,
         examples=["AAPL", "NVDA", "MSFT", "BRK-B"],
     ),
+    AfterValidator(canonical_ticker),
+]
+
+# The same validation for tickers in request bodies (e.g. List[TickerItem]),
+# so batch endpoints never pass malformed symbols upstream
+TickerItem = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, pattern=TICKER_PATTERN.pattern),
+    AfterValidator(canonical_ticker),
 ]
 
 
@@ -75,8 +91,8 @@ def get_stocks_data() -> List[Dict[str, Any]]:
         List of stock dictionaries from summary.csv.
 
     Note:
-        This loads data on each request. For production, consider
-        caching the result with a TTL.
+        The CSV is parsed once per file version; the returned records
+        are shared and must not be modified in place.
     """
     return load_summary_csv()
 
@@ -112,10 +128,14 @@ StocksDataDep = Annotated[List[Dict[str, Any]], Depends(get_stocks_data)]
 TickersListDep = Annotated[List[str], Depends(get_tickers_list)]
 
 
-async def verify_ticker_exists(ticker: str) -> str:
+def verify_ticker_exists(ticker: str) -> str:
     """
     Verify that a ticker exists in the available data.
 
+    The ticker set is cached per JSON directory version, so this costs one
+    stat() and a set lookup rather than a directory scan. Plain function,
+    so it can be called directly from sync code as well as handlers.
+
     Args:
         ticker: Stock ticker symbol to verify.
 
@@ -125,8 +145,8 @@ async def verify_ticker_exists(ticker: str) -> str:
     Raises:
         ValueError: If ticker doesn't exist.
     """
-    ticker_upper = ticker.upper()
-    available = get_available_tickers()
+    ticker_upper = canonical_ticker(ticker)
+    available = get_available_tickers_set()
 
     if ticker_upper not in available:
         raise ValueError(f"Ticker not found: {ticker_upper}")
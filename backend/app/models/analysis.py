@@ -90,7 +90,6 @@ class CompetitiveAdvantage(BaseModel):
 
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
         extra="forbid",
     )
 
@@ -128,7 +127,6 @@ class RiskFactor(BaseModel):
 
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
         extra="forbid",
     )
 
@@ -177,11 +175,14 @@ class WarrenBuffettAnalysis(BaseModel):
     Note: All numerical values in this analysis come from the Python
     valuation engine. The AI only generates narrative and qualitative
     assessments based on those computed values.
+
+    Assignments are not re-validated: analyses are built once from the
+    parsed response, and only trusted generation metadata (e.g.
+    generation_time_seconds) is filled in afterwards.
     """
 
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
         extra="forbid",
     )
 
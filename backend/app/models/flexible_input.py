@@ -6,6 +6,8 @@ with partial data. The valuation engine adapts based on what's available.
 """
 
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -213,6 +215,18 @@ class DataQuality(BaseModel):
     confidence_notes: Optional[str] = None
 
 
+# Sort key for historical_financials
+_FISCAL_YEAR = attrgetter("fiscal_year")
+
+# Years -> GrowthRates field for get_growth_rate()
+_REVENUE_GROWTH_FIELDS: Dict[int, str] = {
+    1: "revenue_growth_1y",
+    3: "revenue_growth_3y_cagr",
+    5: "revenue_growth_5y_cagr",
+    10: "revenue_growth_10y_cagr",
+}
+
+
 class FlexibleValuationInput(BaseModel):
     """
     Flexible valuation input - accepts whatever AI can extract.
@@ -254,11 +268,17 @@ class FlexibleValuationInput(BaseModel):
     @field_validator("historical_financials")
     @classmethod
     def sort_historical(cls, v: List[HistoricalYear]) -> List[HistoricalYear]:
-        return sorted(v, key=lambda x: x.fiscal_year, reverse=True)
+        """Order years newest first, sorting only when the input is not."""
+        # v is the list pydantic just built, so sorting it in place is safe
+        if any(a.fiscal_year < b.fiscal_year for a, b in zip(v, v[1:])):
+            v.sort(key=_FISCAL_YEAR, reverse=True)
+        return v
 
     # === Convenience methods to access data ===
+    # Derived values are cached on first access; instances are built once
+    # from the AI response and not modified afterwards.
 
-    @property
+    @cached_property
     def has_dcf_data(self) -> bool:
         """Check if we have minimum data for DCF valuation."""
         return (
@@ -267,7 +287,7 @@ class FlexibleValuationInput(BaseModel):
              self.ttm_cash_flow.capital_expenditures is not None)
         )
 
-    @property
+    @cached_property
     def has_graham_data(self) -> bool:
         """Check if we have minimum data for Graham Number."""
         return (
@@ -276,7 +296,7 @@ class FlexibleValuationInput(BaseModel):
             self.market_position.shares_outstanding is not None
         )
 
-    @property
+    @cached_property
     def fcf(self) -> Optional[float]:
         """Get free cash flow (direct or calculated)."""
         if self.ttm_cash_flow.free_cash_flow is not None:
@@ -286,7 +306,7 @@ class FlexibleValuationInput(BaseModel):
             return self.ttm_cash_flow.operating_cash_flow - abs(self.ttm_cash_flow.capital_expenditures)
         return None
 
-    @property
+    @cached_property
     def book_value_per_share(self) -> Optional[float]:
         """Calculate book value per share."""
         if (self.balance_sheet.shareholders_equity is not None and
@@ -297,12 +317,7 @@ class FlexibleValuationInput(BaseModel):
 
     def get_growth_rate(self, years: int = 5) -> Optional[float]:
         """Get revenue growth rate for specified years."""
-        if years == 1:
-            return self.growth_rates.revenue_growth_1y
-        elif years == 3:
-            return self.growth_rates.revenue_growth_3y_cagr
-        elif years == 5:
-            return self.growth_rates.revenue_growth_5y_cagr
-        elif years == 10:
-            return self.growth_rates.revenue_growth_10y_cagr
-        return None
+        field = _REVENUE_GROWTH_FIELDS.get(years)
+        if field is None:
+            return None
+        return getattr(self.growth_rates, field)
@@ -16,15 +16,20 @@ The AI DOES NOT:
 """
 
 import json
+from functools import lru_cache
 from typing import Any, Dict
 
 from app.models.analysis import WarrenBuffettAnalysis
 
 
+@lru_cache(maxsize=1)
 def get_analysis_schema_json() -> str:
     """
     Get the JSON schema for WarrenBuffettAnalysis.
 
+    The schema (including the field descriptions that guide the model) is
+    generated and formatted once per process, not on every prompt.
+
     Returns:
         JSON string of the Pydantic model schema for prompt inclusion.
     """
@@ -19,6 +19,7 @@ The AI DOES NOT:
 """
 
 import json
+from functools import lru_cache
 
 # Schema definition for inclusion in prompts
 STANDARDIZED_VALUATION_INPUT_SCHEMA = {
@@ -479,8 +480,9 @@ Return ONLY valid JSON matching this schema:
 Begin extraction now. Output ONLY the JSON object, starting with {{ and ending with }}."""
 
 
+@lru_cache(maxsize=1)
 def get_schema_json() -> str:
-    """Return the schema as a formatted JSON string for prompt inclusion."""
+    """Return the schema as a formatted JSON string for prompt inclusion (built once)."""
     return json.dumps(STANDARDIZED_VALUATION_INPUT_SCHEMA, indent=2)
 
 
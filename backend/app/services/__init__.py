@@ -11,6 +11,11 @@ from app.services.ai_extractor import (
     GeminiAPIError,
     InvalidResponseError,
     get_ai_extractor,
+    get_ai_extractor_dep,
+)
+from app.services.batch_refresher import (
+    BatchRefresher,
+    get_batch_refresher,
 )
 
 __all__ = [
@@ -20,4 +25,7 @@ __all__ = [
     "DataNotFoundError",
     "InvalidResponseError",
     "get_ai_extractor",
+    "get_ai_extractor_dep",
+    "BatchRefresher",
+    "get_batch_refresher",
 ]
@@ -20,19 +20,22 @@ Caching:
 
 import asyncio
 import hashlib
-import json
 import logging
 import re
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 import google.generativeai as genai
+import orjson
 from diskcache import Cache
+from pydantic import ValidationError
 
 from app.config import get_settings
+from app.core.gemini import configure_gemini, is_json_syntax_error
 from app.core.data_loader import load_stock_json
 from app.models.analysis import WarrenBuffettAnalysis
 from app.models.valuation_output import ValuationResult
@@ -114,6 +117,10 @@ class AnalysisCache:
         hash_str = hashlib.md5(valuation_timestamp.encode()).hexdigest()[:8]
         return f"analysis_{ticker}_{hash_str}"
 
+    def _get_current_key(self, ticker: str) -> str:
+        """Generate key of the pointer to a ticker's current analysis entry."""
+        return f"current_analysis_{ticker.upper().strip()}"
+
     def get(
         self,
         ticker: str,
@@ -129,25 +136,117 @@ class AnalysisCache:
         Returns:
             WarrenBuffettAnalysis if found and valid, None otherwise.
         """
-        cache_key = self._get_cache_key(ticker, valuation_timestamp)
+        entry = self.get_with_age(ticker, valuation_timestamp)
+        return entry[0] if entry is not None else None
+
+    def get_with_age(
+        self,
+        ticker: str,
+        valuation_timestamp: str,
+    ) -> Optional[Tuple[WarrenBuffettAnalysis, float]]:
+        """
+        Retrieve cached analysis for a ticker along with its age.
+
+        The age is derived from the entry's expiry time, so no extra
+        metadata needs to be stored alongside the analysis.
+
+        Args:
+            ticker: Stock ticker symbol
+            valuation_timestamp: ISO timestamp from valuation
+
+        Returns:
+            Tuple of (WarrenBuffettAnalysis, age in seconds) if found and
+            valid, None otherwise.
+        """
+        entry = self.get_json_with_age(ticker, valuation_timestamp)
+        if entry is None:
+            return None
+
+        json_bytes, age = entry
+        try:
+            result = WarrenBuffettAnalysis.model_validate_json(json_bytes)
+        except Exception as e:
+            logger.warning("Failed to parse cached analysis for %s: %s", ticker, e)
+            return None
+
+        logger.debug(
+            "Analysis cache hit for %s (date: %s, age: %.0fs)",
+            ticker,
+            result.analysis_date,
+            age,
+        )
+        return result, age
+
+    def get_json_with_age(
+        self,
+        ticker: str,
+        valuation_timestamp: str,
+    ) -> Optional[Tuple[bytes, float]]:
+        """
+        Retrieve the serialized JSON of a cached analysis along with its age.
+
+        Entries are written from validated models, so the bytes can be sent
+        to clients as-is without another validation/serialization pass.
+
+        Args:
+            ticker: Stock ticker symbol
+            valuation_timestamp: ISO timestamp from valuation
+
+        Returns:
+            Tuple of (JSON bytes, age in seconds) if found, None otherwise.
+        """
+        return self._get_json_by_key(
+            self._get_cache_key(ticker, valuation_timestamp),
+            ticker,
+        )
+
+    def get_current_json_with_age(self, ticker: str) -> Optional[Tuple[bytes, float]]:
+        """
+        Retrieve the most recently stored analysis for a ticker.
+
+        Unlike get_json_with_age(), this follows the ticker's current-version
+        pointer instead of the valuation timestamp, so the previous analysis
+        stays readable while a refresh is recalculating the valuation and
+        generating its replacement.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Tuple of (JSON bytes, age in seconds) if found, None otherwise.
+        """
+        try:
+            cache_key = self.cache.get(self._get_current_key(ticker))
+        except Exception as e:
+            logger.warning("Failed to read current analysis pointer for %s: %s", ticker, e)
+            return None
+
+        if not isinstance(cache_key, str):
+            return None
+        return self._get_json_by_key(cache_key, ticker)
 
+    def _get_json_by_key(
+        self,
+        cache_key: str,
+        ticker: str,
+    ) -> Optional[Tuple[bytes, float]]:
+        """Read a serialized analysis entry and compute its age."""
         try:
-            cached_data = self.cache.get(cache_key)
+            cached_data, expire_time = self.cache.get(cache_key, expire_time=True)
 
             if cached_data is None:
                 logger.debug("Analysis cache miss for %s", ticker)
                 return None
 
+            # Entries written before analyses were stored pre-serialized
             if isinstance(cached_data, dict):
-                result = WarrenBuffettAnalysis.model_validate(cached_data)
-                logger.debug(
-                    "Analysis cache hit for %s (date: %s)",
-                    ticker,
-                    result.analysis_date,
-                )
-                return result
+                cached_data = orjson.dumps(cached_data)
 
-            return None
+            if not isinstance(cached_data, bytes):
+                return None
+
+            age = self.ttl - (expire_time - time.time()) if expire_time else 0.0
+            return cached_data, max(age, 0.0)
 
         except Exception as e:
             logger.warning("Failed to retrieve cached analysis for %s: %s", ticker, e)
@@ -162,16 +261,28 @@ class AnalysisCache:
         """
         Store analysis result in cache.
 
+        The new entry is written under its own versioned key first, then the
+        ticker's current-version pointer is swapped to it and the previous
+        version is deleted. Readers therefore never see a gap between the
+        old and new analysis.
+
         Args:
             ticker: Stock ticker symbol
             data: WarrenBuffettAnalysis to cache
             valuation_timestamp: ISO timestamp from valuation
         """
         cache_key = self._get_cache_key(ticker, valuation_timestamp)
+        current_key = self._get_current_key(ticker)
 
         try:
-            cache_data = data.model_dump(mode="json")
+            cache_data = orjson.dumps(data.model_dump(mode="json"))
             self.cache.set(cache_key, cache_data, expire=self.ttl)
+
+            previous_key = self.cache.get(current_key)
+            self.cache.set(current_key, cache_key, expire=self.ttl)
+            if isinstance(previous_key, str) and previous_key != cache_key:
+                self.cache.delete(previous_key)
+
             logger.info(
                 "Cached analysis for %s (TTL: %d seconds)",
                 ticker,
@@ -186,6 +297,8 @@ class AnalysisCache:
         deleted_count = 0
 
         try:
+            self.cache.delete(self._get_current_key(ticker))
+
             for key in list(self.cache):
                 if isinstance(key, str) and key.startswith(f"analysis_{ticker}_"):
                     if self.cache.delete(key):
@@ -224,6 +337,10 @@ class AIAnalyst:
     MAX_RETRIES = 3
     RETRY_DELAY = 3.0  # Base delay in seconds
 
+    # In-process tier in front of the disk cache (absorbs bursts per ticker)
+    LOCAL_CACHE_TTL = 30.0  # Seconds a local entry is served without re-checking
+    LOCAL_CACHE_SIZE = 256  # Max tickers held locally (LRU eviction)
+
     def __init__(
         self,
         cache: Optional[AnalysisCache] = None,
@@ -248,8 +365,8 @@ class AIAnalyst:
                 "GOOGLE_API_KEY is not configured. Please set it in .env file."
             )
 
-        # Configure Gemini
-        genai.configure(api_key=settings.GOOGLE_API_KEY)
+        # Configure Gemini (once per process, shared client connections)
+        configure_gemini(settings.GOOGLE_API_KEY)
 
         # Initialize model with appropriate settings for Buffett-style analysis
         # Model options for investment reasoning (choose based on needs):
@@ -272,6 +389,9 @@ class AIAnalyst:
         # Initialize cache
         self.cache = cache or AnalysisCache()
 
+        # Local LRU: ticker -> (stored_at monotonic, JSON bytes, age when stored)
+        self._local: "OrderedDict[str, Tuple[float, bytes, float]]" = OrderedDict()
+
         # Valuation engine (lazy loaded)
         self._valuation_engine = valuation_engine
 
@@ -435,20 +555,18 @@ class AIAnalyst:
 
             json_str = cleaned[start_idx:end_idx]
 
-            # Parse JSON
+            # Parse and validate in one pass in pydantic-core, repairing
+            # common JSON issues on a syntax error
             try:
-                data = json.loads(json_str)
-            except json.JSONDecodeError:
-                # Try to fix common JSON issues
-                json_str = self._fix_json(json_str)
-                data = json.loads(json_str)
+                result = WarrenBuffettAnalysis.model_validate_json(json_str)
+            except ValidationError as e:
+                if not is_json_syntax_error(e):
+                    raise
+                result = WarrenBuffettAnalysis.model_validate_json(self._fix_json(json_str))
 
             # Add generation metadata if not present
-            if "generation_time_seconds" not in data or data.get("generation_time_seconds") is None:
-                data["generation_time_seconds"] = generation_time
-
-            # Validate with Pydantic
-            result = WarrenBuffettAnalysis.model_validate(data)
+            if result.generation_time_seconds is None:
+                result.generation_time_seconds = generation_time
 
             logger.info(
                 "Successfully parsed analysis for %s (rating: %s, conviction: %.2f)",
@@ -459,8 +577,10 @@ class AIAnalyst:
 
             return result
 
-        except json.JSONDecodeError as e:
-            raise InvalidAnalysisError(f"Failed to parse JSON response: {e}")
+        except ValidationError as e:
+            if is_json_syntax_error(e):
+                raise InvalidAnalysisError(f"Failed to parse JSON response: {e}")
+            raise InvalidAnalysisError(f"Failed to validate analysis response: {e}")
         except Exception as e:
             raise InvalidAnalysisError(f"Failed to validate analysis response: {e}")
 
@@ -509,6 +629,57 @@ class AIAnalyst:
             logger.warning("Failed to load business description for %s: %s", ticker, e)
             return ""
 
+    async def _get_valuation(self, ticker: str, force_refresh: bool) -> ValuationResult:
+        """
+        Get the valuation result the analysis is based on.
+
+        Args:
+            ticker: Stock ticker symbol
+            force_refresh: If True, recalculate the valuation
+
+        Returns:
+            ValuationResult for the ticker
+
+        Raises:
+            ValuationNotFoundError: If valuation cannot be obtained
+        """
+        try:
+            return await self.valuation_engine.calculate_valuation(
+                ticker,
+                force_refresh=force_refresh,
+            )
+        except Exception as e:
+            logger.error("Failed to get valuation for %s: %s", ticker, e)
+            raise ValuationNotFoundError(
+                f"Could not obtain valuation for {ticker}: {e}"
+            ) from e
+
+    async def _get_extraction_context(self, ticker: str) -> FlexibleInputAdapter:
+        """
+        Get extraction data used as additional prompt context.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            FlexibleInputAdapter wrapping the flexible extraction
+
+        Raises:
+            ValuationNotFoundError: If extraction data cannot be obtained
+        """
+        try:
+            flexible_data = await self.valuation_engine.ai_extractor.extract_flexible(
+                ticker,
+                force_refresh=False,  # Use cached extraction if available
+            )
+            # Wrap with adapter for flat property access
+            return FlexibleInputAdapter(flexible_data)
+        except Exception as e:
+            logger.error("Failed to get extraction data for %s: %s", ticker, e)
+            raise ValuationNotFoundError(
+                f"Could not obtain extraction data for {ticker}: {e}"
+            ) from e
+
     async def generate_analysis(
         self,
         ticker: str,
@@ -520,7 +691,9 @@ class AIAnalyst:
         This is the main entry point for analysis generation. It:
         1. Gets valuation result from valuation engine
         2. Checks cache for existing analysis (unless force_refresh)
-        3. Builds analysis prompt with valuation data
+        3. Builds analysis prompt with valuation and extraction data
+           (read after the valuation, so a forced refresh uses the
+           extraction the valuation just made)
         4. Calls Gemini API to generate analysis
         5. Parses and validates the response
         6. Caches and returns result
@@ -544,40 +717,19 @@ class AIAnalyst:
             force_refresh,
         )
 
-        # Get valuation result first
-        try:
-            valuation_result = await self.valuation_engine.calculate_valuation(
-                ticker,
-                force_refresh=force_refresh,
-            )
-        except Exception as e:
-            logger.error("Failed to get valuation for %s: %s", ticker, e)
-            raise ValuationNotFoundError(
-                f"Could not obtain valuation for {ticker}: {e}"
-            ) from e
-
+        valuation_result = await self._get_valuation(ticker, force_refresh=force_refresh)
         valuation_timestamp = valuation_result.calculation_timestamp.isoformat()
 
-        # Check cache (unless force refresh)
+        # Check cache before spending an extraction on prompt context
         if not force_refresh:
             cached = self.cache.get(ticker, valuation_timestamp)
             if cached is not None:
                 logger.info("Returning cached analysis for %s", ticker)
                 return cached
 
-        # Get extraction data for additional context using flexible extraction
-        try:
-            flexible_data = await self.valuation_engine.ai_extractor.extract_flexible(
-                ticker,
-                force_refresh=False,  # Use cached extraction if available
-            )
-            # Wrap with adapter for flat property access
-            extraction_data = FlexibleInputAdapter(flexible_data)
-        except Exception as e:
-            logger.error("Failed to get extraction data for %s: %s", ticker, e)
-            raise ValuationNotFoundError(
-                f"Could not obtain extraction data for {ticker}: {e}"
-            ) from e
+        # Read after the valuation: a forced valuation re-extracts and caches
+        # the result, so the context comes from that same extraction
+        extraction_data = await self._get_extraction_context(ticker)
 
         # Get business description
         business_description = self._get_business_description(ticker)
@@ -602,6 +754,7 @@ class AIAnalyst:
 
         # Cache the result
         self.cache.set(ticker, result, valuation_timestamp)
+        self._local.pop(ticker, None)
 
         logger.info(
             "Analysis complete for %s: rating=%s, conviction=%.2f, time=%.2fs",
@@ -629,8 +782,114 @@ class AIAnalyst:
         Returns:
             WarrenBuffettAnalysis if cached, None otherwise
         """
+        entry = await self.get_cached_analysis_with_age(ticker)
+        return entry[0] if entry is not None else None
+
+    async def get_cached_analysis_with_age(
+        self,
+        ticker: str,
+    ) -> Optional[Tuple[WarrenBuffettAnalysis, float]]:
+        """
+        Get cached analysis and its age, without generating new one.
+
+        Used for stale-while-revalidate: callers compare the age against
+        ANALYSIS_SOFT_TTL to decide whether to regenerate in the background.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Tuple of (WarrenBuffettAnalysis, age in seconds) if cached,
+            None otherwise
+        """
         ticker = ticker.upper().strip()
+        valuation_timestamp = await self._get_valuation_timestamp(ticker)
+        if valuation_timestamp is None:
+            return None
+        return self.cache.get_with_age(ticker, valuation_timestamp)
+
+    async def get_cached_analysis_json_with_age(
+        self,
+        ticker: str,
+    ) -> Optional[Tuple[bytes, float]]:
+        """
+        Get the serialized JSON of a cached analysis and its age.
+
+        Lets endpoints answer cache hits with the stored bytes directly,
+        skipping model validation and response serialization. Recent hits
+        are served from a small in-process LRU for LOCAL_CACHE_TTL seconds,
+        which skips the valuation lookup and the disk read entirely.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Tuple of (JSON bytes, age in seconds) if cached, None otherwise
+        """
+        ticker = ticker.upper().strip()
+        now = time.monotonic()
+
+        local = self._local.get(ticker)
+        if local is not None:
+            stored_at, json_bytes, age = local
+            if now - stored_at < self.LOCAL_CACHE_TTL:
+                self._local.move_to_end(ticker)
+                return json_bytes, age + (now - stored_at)
+            del self._local[ticker]
+
+        valuation_timestamp = await self._get_valuation_timestamp(ticker)
+        if valuation_timestamp is None:
+            return None
+
+        entry = self.cache.get_json_with_age(ticker, valuation_timestamp)
+        if entry is not None:
+            self._local[ticker] = (now, entry[0], entry[1])
+            if len(self._local) > self.LOCAL_CACHE_SIZE:
+                self._local.popitem(last=False)
+        return entry
+
+    def get_latest_cached_analysis_json(
+        self,
+        ticker: str,
+    ) -> Optional[Tuple[bytes, float]]:
+        """
+        Get the most recently generated analysis, whatever its valuation.
+
+        Used to keep serving the previous analysis while a refresh replaces
+        it, instead of reporting a cache miss mid-refresh.
 
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Tuple of (JSON bytes, age in seconds) if cached, None otherwise
+        """
+        return self.cache.get_current_json_with_age(ticker)
+
+    def invalidate_cached_analysis(self, ticker: str) -> int:
+        """
+        Invalidate cached analyses for a ticker in both cache tiers.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Number of disk cache entries deleted
+        """
+        ticker = ticker.upper().strip()
+        self._local.pop(ticker, None)
+        return self.cache.invalidate(ticker)
+
+    async def _get_valuation_timestamp(self, ticker: str) -> Optional[str]:
+        """
+        Get the timestamp of the current valuation, which keys the cache.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            ISO timestamp string, or None if no valuation can be obtained
+        """
         # We need the valuation timestamp to find the cache entry
         # Try to get cached valuation first
         try:
@@ -638,8 +897,7 @@ class AIAnalyst:
                 ticker,
                 force_refresh=False,
             )
-            valuation_timestamp = valuation_result.calculation_timestamp.isoformat()
-            return self.cache.get(ticker, valuation_timestamp)
+            return valuation_result.calculation_timestamp.isoformat()
         except Exception:
             # If we can't get valuation, we can't find the cache entry
             return None
@@ -650,11 +908,13 @@ _analyst_instance: Optional[AIAnalyst] = None
 _analyst_lock = threading.Lock()
 
 
-def get_ai_analyst() -> AIAnalyst:
+async def get_ai_analyst() -> AIAnalyst:
     """
     Get or create the singleton AIAnalyst instance.
 
-    This function provides a FastAPI-compatible dependency.
+    This function provides a FastAPI-compatible dependency. It is declared
+    async so FastAPI resolves it on the event loop instead of dispatching
+    it to the threadpool on every request.
 
     Returns:
         AIAnalyst: The singleton analyst instance.
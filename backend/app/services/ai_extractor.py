@@ -23,11 +23,14 @@ import time
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Type, TypeVar
 
 import google.generativeai as genai
+from pydantic import BaseModel, ValidationError
 
 from app.config import get_settings
+from app.core.gemini import configure_gemini, is_json_syntax_error
+from app.core.metrics import CACHE_HIT, CACHE_MISS
 from app.core.cache_manager import ExtractionCache, get_extraction_cache
 from app.core.data_loader import load_stock_json
 from app.models.valuation_input import StandardizedValuationInput
@@ -40,6 +43,11 @@ from app.prompts.extraction_prompt_v2 import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for the startup Gemini warmup call
+WARMUP_TIMEOUT = 5.0
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class ExtractionError(Exception):
     """Base exception for extraction errors."""
@@ -121,8 +129,8 @@ class AIExtractor:
                 "GOOGLE_API_KEY is not configured. Please set it in .env file."
             )
 
-        # Configure Gemini
-        genai.configure(api_key=settings.GOOGLE_API_KEY)
+        # Configure Gemini (once per process, shared client connections)
+        configure_gemini(settings.GOOGLE_API_KEY)
 
         # Initialize model with appropriate settings
         # Model options for extraction (choose based on needs):
@@ -151,6 +159,33 @@ class AIExtractor:
 
         logger.info("AIExtractor initialized with Gemini model: gemini-2.0-flash")
 
+    async def warmup(self, timeout: float = WARMUP_TIMEOUT) -> bool:
+        """
+        Open the connection to the Gemini API ahead of the first extraction.
+
+        Sends a count_tokens request through the same client that
+        generate_content uses, so DNS, TLS and channel setup happen at
+        startup. count_tokens is free and does not consume generation quota.
+
+        Args:
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            True if the API answered, False on error or timeout (the first
+            extraction then connects lazily as before).
+        """
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(self.model.count_tokens, "ping"),
+                timeout=timeout,
+            )
+        except Exception as e:
+            logger.warning("Gemini warmup failed: %s", e)
+            return False
+
+        logger.info("Gemini connection warmed up")
+        return True
+
     def truncate_json(self, stock_data: dict) -> dict:
         """
         Extract only the sections needed for AI extraction (~15-20KB).
@@ -420,16 +455,8 @@ class AIExtractor:
 
             json_str = cleaned[start_idx:end_idx]
 
-            # Parse JSON
-            try:
-                data = json.loads(json_str)
-            except json.JSONDecodeError as e:
-                # Try to fix common JSON issues
-                json_str = self._fix_json(json_str)
-                data = json.loads(json_str)
-
-            # Validate with Pydantic
-            result = StandardizedValuationInput.model_validate(data)
+            # Parse and validate in one pass in pydantic-core
+            result = self._validate_json(StandardizedValuationInput, json_str)
 
             logger.info(
                 "Successfully parsed extraction for %s (confidence: %.2f)",
@@ -439,11 +466,39 @@ class AIExtractor:
 
             return result
 
-        except json.JSONDecodeError as e:
-            raise InvalidResponseError(f"Failed to parse JSON response: {e}")
+        except ValidationError as e:
+            if is_json_syntax_error(e):
+                raise InvalidResponseError(f"Failed to parse JSON response: {e}")
+            raise InvalidResponseError(f"Failed to validate response: {e}")
         except Exception as e:
             raise InvalidResponseError(f"Failed to validate response: {e}")
 
+    def _validate_json(self, model: Type[ModelT], json_str: str) -> ModelT:
+        """
+        Validate a JSON response directly with model_validate_json.
+
+        The JSON is parsed by pydantic-core without building an intermediate
+        dict. On a JSON syntax error the text is repaired with _fix_json()
+        and validated once more.
+
+        Args:
+            model: Pydantic model class to validate against
+            json_str: JSON object text from the response
+
+        Returns:
+            Validated model instance
+
+        Raises:
+            ValidationError: If the JSON is still malformed after repair,
+                or does not match the model
+        """
+        try:
+            return model.model_validate_json(json_str)
+        except ValidationError as e:
+            if not is_json_syntax_error(e):
+                raise
+        return model.model_validate_json(self._fix_json(json_str))
+
     def _fix_json(self, json_str: str) -> str:
         """
         Attempt to fix common JSON formatting issues.
@@ -548,8 +603,10 @@ class AIExtractor:
         if not force_refresh:
             cached = self.cache.get(ticker, collected_at)
             if cached is not None:
+                CACHE_HIT.inc("extraction")
                 logger.info("Returning cached extraction for %s", ticker)
                 return cached
+            CACHE_MISS.inc("extraction")
 
         # Truncate data for API efficiency
         truncated_data = self.truncate_json(stock_data)
@@ -624,16 +681,8 @@ class AIExtractor:
 
             json_str = cleaned[start_idx:end_idx]
 
-            # Parse JSON
-            try:
-                data = json.loads(json_str)
-            except json.JSONDecodeError:
-                # Try to fix common JSON issues
-                json_str = self._fix_json(json_str)
-                data = json.loads(json_str)
-
-            # Validate with flexible Pydantic model
-            result = FlexibleValuationInput.model_validate(data)
+            # Parse and validate with the flexible model in one pass
+            result = self._validate_json(FlexibleValuationInput, json_str)
 
             logger.info(
                 "Flexible extraction for %s: confidence=%.2f, found=%d fields, missing=%d fields",
@@ -645,8 +694,10 @@ class AIExtractor:
 
             return result
 
-        except json.JSONDecodeError as e:
-            raise InvalidResponseError(f"Failed to parse JSON response: {e}")
+        except ValidationError as e:
+            if is_json_syntax_error(e):
+                raise InvalidResponseError(f"Failed to parse JSON response: {e}")
+            raise InvalidResponseError(f"Failed to validate response: {e}")
         except Exception as e:
             raise InvalidResponseError(f"Failed to validate response: {e}")
 
@@ -772,3 +823,20 @@ def get_ai_extractor() -> AIExtractor:
     except ValueError as e:
         # Re-raise as a specific exception for better handling
         raise APIKeyNotConfiguredError(str(e)) from e
+
+
+async def get_ai_extractor_dep() -> AIExtractor:
+    """
+    Async FastAPI dependency returning the singleton AIExtractor.
+
+    get_ai_extractor() stays sync for service code (e.g. ValuationEngine);
+    endpoints depend on this wrapper so FastAPI resolves it on the event
+    loop instead of dispatching it to the threadpool on every request.
+
+    Returns:
+        AIExtractor: The singleton extractor instance.
+
+    Raises:
+        APIKeyNotConfiguredError: If GOOGLE_API_KEY is not set.
+    """
+    return get_ai_extractor()
@@ -0,0 +1,101 @@
+"""
+Coalescing of forced extraction refreshes.
+
+A portfolio-wide refresh from the UI arrives as a burst of per-ticker
+refresh requests, often with the same ticker requested several times (the
+single refresh endpoint and the batch endpoint together). The
+BatchRefresher runs one forced extraction per ticker at a time: concurrent
+refreshes of a ticker that is already being extracted join that
+extraction instead of starting another one.
+
+There is no upstream batching. Each ticker is extracted with its own
+Gemini prompt, because a single extraction already uses most of the
+model's output token budget and packing several tickers into one response
+is not viable. Distinct tickers therefore run concurrently, paced by the
+extractor's own rate limiter.
+
+Usage:
+    refresher = get_batch_refresher()
+    result = await refresher.refresh_ticker("AAPL")
+"""
+
+import logging
+from functools import lru_cache
+
+from app.core.singleflight import SingleFlight
+from app.models.valuation_input import StandardizedValuationInput
+from app.services.ai_extractor import AIExtractor, get_ai_extractor
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRefresher:
+    """
+    Coalesces concurrent forced extraction refreshes per ticker.
+
+    Attributes:
+        extractor: AIExtractor performing the extractions
+    """
+
+    def __init__(self, extractor: AIExtractor) -> None:
+        """
+        Initialize the refresher.
+
+        Args:
+            extractor: AIExtractor performing the extractions
+        """
+        self.extractor = extractor
+        self._flight: SingleFlight[StandardizedValuationInput] = SingleFlight(
+            "extraction_refresh"
+        )
+
+    async def refresh_ticker(self, ticker: str) -> StandardizedValuationInput:
+        """
+        Force an extraction refresh, joining one already running for the ticker.
+
+        Args:
+            ticker: Stock ticker symbol (case-insensitive)
+
+        Returns:
+            Freshly extracted StandardizedValuationInput
+
+        Raises:
+            ExtractionError: Whatever the extraction for this ticker raised
+        """
+        ticker = ticker.upper().strip()
+        if logger.isEnabledFor(logging.DEBUG) and self._flight.in_flight(ticker):
+            logger.debug("Joining in-flight extraction refresh for %s", ticker)
+
+        # SingleFlight shields the extraction, so a disconnecting caller
+        # doesn't cancel it for the other waiters
+        return await self._flight.do(
+            ticker,
+            lambda: self.extractor.extract_valuation_input(ticker, force_refresh=True),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_batch_refresher() -> BatchRefresher:
+    """
+    Get or create the singleton BatchRefresher.
+
+    Returns:
+        BatchRefresher: The singleton refresher bound to the shared extractor.
+
+    Raises:
+        APIKeyNotConfiguredError: If GOOGLE_API_KEY is not set.
+    """
+    return BatchRefresher(get_ai_extractor())
+
+
+async def get_batch_refresher_dep() -> BatchRefresher:
+    """
+    Async FastAPI dependency returning the singleton BatchRefresher.
+
+    Returns:
+        BatchRefresher: The singleton refresher instance.
+
+    Raises:
+        APIKeyNotConfiguredError: If GOOGLE_API_KEY is not set.
+    """
+    return get_batch_refresher()
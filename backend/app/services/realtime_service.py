@@ -7,14 +7,18 @@ with intelligent caching using diskcache to minimize API calls.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 from functools import lru_cache
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 import diskcache
+import requests
 import yfinance as yf
+from requests.adapters import HTTPAdapter
 
 from app.config import get_settings
+from app.core.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +28,26 @@ PeriodType = Literal["1mo", "3mo", "6mo", "1y", "5y"]
 # Valid periods for historical data
 VALID_PERIODS: tuple[PeriodType, ...] = ("1mo", "3mo", "6mo", "1y", "5y")
 
+# Historical data cache TTL (in seconds) by period
+HISTORY_CACHE_TTLS: Dict[str, int] = {
+    "1mo": 30,      # 30 seconds for recent data
+    "3mo": 30,      # 30 seconds
+    "6mo": 300,     # 5 minutes
+    "1y": 300,      # 5 minutes
+    "5y": 3600,     # 1 hour for historical data
+}
+
 # Timeout for yfinance API calls (in seconds)
 YFINANCE_TIMEOUT: float = 30.0
 
+# Keep-alive connections per host in the shared Yahoo Finance session; sized
+# to the default thread pool so concurrent fetches don't discard connections
+HTTP_POOL_SIZE: int = 32
+
+# Market status cache TTL (in seconds); the status is the same for every
+# caller, so it is kept in memory rather than in diskcache
+MARKET_STATUS_CACHE_TTL: float = 30.0
+
 # Market state mappings from yfinance
 MARKET_STATE_MAP: Dict[str, str] = {
     "PRE": "PRE",
@@ -73,6 +94,32 @@ def _get_cache() -> diskcache.Cache:
     return diskcache.Cache(str(cache_path))
 
 
+@lru_cache(maxsize=1)
+def _get_http_session() -> requests.Session:
+    """
+    Get or create the pooled HTTP session shared by all yfinance calls.
+
+    Reusing one session keeps TCP/TLS connections to Yahoo alive across
+    requests, and the larger pool lets the threadpool fetches run
+    concurrently without opening and discarding extra connections.
+
+    Returns:
+        requests.Session: Shared session with a keep-alive connection pool.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def close_http_session() -> None:
+    """Close the shared HTTP session and its pooled connections."""
+    if _get_http_session.cache_info().currsize:
+        _get_http_session().close()
+        _get_http_session.cache_clear()
+
+
 def _normalize_market_state(state: str | None) -> str:
     """
     Normalize yfinance market state to our standard format.
@@ -177,7 +224,7 @@ async def get_realtime_price(ticker: str) -> Dict[str, Any]:
     try:
         # Create ticker object and fetch data (run in thread pool to avoid blocking)
         def fetch_ticker_info() -> Dict[str, Any]:
-            stock = yf.Ticker(ticker_upper)
+            stock = yf.Ticker(ticker_upper, session=_get_http_session())
             return stock.info
 
         try:
@@ -278,14 +325,7 @@ async def get_historical_data(ticker: str, period: PeriodType = "1y") -> List[Di
     cache_key = f"history:{ticker_upper}:{period}"
 
     # Determine cache TTL based on period
-    cache_ttl_map = {
-        "1mo": 30,      # 30 seconds for recent data
-        "3mo": 30,      # 30 seconds
-        "6mo": 300,     # 5 minutes
-        "1y": 300,      # 5 minutes
-        "5y": 3600,     # 1 hour for historical data
-    }
-    cache_ttl = cache_ttl_map.get(period, 300)
+    cache_ttl = HISTORY_CACHE_TTLS.get(period, 300)
 
     # Check cache first
     cache = _get_cache()
@@ -309,7 +349,7 @@ async def get_historical_data(ticker: str, period: PeriodType = "1y") -> List[Di
 
         # Fetch historical data (run in thread pool to avoid blocking)
         def fetch_history():
-            stock = yf.Ticker(ticker_upper)
+            stock = yf.Ticker(ticker_upper, session=_get_http_session())
             return stock.history(period=period, interval=interval), stock
 
         try:
@@ -414,20 +454,42 @@ def clear_price_cache(ticker: str | None = None) -> int:
     return cleared_count
 
 
+# Last successful market status check as (time.monotonic() deadline, status)
+_market_status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+# Coalesces concurrent market status checks after the cache expires
+_market_status_flight: SingleFlight[Dict[str, Any]] = SingleFlight("market_status")
+
+
 async def is_market_open() -> Dict[str, Any]:
     """
     Check if the US stock market is currently open.
 
+    The result is shared in memory for MARKET_STATUS_CACHE_TTL seconds by
+    all callers, and concurrent checks after expiry make a single upstream
+    request. Failed checks (market_state "UNKNOWN") are not cached.
+
     Returns:
         Dictionary containing:
             - is_open: bool
             - market_state: str
             - timestamp: str (ISO format)
     """
+    cached = _market_status_cache
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+
+    return await _market_status_flight.do("market_status", _fetch_market_status)
+
+
+async def _fetch_market_status() -> Dict[str, Any]:
+    """Fetch the market status from yfinance and cache successful checks."""
+    global _market_status_cache
+
     try:
         # Use SPY as a proxy for market status (run in thread pool to avoid blocking)
         def fetch_market_status():
-            spy = yf.Ticker("SPY")
+            spy = yf.Ticker("SPY", session=_get_http_session())
             return spy.info
 
         info = await asyncio.wait_for(
@@ -436,11 +498,13 @@ async def is_market_open() -> Dict[str, Any]:
         )
         market_state = _normalize_market_state(info.get("marketState"))
 
-        return {
+        status = {
             "is_open": market_state == "REGULAR",
             "market_state": market_state,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
+        _market_status_cache = (time.monotonic() + MARKET_STATUS_CACHE_TTL, status)
+        return status
     except asyncio.TimeoutError:
         logger.warning(f"Timeout checking market status after {YFINANCE_TIMEOUT}s")
         return {
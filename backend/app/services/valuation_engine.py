@@ -18,10 +18,13 @@ Valuation Methodologies:
 4. Composite - 60% DCF + 40% Graham Number weighted average
 """
 
+import asyncio
 import hashlib
 import logging
 import math
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -29,6 +32,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from diskcache import Cache
 
 from app.config import get_settings
+from app.core.response_cache import invalidate_response
 from app.models.valuation_input import StandardizedValuationInput
 from app.models.flexible_input import FlexibleValuationInput
 from app.models.valuation_output import (
@@ -46,6 +50,10 @@ ValuationInput = FlexibleValuationInput | StandardizedValuationInput
 
 logger = logging.getLogger(__name__)
 
+# response_cache namespace of the GET /{ticker}/valuation endpoint, whose
+# cached body is dropped whenever a valuation is force-recalculated
+VALUATION_RESPONSE_NAMESPACE = "valuation"
+
 
 class FlexibleInputAdapter:
     """
@@ -432,8 +440,16 @@ class ValuationCache:
     Uses diskcache for local file-based caching with 24-hour TTL.
     Cache keys incorporate ticker and extraction timestamp to ensure
     cache invalidation when source data changes.
+
+    Results are also kept in a small in-process LRU in front of the disk
+    cache, so warm hits return the ValuationResult instance itself instead
+    of reading and re-validating it. Callers must treat results as
+    read-only. The disk cache stays authoritative across workers and
+    restarts.
     """
 
+    LOCAL_CACHE_SIZE = 2048  # Max valuations held in process (LRU eviction)
+
     def __init__(self, cache_dir: Optional[Path] = None) -> None:
         """
         Initialize the valuation cache.
@@ -451,6 +467,9 @@ class ValuationCache:
         cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache = Cache(str(cache_dir))
 
+        # Local LRU: cache key -> (expires_at monotonic, result)
+        self._local: "OrderedDict[str, Tuple[float, ValuationResult]]" = OrderedDict()
+
         logger.info(
             "ValuationCache initialized at %s with TTL=%d seconds",
             cache_dir,
@@ -480,8 +499,15 @@ class ValuationCache:
         """
         cache_key = self._get_cache_key(ticker, extraction_timestamp)
 
+        local = self._local.get(cache_key)
+        if local is not None:
+            if time.monotonic() < local[0]:
+                self._local.move_to_end(cache_key)
+                return local[1]
+            del self._local[cache_key]
+
         try:
-            cached_data = self.cache.get(cache_key)
+            cached_data, expire_time = self.cache.get(cache_key, expire_time=True)
 
             if cached_data is None:
                 logger.debug("Valuation cache miss for %s", ticker)
@@ -489,6 +515,9 @@ class ValuationCache:
 
             if isinstance(cached_data, dict):
                 result = ValuationResult.model_validate(cached_data)
+                # Expire the local copy with the disk entry, not a full TTL later
+                ttl = self.ttl if expire_time is None else expire_time - time.time()
+                self._store_local(cache_key, result, ttl)
                 logger.debug(
                     "Valuation cache hit for %s (timestamp: %s)",
                     ticker,
@@ -521,6 +550,7 @@ class ValuationCache:
         try:
             cache_data = data.model_dump(mode="json")
             self.cache.set(cache_key, cache_data, expire=self.ttl)
+            self._store_local(cache_key, data, self.ttl)
             logger.info(
                 "Cached valuation for %s (TTL: %d seconds)",
                 ticker,
@@ -529,11 +559,22 @@ class ValuationCache:
         except Exception as e:
             logger.error("Failed to cache valuation for %s: %s", ticker, e)
 
+    def _store_local(self, cache_key: str, data: ValuationResult, ttl: float) -> None:
+        """Keep a result in the local LRU for ttl seconds."""
+        self._local[cache_key] = (time.monotonic() + ttl, data)
+        self._local.move_to_end(cache_key)
+        if len(self._local) > self.LOCAL_CACHE_SIZE:
+            self._local.popitem(last=False)
+
     def invalidate(self, ticker: str) -> int:
         """Invalidate all cached valuations for a ticker."""
         ticker = ticker.upper().strip()
         deleted_count = 0
 
+        prefix = f"valuation_{ticker}_"
+        for key in [key for key in self._local if key.startswith(prefix)]:
+            del self._local[key]
+
         try:
             for key in list(self.cache):
                 if isinstance(key, str) and key.startswith(f"valuation_{ticker}_"):
@@ -1366,6 +1407,7 @@ class ValuationEngine:
         ticker: str,
         force_refresh: bool = False,
         use_flexible: bool = True,
+        progress: Optional["asyncio.Queue[Dict[str, str]]"] = None,
     ) -> ValuationResult:
         """
         Calculate complete valuation for a stock.
@@ -1375,12 +1417,15 @@ class ValuationEngine:
         2. Gets input data from AI extractor (flexible or standard)
         3. Runs all valuation calculations
         4. Computes composite value and verdict
-        5. Caches and returns result
+        5. Caches and returns result (a forced refresh also drops this
+           process's cached GET response for the ticker)
 
         Args:
             ticker: Stock ticker symbol
             force_refresh: If True, bypass cache and recalculate
             use_flexible: If True, use flexible extraction (default)
+            progress: Optional queue that receives {"stage": ...} events
+                (extraction_started, extraction_done) as the valuation runs
 
         Returns:
             ValuationResult with complete valuation analysis
@@ -1397,6 +1442,9 @@ class ValuationEngine:
             use_flexible,
         )
 
+        if progress is not None:
+            progress.put_nowait({"stage": "extraction_started", "ticker": ticker})
+
         # Get input from AI extractor
         if use_flexible:
             flexible_data = await self.ai_extractor.extract_flexible(
@@ -1411,6 +1459,9 @@ class ValuationEngine:
                 force_refresh=force_refresh,
             )
 
+        if progress is not None:
+            progress.put_nowait({"stage": "extraction_done", "ticker": ticker})
+
         extraction_timestamp = input_data.extraction_timestamp.isoformat()
 
         # Check cache (unless force refresh)
@@ -1486,6 +1537,9 @@ class ValuationEngine:
 
             # Cache the result
             self.cache.set(ticker, result, extraction_timestamp)
+            if force_refresh:
+                # Covers every forced path (valuation and analysis refresh)
+                invalidate_response(VALUATION_RESPONSE_NAMESPACE, ticker=ticker)
 
             logger.info(
                 "Valuation complete for %s: $%.2f intrinsic value, %.1f%% upside, verdict=%s",
@@ -1531,3 +1585,16 @@ def get_valuation_engine() -> ValuationEngine:
             if _engine_instance is None:
                 _engine_instance = ValuationEngine()
     return _engine_instance
+
+
+async def get_valuation_engine_dep() -> ValuationEngine:
+    """
+    Async FastAPI dependency returning the singleton ValuationEngine.
+
+    Endpoints depend on this wrapper so FastAPI resolves it on the event
+    loop instead of dispatching get_valuation_engine() to the threadpool.
+
+    Returns:
+        ValuationEngine: The singleton engine instance.
+    """
+    return get_valuation_engine()
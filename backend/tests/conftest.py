@@ -1,12 +1,111 @@
 """
 Pytest configuration and fixtures for backend tests.
 """
+from datetime import datetime, timezone
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.models.flexible_input import FlexibleValuationInput
+from app.models.valuation_input import HistoricalFinancials, StandardizedValuationInput
+from app.services.valuation_engine import ValuationCache, ValuationEngine
+
 
 @pytest.fixture
 def client():
     """Create a test client for the FastAPI application."""
     from app.main import app
     return TestClient(app)
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests (marked with pytest.mark.anyio) on asyncio."""
+    return "asyncio"
+
+
+def _required_floats(model) -> dict:
+    """A small valid value for every required float field of a model."""
+    return {
+        name: 0.1
+        for name, field in model.model_fields.items()
+        if field.is_required() and field.annotation is float
+    }
+
+
+@pytest.fixture
+def standardized_input():
+    """Minimal valid StandardizedValuationInput."""
+    return StandardizedValuationInput.model_validate({
+        **_required_floats(StandardizedValuationInput),
+        "ticker": "AAPL",
+        "company_name": "Apple Inc.",
+        "sector": "Technology",
+        "industry": "Consumer Electronics",
+        "extraction_timestamp": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "historical_financials": [
+            {**_required_floats(HistoricalFinancials), "fiscal_year": 2025},
+        ],
+    })
+
+
+@pytest.fixture
+def flexible_input():
+    """Minimal extraction result the valuation engine can value."""
+    return FlexibleValuationInput.model_validate({
+        "ticker": "AAPL",
+        "company_name": "Apple Inc.",
+        "extraction_timestamp": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "data_confidence_score": 0.9,
+        "market_position": {
+            "current_price": 100.0,
+            "shares_outstanding": 1e9,
+            "market_cap": 1e11,
+        },
+        "ttm_income_statement": {
+            "revenue": 5e10,
+            "operating_income": 1e10,
+            "net_income": 8e9,
+            "eps": 8.0,
+        },
+        "ttm_cash_flow": {
+            "operating_cash_flow": 1.2e10,
+            "capital_expenditures": -2e9,
+            "free_cash_flow": 1e10,
+        },
+        "balance_sheet": {
+            "total_cash": 2e10,
+            "total_debt": 1e10,
+            "total_equity": 5e10,
+        },
+    })
+
+
+class StubExtractor:
+    """AIExtractor stand-in returning a fixed extraction without Gemini."""
+
+    def __init__(self, data: FlexibleValuationInput) -> None:
+        self.data = data
+        self.calls = []
+
+    async def extract_flexible(self, ticker: str, force_refresh: bool = False):
+        self.calls.append((ticker, force_refresh))
+        return self.data.model_copy(update={"ticker": ticker})
+
+
+@pytest.fixture
+def stub_extractor(flexible_input):
+    """StubExtractor serving flexible_input for any ticker."""
+    return StubExtractor(flexible_input)
+
+
+@pytest.fixture
+def valuation_cache(tmp_path):
+    """ValuationCache backed by a temporary directory."""
+    return ValuationCache(tmp_path / "valuations")
+
+
+@pytest.fixture
+def valuation_engine(valuation_cache, stub_extractor):
+    """ValuationEngine using the temporary cache and the stub extractor."""
+    return ValuationEngine(cache=valuation_cache, ai_extractor=stub_extractor)
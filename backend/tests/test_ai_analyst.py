@@ -0,0 +1,68 @@
+"""
+Tests for how AIAnalyst assembles the analysis prompt inputs.
+"""
+import pytest
+
+from app.config import get_settings
+from app.services import ai_analyst as analyst_module
+from app.services.ai_analyst import AIAnalyst, AnalysisCache
+
+pytestmark = pytest.mark.anyio
+
+
+class CachingStubExtractor:
+    """Extractor stand-in that caches like AIExtractor: forced calls re-extract."""
+
+    def __init__(self, data) -> None:
+        self.data = data
+        self.calls = []
+        self.extractions = 0
+
+    async def extract_flexible(self, ticker: str, force_refresh: bool = False):
+        self.calls.append((ticker, force_refresh))
+        if force_refresh or self.extractions == 0:
+            self.extractions += 1
+            self.data = self.data.model_copy(
+                update={"extraction_timestamp": self.data.extraction_timestamp.replace(
+                    year=2026 + self.extractions,
+                )},
+            )
+        return self.data
+
+
+class PromptBuilt(Exception):
+    """Raised in place of calling Gemini once the prompt inputs are known."""
+
+
+@pytest.fixture
+def analyst(monkeypatch, tmp_path, valuation_engine, flexible_input):
+    """AIAnalyst over the stub-backed engine; stops before calling Gemini."""
+    monkeypatch.setattr(get_settings(), "GOOGLE_API_KEY", "test-key")
+    extractor = CachingStubExtractor(flexible_input)
+    valuation_engine._ai_extractor = extractor
+
+    instance = AIAnalyst(
+        cache=AnalysisCache(tmp_path / "analyses"), valuation_engine=valuation_engine,
+    )
+    monkeypatch.setattr(instance, "_get_business_description", lambda ticker: "")
+
+    def build_analysis_prompt(valuation_result, extraction_data, business_description):
+        raise PromptBuilt(valuation_result, extraction_data)
+
+    monkeypatch.setattr(analyst_module, "build_analysis_prompt", build_analysis_prompt)
+    return instance, extractor
+
+
+async def test_forced_refresh_builds_context_from_the_new_extraction(analyst):
+    instance, extractor = analyst
+    # Warm the extraction cache with a first extraction
+    await extractor.extract_flexible("AAPL")
+
+    with pytest.raises(PromptBuilt) as built:
+        await instance.generate_analysis("AAPL", force_refresh=True)
+
+    _, extraction_data = built.value.args
+    assert extractor.extractions == 2
+    assert extraction_data.extraction_timestamp == extractor.data.extraction_timestamp
+    # Only the valuation forces an extraction; the context reads the cache
+    assert extractor.calls[1:] == [("AAPL", True), ("AAPL", False)]
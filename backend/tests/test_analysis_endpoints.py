@@ -0,0 +1,121 @@
+"""
+Tests for the analysis endpoints' cached responses and error details.
+"""
+import orjson
+import pytest
+
+from app.api.v1.endpoints import analysis
+from app.core.limits import limiter
+from app.models.analysis import WarrenBuffettAnalysis
+from app.services.ai_analyst import AnalysisError, get_ai_analyst
+
+TEXT = "Durable franchise with consistent owner earnings and a conservative balance sheet. " * 3
+
+
+@pytest.fixture
+def sample_analysis():
+    """Valid analysis memo with its optional tokens_consumed left unset."""
+    return WarrenBuffettAnalysis.model_validate({
+        "ticker": "AAPL",
+        "company_name": "Apple Inc.",
+        "analysis_date": "2026-01-01T00:00:00",
+        "one_sentence_thesis": TEXT,
+        "investment_thesis": TEXT * 3,
+        "business_understanding": TEXT,
+        "business_simplicity_score": 7,
+        "competitive_advantages": [
+            {"moat_type": "brand", "description": TEXT, "durability": "wide",
+             "evidence": [TEXT] * 3, "confidence": 0.8},
+        ] * 3,
+        "moat_summary": TEXT,
+        "moat_durability": "wide",
+        "management_assessment": TEXT,
+        "management_integrity_score": 8,
+        "capital_allocation_skill": TEXT,
+        "owner_oriented": True,
+        "owner_earnings_analysis": TEXT,
+        "earnings_predictability": "predictable",
+        "balance_sheet_fortress": TEXT,
+        "debt_comfort_level": TEXT,
+        "cash_generation_power": TEXT,
+        "return_on_capital_trend": TEXT,
+        "valuation_narrative": TEXT,
+        "intrinsic_value_range": "$150 to $190",
+        "current_price_vs_value": TEXT,
+        "margin_of_safety_assessment": TEXT,
+        "key_positives": [TEXT] * 4,
+        "key_concerns": [TEXT] * 3,
+        "key_risks": [
+            {"category": "market", "title": "Competition", "description": TEXT,
+             "severity": "high", "probability": "likely", "mitigation": TEXT},
+        ] * 3,
+        "potential_catalysts": [TEXT] * 3,
+        "ideal_holding_period": "5-10 years",
+        "patience_required_level": TEXT,
+        "investment_rating": "buy",
+        "conviction_level": 0.7,
+        "risk_level": "moderate",
+        "suitable_for": ["value_investors"],
+        "buffett_quote": TEXT,
+        "final_thoughts": TEXT,
+        "ai_model_used": "gemini",
+        "generation_time_seconds": 1.2,
+    })
+
+
+class StubAnalyst:
+    """AIAnalyst stand-in serving one cached analysis or failing generation."""
+
+    def __init__(self, cached: WarrenBuffettAnalysis = None, error: Exception = None) -> None:
+        self.cached = cached
+        self.error = error
+
+    async def get_cached_analysis_json_with_age(self, ticker: str):
+        if self.cached is None:
+            return None
+        return orjson.dumps(self.cached.model_dump(mode="json")), 0.0
+
+    def get_latest_cached_analysis_json(self, ticker: str):
+        return None
+
+    async def generate_analysis(self, ticker: str, force_refresh: bool = False):
+        raise self.error
+
+
+@pytest.fixture
+def analysis_client(client, monkeypatch):
+    """App client with the analyst dependency overridden per test."""
+    monkeypatch.setattr(analysis, "get_available_tickers_set", lambda: frozenset({"AAPL"}))
+    limiter.reset()
+    yield client
+    client.app.dependency_overrides.clear()
+    limiter.reset()
+
+
+def test_cached_endpoint_omits_unset_optional_fields(analysis_client, sample_analysis):
+    analyst = StubAnalyst(cached=sample_analysis)
+    analysis_client.app.dependency_overrides[get_ai_analyst] = lambda: analyst
+
+    cached = analysis_client.get("/api/v1/stocks/AAPL/analysis/cached")
+    full = analysis_client.get("/api/v1/stocks/AAPL/analysis")
+
+    assert cached.status_code == full.status_code == 200
+    assert "tokens_consumed" not in cached.json()
+    assert cached.json()["generation_time_seconds"] == 1.2
+    assert full.json()["tokens_consumed"] is None
+
+    etag = cached.headers["etag"]
+    revalidated = analysis_client.get(
+        "/api/v1/stocks/AAPL/analysis/cached", headers={"If-None-Match": etag}
+    )
+    assert revalidated.status_code == 304
+
+
+def test_refresh_failure_reports_refresh_detail(analysis_client):
+    analyst = StubAnalyst(error=AnalysisError("model overloaded"))
+    analysis_client.app.dependency_overrides[get_ai_analyst] = lambda: analyst
+
+    response = analysis_client.post("/api/v1/stocks/AAPL/analysis/refresh")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Analysis refresh failed: model overloaded"}
@@ -0,0 +1,201 @@
+"""
+Tests for the batch endpoints and their per-item statuses.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.api.v1.endpoints import realtime, valuation
+from app.core.limits import limiter
+from app.services.ai_extractor import DataNotFoundError, GeminiAPIError
+from app.services.batch_refresher import get_batch_refresher_dep
+from app.services.realtime_service import DataFetchError, TickerNotFoundError
+
+
+class StubRefresher:
+    """BatchRefresher stand-in with a fixed outcome per ticker."""
+
+    def __init__(self, outcomes: dict) -> None:
+        self.outcomes = outcomes
+        self.calls = []
+
+    async def refresh_ticker(self, ticker: str):
+        self.calls.append(ticker)
+        outcome = self.outcomes[ticker]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def extraction_client(client):
+    """App client with the batch refresher dependency overridden per test."""
+    yield client
+    client.app.dependency_overrides.clear()
+
+
+def test_batch_extraction_reports_status_per_operation(extraction_client, standardized_input):
+    refresher = StubRefresher({
+        "AAPL": standardized_input,
+        "NOPE": DataNotFoundError("missing"),
+        "BUSY": GeminiAPIError("quota"),
+        "BOOM": RuntimeError("bug"),
+    })
+    extraction_client.app.dependency_overrides[get_batch_refresher_dep] = lambda: refresher
+
+    response = extraction_client.post(
+        "/api/v1/stocks/extraction/batch",
+        json={"operations": [
+            {"ticker": "aapl"},
+            {"ticker": "NOPE"},
+            {"ticker": "BUSY"},
+            {"ticker": "BOOM"},
+        ]},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(r["ticker"], r["status"]) for r in results] == [
+        ("AAPL", 200),
+        ("NOPE", 404),
+        ("BUSY", 503),
+        ("BOOM", 500),
+    ]
+    assert results[0]["data"]["ticker"] == "AAPL"
+    assert results[0]["error"] is None
+    assert results[1]["data"] is None
+    assert results[1]["error"] == "Stock data file not found for NOPE"
+    assert refresher.calls == ["AAPL", "NOPE", "BUSY", "BOOM"]
+
+
+@pytest.mark.parametrize(
+    "operations",
+    [
+        [],
+        [{"ticker": "IGNORE ALL"}],
+        [{"ticker": "$AAPL"}],
+        [{"ticker": "AAPL"}] * 51,
+    ],
+)
+def test_batch_extraction_rejects_invalid_bodies(extraction_client, operations):
+    refresher = StubRefresher({})
+    extraction_client.app.dependency_overrides[get_batch_refresher_dep] = lambda: refresher
+
+    response = extraction_client.post(
+        "/api/v1/stocks/extraction/batch",
+        json={"operations": operations},
+    )
+
+    assert response.status_code == 422
+    assert refresher.calls == []
+
+
+def _price(ticker: str) -> dict:
+    """Realtime price payload as returned by get_realtime_price."""
+    return {
+        "ticker": ticker,
+        "price": 100.0,
+        "change": 1.0,
+        "change_percent": 1.0,
+        "volume": 1000,
+        "high": 101.0,
+        "low": 99.0,
+        "open": 99.5,
+        "previous_close": 99.0,
+        "timestamp": "2026-01-07T15:30:00+00:00",
+        "market_state": "REGULAR",
+    }
+
+
+@pytest.fixture
+def price_fetches(monkeypatch):
+    """Stub get_realtime_price; returns the list of fetched tickers."""
+    fetched = []
+    failures = {
+        "NOPE": TickerNotFoundError("Ticker 'NOPE' not found"),
+        "DOWN": DataFetchError("upstream timeout"),
+        "BOOM": RuntimeError("bug"),
+    }
+
+    async def get_realtime_price(ticker: str) -> dict:
+        fetched.append(ticker)
+        if ticker in failures:
+            raise failures[ticker]
+        return _price(ticker)
+
+    monkeypatch.setattr(realtime, "get_realtime_price", get_realtime_price)
+    return fetched
+
+
+def test_batch_prices_report_status_per_ticker(client, price_fetches):
+    response = client.post(
+        "/api/v1/stocks/prices/batch",
+        json={"tickers": ["aapl", "NOPE", "DOWN", "BOOM", " AAPL "]},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(r["ticker"], r["status"]) for r in results] == [
+        ("AAPL", 200),
+        ("NOPE", 404),
+        ("DOWN", 500),
+        ("BOOM", 500),
+        ("AAPL", 200),
+    ]
+    assert results[0]["data"]["price"] == 100.0
+    assert results[1]["error"] == "Ticker 'NOPE' not found"
+    assert results[3]["error"] == "An unexpected error occurred while fetching price data"
+    # Duplicates are fetched once
+    assert sorted(price_fetches) == ["AAPL", "BOOM", "DOWN", "NOPE"]
+
+
+@pytest.mark.parametrize(
+    "tickers",
+    [[], ["AAPL", "rm -rf /"], ["../etc"], ["A" * 11], ["AAPL"] * 51],
+)
+def test_batch_prices_reject_invalid_tickers(client, price_fetches, tickers):
+    response = client.post("/api/v1/stocks/prices/batch", json={"tickers": tickers})
+
+    assert response.status_code == 422
+    assert price_fetches == []
+
+
+@pytest.fixture
+def queued_refreshes(monkeypatch):
+    """Record background valuation refreshes instead of running them."""
+    # The bulk refresh route is rate limited; start with a full bucket
+    limiter.reset()
+    queued = []
+    monkeypatch.setattr(
+        valuation,
+        "_refresh_in_background",
+        lambda engine, ticker: queued.append(ticker),
+    )
+    monkeypatch.setattr(
+        valuation,
+        "get_available_tickers_set",
+        lambda: frozenset({"AAPL", "MSFT", "BRK-B"}),
+    )
+    return queued
+
+
+def test_bulk_refresh_queues_known_tickers_once(client, queued_refreshes):
+    response = client.post(
+        "/api/v1/stocks/valuation/bulk-refresh",
+        json={"tickers": ["aapl", "MSFT", "AAPL", "ZZZZ", " brk-b "]},
+    )
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["tickers"] == ["AAPL", "MSFT", "BRK-B"]
+    assert body["not_found"] == ["ZZZZ"]
+    assert "requested_at" in body
+    assert queued_refreshes == ["AAPL", "MSFT", "BRK-B"]
+
+
+@pytest.mark.parametrize("tickers", [[], ["AAPL", "not a ticker"], ["AAPL"] * 101])
+def test_bulk_refresh_rejects_invalid_bodies(client, queued_refreshes, tickers):
+    response = client.post("/api/v1/stocks/valuation/bulk-refresh", json={"tickers": tickers})
+
+    assert response.status_code == 422
+    assert queued_refreshes == []
@@ -0,0 +1,52 @@
+"""
+Tests for BatchRefresher's per-ticker coalescing of forced extractions.
+"""
+import asyncio
+
+import pytest
+
+from app.services.batch_refresher import BatchRefresher
+
+pytestmark = pytest.mark.anyio
+
+
+class SlowExtractor:
+    """Extractor stand-in whose extractions block until released."""
+
+    def __init__(self, data) -> None:
+        self.data = data
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def extract_valuation_input(self, ticker: str, force_refresh: bool = False):
+        self.calls.append((ticker, force_refresh))
+        await self.release.wait()
+        return self.data.model_copy(update={"ticker": ticker})
+
+
+async def test_concurrent_refreshes_of_a_ticker_share_one_extraction(standardized_input):
+    extractor = SlowExtractor(standardized_input)
+    refresher = BatchRefresher(extractor)
+
+    pending = asyncio.gather(
+        refresher.refresh_ticker("aapl"),
+        refresher.refresh_ticker("AAPL"),
+        refresher.refresh_ticker("MSFT"),
+    )
+    await asyncio.sleep(0)
+    extractor.release.set()
+    results = await pending
+
+    assert [result.ticker for result in results] == ["AAPL", "AAPL", "MSFT"]
+    assert sorted(extractor.calls) == [("AAPL", True), ("MSFT", True)]
+
+
+async def test_later_refresh_starts_a_new_extraction(standardized_input):
+    extractor = SlowExtractor(standardized_input)
+    extractor.release.set()
+    refresher = BatchRefresher(extractor)
+
+    await refresher.refresh_ticker("AAPL")
+    await refresher.refresh_ticker("AAPL")
+
+    assert extractor.calls == [("AAPL", True), ("AAPL", True)]
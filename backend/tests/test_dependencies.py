@@ -0,0 +1,23 @@
+"""
+Tests for the shared ticker validation.
+"""
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from app.dependencies import TickerItem, validate_ticker_format
+
+ticker_item = TypeAdapter(TickerItem)
+
+
+@pytest.mark.parametrize("ticker", ["AAPL", "brk-b", "BF.B", "7203.T", "0700.HK", "3690"])
+def test_valid_tickers_are_accepted_and_upper_cased(ticker):
+    assert validate_ticker_format(f" {ticker} ") == ticker.upper()
+    assert ticker_item.validate_python(ticker) == ticker.upper()
+
+
+@pytest.mark.parametrize("ticker", [".AAPL", "-X", "AA PL", "AAPL$", "ABCDEFGHIJK"])
+def test_malformed_tickers_are_rejected(ticker):
+    with pytest.raises(ValueError):
+        validate_ticker_format(ticker)
+    with pytest.raises(ValidationError):
+        ticker_item.validate_python(ticker)
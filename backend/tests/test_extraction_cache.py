@@ -0,0 +1,102 @@
+"""
+Tests for the ExtractionCache disk cache and its backend selection.
+"""
+import sys
+import types
+
+import pytest
+from diskcache import Cache
+
+from app.core import cache_manager
+from app.core.cache_manager import ExtractionCache
+
+COLLECTED_AT = "2026-01-07T10:30:00"
+
+
+@pytest.fixture
+def extraction_cache(tmp_path):
+    """ExtractionCache on diskcache in a temporary directory."""
+    cache = ExtractionCache(cache_dir=tmp_path / "extractions")
+    yield cache
+    cache.close()
+
+
+class IncompleteRustCache:
+    """diskcache_rs stand-in from a release without transact()."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def get(self, key, default=None):
+        return default
+
+    def set(self, key, value, expire=None):
+        return True
+
+    def delete(self, key):
+        return False
+
+    def pop(self, key, default=None):
+        return default
+
+    def volume(self):
+        return 0
+
+    def clear(self):
+        return 0
+
+    def close(self):
+        pass
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+
+def test_rust_cache_without_full_api_falls_back_to_diskcache(monkeypatch, tmp_path):
+    monkeypatch.setitem(
+        sys.modules, "diskcache_rs", types.SimpleNamespace(Cache=IncompleteRustCache)
+    )
+
+    cache = cache_manager._open_cache(tmp_path / "extractions", use_rust=True)
+
+    assert isinstance(cache, Cache)
+    assert cache.directory == str(tmp_path / "extractions")
+    cache.close()
+
+
+def test_rust_cache_with_full_api_is_used(monkeypatch, tmp_path):
+    class RustCache(IncompleteRustCache):
+        def transact(self):
+            raise NotImplementedError
+
+    monkeypatch.setitem(sys.modules, "diskcache_rs", types.SimpleNamespace(Cache=RustCache))
+
+    cache = cache_manager._open_cache(tmp_path / "extractions", use_rust=True)
+
+    assert isinstance(cache, RustCache)
+    assert cache.directory == str(tmp_path / "extractions-rs")
+
+
+def test_invalidate_all_also_hides_legacy_keys(extraction_cache, standardized_input):
+    # An entry from before the BLAKE2b keys, next to an indexed one
+    legacy_key = extraction_cache._legacy_cache_key("AAPL", COLLECTED_AT)
+    extraction_cache.cache.set(legacy_key, standardized_input.model_dump(mode="json"))
+    extraction_cache.set("AAPL", standardized_input, "2026-02-01T00:00:00")
+    assert extraction_cache.get("AAPL", COLLECTED_AT) is not None
+
+    extraction_cache.invalidate_all("AAPL")
+
+    assert extraction_cache.get("AAPL", COLLECTED_AT) is None
+    assert extraction_cache.get("AAPL", "2026-02-01T00:00:00") is None
+
+
+def test_entries_written_after_invalidate_all_are_served(extraction_cache, standardized_input):
+    extraction_cache.set("AAPL", standardized_input, COLLECTED_AT)
+    extraction_cache.invalidate_all("AAPL")
+
+    extraction_cache.set("AAPL", standardized_input, COLLECTED_AT)
+
+    assert extraction_cache.get("AAPL", COLLECTED_AT) == standardized_input
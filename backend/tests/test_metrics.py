@@ -0,0 +1,27 @@
+"""
+Tests for the in-process metrics counters.
+"""
+import threading
+
+from app.core.metrics import Counter, render_prometheus
+
+
+def test_concurrent_increments_are_not_lost():
+    counter = Counter("test_total", "Test counter")
+    threads = [
+        threading.Thread(target=lambda: [counter.inc("x") for _ in range(10_000)])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.values() == {"x": 80_000}
+
+
+def test_render_prometheus_lists_counter_samples():
+    text = render_prometheus()
+
+    assert "# TYPE cache_hit_total counter" in text
+    assert text.endswith("\n")
@@ -0,0 +1,161 @@
+"""
+Tests for the token bucket rate limiter and RateLimitMiddleware.
+"""
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import limits
+from app.core.limits import RateLimitMiddleware, RateLimitRule, TokenBucketLimiter
+from app.core.response_cache import cached_response, get_response_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_buckets():
+    """Start every test with full buckets in the shared limiter."""
+    limits.limiter.reset()
+    yield
+    limits.limiter.reset()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the limiter."""
+    now = [1000.0]
+    monkeypatch.setattr(limits.time, "monotonic", lambda: now[0])
+    return now
+
+
+def build_app() -> FastAPI:
+    """App limiting GET /limited/{id} to 2 requests per minute."""
+    app = FastAPI()
+
+    @app.get("/limited/{item_id}")
+    async def limited(item_id: str):
+        return {"id": item_id}
+
+    @app.post("/limited/{item_id}")
+    async def limited_post(item_id: str):
+        return {"id": item_id}
+
+    @app.get("/open")
+    async def open_route():
+        return {"ok": True}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules=[
+            RateLimitRule("GET", re.compile(r"^/limited/[^/]+$"), "limited",
+                          replenish_rate=2 / 60, bucket_capacity=2),
+        ],
+    )
+    return app
+
+
+def build_cached_app() -> FastAPI:
+    """App with a cached GET /cached/{id}, charged 2 per minute on misses."""
+    app = FastAPI()
+
+    @app.get("/cached/{item_id}")
+    @cached_response(expire=60, namespace="test_cached")
+    async def cached(item_id: str):
+        return {"id": item_id}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules=[
+            RateLimitRule("GET", re.compile(r"^/cached/[^/]+$"), "cached",
+                          replenish_rate=2 / 60, bucket_capacity=2, charge_on_miss=True),
+        ],
+    )
+    return app
+
+
+def as_client(app, host: str):
+    """Wrap an ASGI app so every request comes from the given client host."""
+    async def asgi(scope, receive, send):
+        if scope["type"] == "http":
+            scope = dict(scope, client=(host, 50000))
+        await app(scope, receive, send)
+
+    return asgi
+
+
+def test_requests_over_capacity_get_429_with_retry_after(clock):
+    client = TestClient(build_app())
+
+    assert client.get("/limited/a").status_code == 200
+    assert client.get("/limited/b").status_code == 200
+
+    response = client.get("/limited/c")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "30"
+    assert response.json() == {"detail": "Rate limit exceeded: 2 per 60 seconds"}
+
+
+def test_bucket_refills_over_time(clock):
+    client = TestClient(build_app())
+    client.get("/limited/a")
+    client.get("/limited/a")
+    assert client.get("/limited/a").status_code == 429
+
+    clock[0] += 30
+    assert client.get("/limited/a").status_code == 200
+    assert client.get("/limited/a").status_code == 429
+
+
+def test_unmatched_requests_are_not_limited(clock):
+    client = TestClient(build_app())
+    for _ in range(5):
+        assert client.get("/open").status_code == 200
+        assert client.post("/limited/a").status_code == 200
+    assert client.get("/limited/a").status_code == 200
+
+
+def test_clients_have_separate_buckets(clock):
+    app = build_app()
+    first = TestClient(as_client(app, "10.0.0.1"))
+    second = TestClient(as_client(app, "10.0.0.2"))
+
+    first.get("/limited/a")
+    first.get("/limited/a")
+    assert first.get("/limited/a").status_code == 429
+    assert second.get("/limited/a").status_code == 200
+
+
+def test_charge_on_miss_rules_only_limit_cache_misses(clock):
+    get_response_cache().clear()
+    client = TestClient(build_cached_app())
+
+    assert client.get("/cached/a").status_code == 200
+    for _ in range(5):
+        assert client.get("/cached/a").status_code == 200
+    assert client.get("/cached/b").status_code == 200
+
+    response = client.get("/cached/c")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "30"
+    assert response.json() == {"detail": "Rate limit exceeded: 2 per 60 seconds"}
+    get_response_cache().clear()
+
+
+@pytest.mark.anyio
+async def test_token_bucket_prunes_idle_buckets(clock):
+    bucket = TokenBucketLimiter(max_keys=2, idle_seconds=60)
+    await bucket.acquire("a", 1.0, 1)
+    await bucket.acquire("b", 1.0, 1)
+
+    clock[0] += 60
+    await bucket.acquire("c", 1.0, 1)
+    assert set(bucket._buckets) == {"c"}
+
+
+@pytest.mark.anyio
+async def test_redis_limiter_fails_open():
+    pytest.importorskip("redis")
+    # Nothing listens on port 1, so every check fails
+    bucket = limits.RedisTokenBucketLimiter("redis://127.0.0.1:1/0")
+
+    assert await bucket.acquire("a", 1.0, 1) is None
@@ -0,0 +1,182 @@
+"""
+Tests for the in-process response cache (cached_response).
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import response_cache
+from app.core.response_cache import cached_response, get_response_cache, invalidate_response
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and end every test with an empty shared cache."""
+    get_response_cache().clear()
+    yield
+    get_response_cache().clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def calls():
+    """Handler invocations, by ticker."""
+    return []
+
+
+@pytest.fixture
+def cache_client(calls):
+    """App with one cached endpoint keyed on the ticker only."""
+    app = FastAPI()
+
+    @app.get("/items/{ticker}")
+    @cached_response(
+        expire=60,
+        namespace="items",
+        key_args=lambda kwargs: {"ticker": kwargs["ticker"].upper()},
+    )
+    async def get_item(ticker: str, verbose: bool = False):
+        calls.append(ticker)
+        return {"ticker": ticker.upper(), "n": len(calls), "pad": "x" * 1000}
+
+    return TestClient(app)
+
+
+def test_repeat_request_is_served_from_cache(cache_client, calls):
+    first = cache_client.get("/items/AAPL")
+    second = cache_client.get("/items/AAPL")
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert calls == ["AAPL"]
+
+
+def test_key_uses_only_selected_arguments(cache_client, calls):
+    cache_client.get("/items/AAPL")
+    # Same key after normalization; verbose is not part of the key
+    cache_client.get("/items/aapl", params={"verbose": True})
+    cache_client.get("/items/MSFT")
+
+    assert calls == ["AAPL", "MSFT"]
+
+
+def test_entry_expires_after_ttl(cache_client, calls, clock):
+    cache_client.get("/items/AAPL")
+    clock[0] += 59
+    cache_client.get("/items/AAPL")
+    assert len(calls) == 1
+
+    clock[0] += 1
+    assert cache_client.get("/items/AAPL").json()["n"] == 2
+
+
+def test_invalidate_response_drops_one_entry(cache_client, calls):
+    cache_client.get("/items/AAPL")
+    cache_client.get("/items/MSFT")
+
+    assert invalidate_response("items", ticker="AAPL") is True
+    assert invalidate_response("items", ticker="AAPL") is False
+
+    cache_client.get("/items/AAPL")
+    cache_client.get("/items/MSFT")
+    assert calls == ["AAPL", "MSFT", "AAPL"]
+
+
+def test_cached_body_is_sent_compressed(cache_client):
+    response = cache_client.get("/items/AAPL", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()["ticker"] == "AAPL"
+
+
+def test_errors_are_not_cached():
+    app = FastAPI()
+    attempts = []
+
+    @app.get("/flaky")
+    @cached_response(expire=60, namespace="flaky")
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ValueError("first call fails")
+        return {"ok": True}
+
+    client = TestClient(app, raise_server_exceptions=False)
+    assert client.get("/flaky").status_code == 500
+    assert client.get("/flaky").json() == {"ok": True}
+    assert len(attempts) == 2
+
+
+def test_lru_eviction_bounds_entries():
+    cache = response_cache.ResponseCache(max_entries=2)
+    cache.set("ns:a", b"1", 60)
+    cache.set("ns:b", b"2", 60)
+    cache.get("ns:a")
+    cache.set("ns:c", b"3", 60)
+
+    assert cache.get("ns:b") is None
+    assert cache.get("ns:a") is not None
+    assert cache.get("ns:c") is not None
+
+
+def test_namespaces_are_bounded_separately():
+    cache = response_cache.ResponseCache(max_entries=2)
+    cache.set("hot:a", b"1", 60)
+    for query in range(10):
+        cache.set(f"search:{query}", b"2", 60, max_entries=3)
+
+    assert cache.get("hot:a") is not None
+    kept = [query for query in range(10) if cache.get(f"search:{query}") is not None]
+    assert kept == [7, 8, 9]
+
+
+def test_etag_is_stable_and_304_on_match(cache_client):
+    first = cache_client.get("/items/AAPL")
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert cache_client.get("/items/AAPL").headers["etag"] == etag
+
+    not_modified = cache_client.get("/items/AAPL", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+
+def test_stale_etag_gets_full_body(cache_client):
+    response = cache_client.get("/items/AAPL", headers={"If-None-Match": 'W/"stale"'})
+
+    assert response.status_code == 200
+    assert response.json()["ticker"] == "AAPL"
+
+
+def test_etag_changes_when_entry_is_rebuilt(cache_client):
+    etag = cache_client.get("/items/AAPL").headers["etag"]
+    invalidate_response("items", ticker="AAPL")
+
+    response = cache_client.get("/items/AAPL", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("", False),
+        ("*", True),
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('"x", W/"abc"', True),
+        ('"abcd"', False),
+    ],
+)
+def test_etag_matches_uses_weak_comparison(header, expected):
+    assert response_cache.etag_matches(header, 'W/"abc"') is expected
@@ -0,0 +1,107 @@
+"""
+Tests for request coalescing with SingleFlight.
+"""
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_calls_share_one_execution():
+    flight: SingleFlight[int] = SingleFlight("test")
+    calls = 0
+    release = asyncio.Event()
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    waiters = [asyncio.ensure_future(flight.do("AAPL", work)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert flight.in_flight("AAPL")
+
+    release.set()
+    assert await asyncio.gather(*waiters) == [42] * 5
+    assert calls == 1
+    assert not flight.in_flight("AAPL")
+
+
+async def test_different_keys_run_separately():
+    flight: SingleFlight[str] = SingleFlight("test")
+
+    async def work(key: str) -> str:
+        await asyncio.sleep(0)
+        return key
+
+    results = await asyncio.gather(
+        flight.do(("AAPL", False), lambda: work("a")),
+        flight.do(("AAPL", True), lambda: work("b")),
+    )
+    assert results == ["a", "b"]
+
+
+async def test_exception_is_raised_in_every_caller_and_not_cached():
+    flight: SingleFlight[int] = SingleFlight("test")
+    calls = 0
+
+    async def failing() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    outcomes = await asyncio.gather(
+        flight.do("k", failing),
+        flight.do("k", failing),
+        return_exceptions=True,
+    )
+    assert all(isinstance(o, ValueError) for o in outcomes)
+    assert calls == 1
+
+    # The failed task is forgotten, so the next call runs the work again
+    with pytest.raises(ValueError):
+        await flight.do("k", failing)
+    assert calls == 2
+
+
+async def test_cancelled_caller_does_not_cancel_shared_work():
+    flight: SingleFlight[int] = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def work() -> int:
+        await release.wait()
+        return 7
+
+    first = asyncio.ensure_future(flight.do("k", work))
+    second = asyncio.ensure_future(flight.do("k", work))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    assert first.cancelled()
+    assert flight.in_flight("k")
+
+    release.set()
+    assert await second == 7
+
+
+async def test_start_returns_running_task_for_background_work():
+    flight: SingleFlight[int] = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def work() -> int:
+        await release.wait()
+        return 1
+
+    task = flight.start("k", work)
+    assert flight.start("k", work) is task
+
+    release.set()
+    assert await task == 1
+    await asyncio.sleep(0)
+    assert not flight.in_flight("k")
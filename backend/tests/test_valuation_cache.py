@@ -0,0 +1,107 @@
+"""
+Tests for ValuationCache's disk cache and in-process LRU.
+"""
+import pytest
+
+from app.services import valuation_engine as engine_module
+from app.services.valuation_engine import ValuationCache
+
+pytestmark = pytest.mark.anyio
+
+TIMESTAMP = "2026-01-01T00:00:00+00:00"
+
+
+@pytest.fixture
+async def result(valuation_engine, valuation_cache):
+    """A real ValuationResult, with the cache emptied again."""
+    valuation = await valuation_engine.calculate_valuation("AAPL")
+    valuation_cache.invalidate("AAPL")
+    return valuation
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the engine module."""
+    now = [1000.0]
+    monkeypatch.setattr(engine_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def count_disk_reads(cache: ValuationCache):
+    """Wrap cache.cache.get and return the list its calls are recorded in."""
+    reads = []
+    disk_get = cache.cache.get
+
+    def get(*args, **kwargs):
+        reads.append(args[0])
+        return disk_get(*args, **kwargs)
+
+    cache.cache.get = get
+    return reads
+
+
+async def test_set_then_get_returns_the_same_instance(valuation_cache, result):
+    valuation_cache.set("AAPL", result, TIMESTAMP)
+
+    assert valuation_cache.get("AAPL", TIMESTAMP) is result
+    assert valuation_cache.get("AAPL", "2026-02-01T00:00:00+00:00") is None
+
+
+async def test_disk_hit_is_shared_with_another_instance(valuation_cache, result, tmp_path):
+    valuation_cache.set("AAPL", result, TIMESTAMP)
+    other_worker = ValuationCache(tmp_path / "valuations")
+
+    cached = other_worker.get("AAPL", TIMESTAMP)
+    assert cached is not None and cached is not result
+    assert cached.model_dump() == result.model_dump()
+
+
+async def test_local_copy_expires_with_the_disk_entry(valuation_cache, result, clock):
+    key = valuation_cache._get_cache_key("AAPL", TIMESTAMP)
+    valuation_cache.cache.set(key, result.model_dump(mode="json"), expire=5)
+    reads = count_disk_reads(valuation_cache)
+
+    assert valuation_cache.get("AAPL", TIMESTAMP) is not None
+    assert len(reads) == 1
+
+    # Within the disk entry's remaining TTL the local copy is served
+    clock[0] += 4
+    valuation_cache.get("AAPL", TIMESTAMP)
+    assert len(reads) == 1
+
+    # Past it, the local copy is dropped instead of living a full TTL
+    clock[0] += 2
+    valuation_cache.get("AAPL", TIMESTAMP)
+    assert len(reads) == 2
+
+
+async def test_local_copy_lives_for_the_ttl_after_set(valuation_cache, result, clock):
+    valuation_cache.set("AAPL", result, TIMESTAMP)
+    reads = count_disk_reads(valuation_cache)
+
+    clock[0] += valuation_cache.ttl - 1
+    assert valuation_cache.get("AAPL", TIMESTAMP) is result
+    assert reads == []
+
+    clock[0] += 1
+    valuation_cache.get("AAPL", TIMESTAMP)
+    assert len(reads) == 1
+
+
+async def test_invalidate_drops_local_and_disk_entries(valuation_cache, result):
+    valuation_cache.set("AAPL", result, TIMESTAMP)
+    valuation_cache.set("MSFT", result, TIMESTAMP)
+
+    assert valuation_cache.invalidate("AAPL") == 1
+    assert valuation_cache.get("AAPL", TIMESTAMP) is None
+    assert valuation_cache.get("MSFT", TIMESTAMP) is result
+
+
+async def test_local_lru_is_bounded(valuation_cache, result, monkeypatch):
+    monkeypatch.setattr(ValuationCache, "LOCAL_CACHE_SIZE", 2)
+    for ticker in ("A", "B", "C"):
+        valuation_cache.set(ticker, result, TIMESTAMP)
+
+    assert len(valuation_cache._local) == 2
+    # Evicted locally, still served from disk
+    assert valuation_cache.get("A", TIMESTAMP) is not None
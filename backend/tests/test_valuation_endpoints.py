@@ -0,0 +1,83 @@
+"""
+Tests for the valuation endpoints and their cached GET responses.
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.core.limits import limiter
+from app.core.response_cache import get_response_cache
+from app.services.valuation_engine import get_valuation_engine_dep
+
+URL = "/api/v1/stocks/AAPL/valuation"
+
+
+@pytest.fixture
+def valuation_client(client, valuation_engine):
+    """App client whose valuation endpoints use the stub-backed engine."""
+    app = client.app
+    app.dependency_overrides[get_valuation_engine_dep] = lambda: valuation_engine
+    limiter.reset()
+    get_response_cache().clear()
+    yield client
+    app.dependency_overrides.clear()
+    limiter.reset()
+    get_response_cache().clear()
+
+
+def test_get_is_served_from_the_response_cache(valuation_client, stub_extractor):
+    first = valuation_client.get(URL)
+    second = valuation_client.get(URL)
+
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content
+    assert first.json()["ticker"] == "AAPL"
+    assert len(stub_extractor.calls) == 1
+
+
+def test_get_revalidates_with_etag(valuation_client):
+    first = valuation_client.get(URL)
+    assert first.headers["cache-control"] == "no-cache"
+
+    response = valuation_client.get(URL, headers={"If-None-Match": first.headers["etag"]})
+    assert response.status_code == 304
+
+
+def test_cached_hits_and_304s_cost_no_rate_limit_quota(valuation_client):
+    etag = valuation_client.get(URL).headers["etag"]
+
+    # The valuation rule allows 10 per minute; only the first request missed
+    for _ in range(15):
+        assert valuation_client.get(URL).status_code == 200
+        assert valuation_client.get(URL, headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_forced_recalculation_drops_cached_response(valuation_client, valuation_engine):
+    before = valuation_client.get(URL).json()
+
+    # E.g. an analysis refresh, which calls the engine directly
+    refreshed = asyncio.run(valuation_engine.calculate_valuation("AAPL", force_refresh=True))
+
+    after = valuation_client.get(URL).json()
+    assert after["calculation_timestamp"] != before["calculation_timestamp"]
+    assert datetime.fromisoformat(after["calculation_timestamp"]) == refreshed.calculation_timestamp
+
+
+def test_refresh_endpoint_returns_and_serves_new_valuation(valuation_client, stub_extractor):
+    before = valuation_client.get(URL).json()
+
+    refreshed = valuation_client.post(f"{URL}/refresh")
+    assert refreshed.status_code == 200
+    assert stub_extractor.calls[-1] == ("AAPL", True)
+
+    after = valuation_client.get(URL).json()
+    assert after == refreshed.json()
+    assert after["calculation_timestamp"] != before["calculation_timestamp"]
+
+
+def test_invalid_ticker_is_rejected_without_calculation(valuation_client, stub_extractor):
+    response = valuation_client.get("/api/v1/stocks/$$$/valuation")
+
+    assert response.status_code == 422
+    assert stub_extractor.calls == []